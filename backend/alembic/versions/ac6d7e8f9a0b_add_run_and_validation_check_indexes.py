@@ -0,0 +1,37 @@
+"""add composite indexes for run history and validation check counts
+
+Revision ID: ac6d7e8f9a0b
+Revises: 9b5c6d7e8f9a
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "ac6d7e8f9a0b"
+down_revision = "9b5c6d7e8f9a"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Index runs by (application_id, started_at DESC) and checks by (document_id, status)."""
+    # CONCURRENTLY avoids locking writes on large tables but cannot run inside
+    # a transaction.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_runs_application_started "
+            "ON runs (application_id, started_at DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_validation_checks_document_status "
+            "ON validation_checks (document_id, status) INCLUDE (id)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the composite indexes."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_validation_checks_document_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_runs_application_started")
@@ -0,0 +1,30 @@
+"""let several runs point artefact rows at one content-addressed blob
+
+Revision ID: bd8e9f0a1b2c
+Revises: ac6d7e8f9a0b
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "bd8e9f0a1b2c"
+down_revision = "ac6d7e8f9a0b"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Make artefacts.blob_uri non-unique so each run records its own extraction row."""
+    # artefacts predates the migrations; create_all built the uniqueness as a
+    # unique index, older databases may carry it as a constraint instead.
+    op.execute("ALTER TABLE artefacts DROP CONSTRAINT IF EXISTS artefacts_blob_uri_key")
+    op.execute("DROP INDEX IF EXISTS ix_artefacts_blob_uri")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_artefacts_blob_uri ON artefacts (blob_uri)")
+
+
+def downgrade() -> None:
+    """Restore the unique index; fails while several runs share an extraction blob."""
+    op.execute("DROP INDEX IF EXISTS ix_artefacts_blob_uri")
+    op.execute("CREATE UNIQUE INDEX ix_artefacts_blob_uri ON artefacts (blob_uri)")
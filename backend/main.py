@@ -12,23 +12,29 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json as jsonlib
 import sys
 import logging
 import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields as dataclass_fields
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
 
+import orjson
+
 from planproof.config import get_settings
-from planproof.db import Database
-from planproof.storage import StorageClient
-from planproof.docintel import DocumentIntelligence
-from planproof.aoai import AzureOpenAIClient
-from planproof.pipeline import ingest_pdf, extract_document, validate_document, resolve_with_llm
-from planproof.pipeline.extract import extract_from_pdf_bytes
-from planproof.pipeline.validate import load_rule_catalog, validate_extraction
-from planproof.pipeline.llm_gate import should_trigger_llm, resolve_with_llm_new
+
+# Pipeline and Azure SDK imports are deferred to the command that needs them,
+# so lightweight commands don't pay for loading every client library.
+if TYPE_CHECKING:
+    from planproof.db import Database
+    from planproof.storage import StorageClient
+    from planproof.docintel import DocumentIntelligence
+    from planproof.aoai import AzureOpenAIClient
 
 LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +47,109 @@ def _log_event(event: str, payload: Dict[str, Any]) -> None:
         LOGGER.info("%s %s", event, payload)
 
 
+RULE_CATALOG_PATH = "artefacts/rule_catalog.json"
+
+
+def _emit_json(obj: Dict[str, Any], out_path: str = "") -> None:
+    """
+    Serialize a command's JSON result once; write it to stdout and, if given, to out_path.
+
+    Both are single binary writes (progress goes to logging).
+    """
+    payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    sys.stdout.flush()
+    sys.stdout.buffer.write(payload + b"\n")
+    sys.stdout.buffer.flush()
+    if out_path:
+        Path(out_path).write_bytes(payload)
+
+
+def _utc_stamp() -> str:
+    """Current UTC time as YYYYMMDD_HHMMSS_ffffff (same as strftime, without format parsing)."""
+    n = datetime.now(timezone.utc)
+    return f"{n.year:04d}{n.month:02d}{n.day:02d}_{n.hour:02d}{n.minute:02d}{n.second:02d}_{n.microsecond:06d}"
+
+
+@dataclass(slots=True)
+class DocResult:
+    """Outcome of one batch-pdf document; serialized only for the final summary."""
+
+    document_id: Optional[int]
+    filename: str
+    validation_summary: Optional[Dict[str, Any]] = None
+    llm_triggered: Optional[bool] = None
+    llm_call_count: int = 0
+    timings_ms: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary form: error results carry only id, filename and error."""
+        if self.error is not None:
+            return {"document_id": self.document_id, "filename": self.filename, "error": self.error}
+        return {f.name: getattr(self, f.name) for f in dataclass_fields(self) if f.name != "error"}
+
+
+# Successful LLM resolutions kept per batch run, keyed by prompt digest
+LLM_CACHE_MAX = 5
+
+
+def _llm_cache_key(extraction: Dict[str, Any], validation: Dict[str, Any]) -> str:
+    """Digest of the exact prompt the LLM gate would send for this document."""
+    from planproof.pipeline.llm_gate import build_llm_prompt
+
+    prompt = build_llm_prompt(extraction, validation)
+    payload = orjson.dumps(prompt, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+# Process-wide clients: each owns an HTTPS/DB connection pool, so build them once.
+@lru_cache(maxsize=1)
+def _db() -> Database:
+    from planproof.db import Database
+
+    return Database()
+
+
+@lru_cache(maxsize=1)
+def _storage() -> StorageClient:
+    from planproof.storage import StorageClient
+
+    return StorageClient()
+
+
+@lru_cache(maxsize=1)
+def _docintel() -> DocumentIntelligence:
+    from planproof.docintel import DocumentIntelligence
+
+    return DocumentIntelligence()
+
+
+def _aoai() -> AzureOpenAIClient:
+    from planproof.aoai import get_aoai_client
+
+    return get_aoai_client()
+
+
+@lru_cache(maxsize=4)
+def _cached_rules(path: str, mtime_ns: int) -> tuple:
+    """Parsed rule catalog; keyed on mtime so an edited catalog is re-read."""
+    from planproof.pipeline.validate import load_rule_catalog
+
+    return tuple(load_rule_catalog(path))
+
+
+def _load_rules(path: str = RULE_CATALOG_PATH) -> list:
+    """Load the rule catalog, reusing the parsed copy while the file is unchanged."""
+    try:
+        mtime_ns = Path(path).stat().st_mtime_ns
+    except FileNotFoundError:
+        # Let load_rule_catalog raise its own error (with the build hint)
+        from planproof.pipeline.validate import load_rule_catalog
+
+        return load_rule_catalog(path)
+    return list(_cached_rules(path, mtime_ns))
+
+
 def single_pdf(pdf_path: str, application_ref: Optional[str] = None) -> Dict[str, Any]:
     """
     Run end-to-end pipeline for a single PDF document.
@@ -58,23 +167,30 @@ def single_pdf(pdf_path: str, application_ref: Optional[str] = None) -> Dict[str
     Returns:
         Dictionary containing run_id, document_id, blob URLs, and validation summary
     """
-    pdf_path = str(Path(pdf_path).resolve())
+    pdf_file = Path(pdf_path).resolve()
+    pdf_path = str(pdf_file)
     
-    if not Path(pdf_path).exists():
+    if not pdf_file.exists():
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
 
+    from planproof.pipeline.ingest import ingest_pdf
+    from planproof.pipeline.extract import extract_from_pdf_bytes
+    from planproof.pipeline.validate import validate_extraction
+    from planproof.pipeline.llm_gate import should_trigger_llm, resolve_with_llm_new
+
     settings = get_settings()
     # Initialize clients
-    db = Database()
-    storage_client = StorageClient()
-    docintel = DocumentIntelligence()
-    aoai_client = AzureOpenAIClient()
+    db = _db()
+    storage_client = _storage()
+    docintel = _docintel()
+    aoai_client = _aoai()
 
     # 1) Create run + ingest
     # Use timestamp + hash for idempotency (same PDF = different run ID)
-    import hashlib
-    pdf_hash = hashlib.md5(Path(pdf_path).read_bytes()).hexdigest()[:8]
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S_%f")
+    # Read once: the same bytes are hashed here and handed to extraction below
+    pdf_bytes = pdf_file.read_bytes()
+    pdf_hash = hashlib.md5(pdf_bytes).hexdigest()[:8]
+    timestamp = _utc_stamp()
     app_ref = application_ref or f"AUTO-{timestamp}-{pdf_hash}"
     run = db.create_run(run_type="single_pdf", metadata={"pdf_path": pdf_path, "application_ref": app_ref, "pdf_hash": pdf_hash})
     ingest_start = time.perf_counter()
@@ -85,7 +201,6 @@ def single_pdf(pdf_path: str, application_ref: Optional[str] = None) -> Dict[str
 
     # 2) Extract
     # Hybrid storage: Write to both JSON artefact (blob) and relational tables (DB)
-    pdf_bytes = Path(pdf_path).read_bytes()
     extract_start = time.perf_counter()
     extraction = extract_from_pdf_bytes(
         pdf_bytes,
@@ -103,107 +218,148 @@ def single_pdf(pdf_path: str, application_ref: Optional[str] = None) -> Dict[str
     
     # Save extraction artefact to blob (complete JSON for audit trail)
     # Note: Relational tables (Page, Evidence, ExtractedField) already written above
-    extraction_blob = f"runs/{run['id']}/extraction_{run['id']}.json"
-    extraction_url = storage_client.write_json_blob("artefacts", extraction_blob, extraction, overwrite=True)
-
-    extraction_art = db.create_artefact_record(
-        document_id=ingested["document_id"],
-        artefact_type="extraction",
-        blob_uri=extraction_url,
-        metadata={"run_id": run["id"], "blob_path": extraction_blob}
-    )
-
-    # 3) Validate using parsed rule catalog (fail fast if missing/empty)
+    # Blob PUTs are independent and latency-bound, so they upload in the background
+    # while validation and the LLM gate run; artefact records are created once they land.
+    from concurrent.futures import Future, ThreadPoolExecutor
+    blob_writer = ThreadPoolExecutor(max_workers=3, thread_name_prefix="artefact-upload")
+    uploads: List[Future[Any]] = []
     try:
-        rules = load_rule_catalog("artefacts/rule_catalog.json")
-    except (FileNotFoundError, ValueError) as e:
-        raise RuntimeError(f"Rule catalog error: {e}") from e
-    # Hybrid storage: Write to both JSON artefact (blob) and relational tables (DB)
-    validate_start = time.perf_counter()
-    validation = validate_extraction(
-        extraction, 
-        rules, 
-        context={"run_id": run["id"], "document_id": ingested["document_id"], "submission_id": ingested.get("submission_id")},
-        db=db,
-        write_to_tables=settings.enable_db_writes
-    )
-    validate_ms = int((time.perf_counter() - validate_start) * 1000)
-    _log_event(
-        "validate_complete",
-        {"run_id": run["id"], "document_id": ingested["document_id"], "duration_ms": validate_ms},
-    )
-
-    # Save validation artefact to blob (complete JSON for audit trail)
-    # Note: Relational tables (ValidationCheck) already written above
-    validation_blob = f"runs/{run['id']}/validation_{run['id']}.json"
-    validation_url = storage_client.write_json_blob("artefacts", validation_blob, validation, overwrite=True)
+        # validate_extraction may backfill fields, so upload the fields as extracted
+        extraction_snapshot = {**extraction, "fields": dict(extraction.get("fields") or {})}
+        # Content-addressed: a rerun of the same PDF (extraction cache hit) re-uses the stored blob
+        extraction_upload = blob_writer.submit(
+            storage_client.write_json_content_blob, "artefacts", "content", extraction_snapshot,
+            digest_exclude=("analyzed_at",),
+        )
+        uploads.append(extraction_upload)
+
+        # 3) Validate using parsed rule catalog (fail fast if missing/empty)
+        try:
+            rules = _load_rules()
+        except (FileNotFoundError, ValueError) as e:
+            raise RuntimeError(f"Rule catalog error: {e}") from e
+        # Hybrid storage: Write to both JSON artefact (blob) and relational tables (DB)
+        validate_start = time.perf_counter()
+        validation = validate_extraction(
+            extraction, 
+            rules, 
+            context={"run_id": run["id"], "document_id": ingested["document_id"], "submission_id": ingested.get("submission_id")},
+            db=db,
+            write_to_tables=settings.enable_db_writes
+        )
+        validate_ms = int((time.perf_counter() - validate_start) * 1000)
+        _log_event(
+            "validate_complete",
+            {"run_id": run["id"], "document_id": ingested["document_id"], "duration_ms": validate_ms},
+        )
 
-    validation_art = db.create_artefact_record(
-        document_id=ingested["document_id"],
-        artefact_type="validation",
-        blob_uri=validation_url,
-        metadata={"run_id": run["id"], "blob_path": validation_blob}
-    )
+        # Save validation artefact to blob (complete JSON for audit trail)
+        # Note: Relational tables (ValidationCheck) already written above
+        validation_blob = f"runs/{run['id']}/validation_{run['id']}.json"
+        validation_upload = blob_writer.submit(
+            storage_client.write_json_blob, "artefacts", validation_blob, validation, overwrite=True
+        )
+        uploads.append(validation_upload)
 
-    # 4) Gated LLM resolve (only if needed)
-    # Get submission_id from ingested document
-    submission_id = ingested.get("submission_id")
+        # 4) Gated LLM resolve (only if needed)
+        # Get submission_id from ingested document
+        submission_id = ingested.get("submission_id")
     
-    # Check resolved fields from submission metadata and application-level cache
-    resolved_fields = {}
-    if submission_id:
-        resolved_fields = db.get_resolved_fields_for_submission(submission_id)
+        # Check resolved fields from submission metadata and application-level cache
+        resolved_fields = {}
+        if submission_id:
+            resolved_fields = db.get_resolved_fields_for_submission(submission_id)
     
-    # Load application-level resolved fields cache (fallback/aggregate)
-    app_resolved = db.get_resolved_fields_for_application(app_ref)
-    resolved_fields = {**app_resolved, **resolved_fields}  # Merge, current submission takes precedence
+        # Load application-level resolved fields cache (fallback/aggregate)
+        app_resolved = db.get_resolved_fields_for_application(app_ref)
+        resolved_fields = {**app_resolved, **resolved_fields}  # Merge, current submission takes precedence
     
-    # Reset LLM call counter for this run
-    aoai_client.reset_call_count()
+        # Reset LLM call counter for this run
+        aoai_client.reset_call_count()
     
-    llm_notes = None
-    llm_art = None
-    llm_start = time.perf_counter()
-    llm_ms = None
-    if settings.enable_llm_gate and should_trigger_llm(
-        validation,
-        extraction,
-        resolved_fields=resolved_fields,
-        application_ref=app_ref,
-        submission_id=submission_id,
-        db=db,
-    ):
-        print(f"LLM gate triggered for run {run['id']}")
-        llm_notes = resolve_with_llm_new(extraction, validation, aoai_client=aoai_client)
-        if llm_notes.get("gate_reason"):
-            reason = llm_notes["gate_reason"]
-            print(f"  Missing fields: {reason.get('missing_fields', [])}")
-            print(f"  Affected rules: {reason.get('affected_rule_ids', [])}")
+        llm_notes = None
+        llm_art = None
+        llm_upload = None
+        llm_start = time.perf_counter()
+        llm_ms = None
+        if settings.enable_llm_gate and should_trigger_llm(
+            validation,
+            extraction,
+            resolved_fields=resolved_fields,
+            application_ref=app_ref,
+            submission_id=submission_id,
+            db=db,
+        ):
+            LOGGER.info(f"LLM gate triggered for run {run['id']}")
+            llm_notes = resolve_with_llm_new(extraction, validation, aoai_client=aoai_client)
+            if llm_notes.get("gate_reason"):
+                reason = llm_notes["gate_reason"]
+                LOGGER.info(f"  Missing fields: {reason.get('missing_fields', [])}")
+                LOGGER.info(f"  Affected rules: {reason.get('affected_rule_ids', [])}")
         
-        # Store resolved fields in submission metadata (preferred) and run metadata (backward compat)
-        if llm_notes.get("response", {}).get("filled_fields"):
-            filled = llm_notes["response"]["filled_fields"]
-            resolved_fields.update(filled)
-            if submission_id:
-                db.update_submission_metadata(submission_id, {"resolved_fields": resolved_fields})
-            # Also update run metadata for backward compatibility
-            db.update_run(run["id"], metadata={"resolved_fields": resolved_fields})
+            # Store resolved fields in submission metadata (preferred) and run metadata (backward compat)
+            if llm_notes.get("response", {}).get("filled_fields"):
+                filled = llm_notes["response"]["filled_fields"]
+                resolved_fields.update(filled)
+                if submission_id:
+                    db.update_submission_metadata(submission_id, {"resolved_fields": resolved_fields})
+                # Also update run metadata for backward compatibility
+                db.update_run(run["id"], metadata={"resolved_fields": resolved_fields})
         
-        llm_blob = f"runs/{run['id']}/llm_notes_{run['id']}.json"
-        llm_url = storage_client.write_json_blob("artefacts", llm_blob, llm_notes, overwrite=True)
-        llm_art = db.create_artefact_record(
-            document_id=ingested["document_id"],
-            artefact_type="llm_notes",
-            blob_uri=llm_url,
-            metadata={"run_id": run["id"], "blob_path": llm_blob}
-        )
-    if settings.enable_llm_gate:
-        llm_ms = int((time.perf_counter() - llm_start) * 1000)
-        _log_event(
-            "llm_gate_complete",
-            {"run_id": run["id"], "document_id": ingested["document_id"], "duration_ms": llm_ms},
-        )
+            llm_blob = f"runs/{run['id']}/llm_notes_{run['id']}.json"
+            llm_upload = blob_writer.submit(
+                storage_client.write_json_blob, "artefacts", llm_blob, llm_notes, overwrite=True
+            )
+            uploads.append(llm_upload)
+        if settings.enable_llm_gate:
+            llm_ms = int((time.perf_counter() - llm_start) * 1000)
+            _log_event(
+                "llm_gate_complete",
+                {"run_id": run["id"], "document_id": ingested["document_id"], "duration_ms": llm_ms},
+            )
     
+        # Wait for the artefact uploads, then record them
+        extraction_url, extraction_blob, _ = extraction_upload.result()
+        validation_url = validation_upload.result()
+        llm_url = llm_upload.result() if llm_upload is not None else None
+    except BaseException:
+        # Don't lose upload failures behind the error that aborted the run
+        for upload in uploads:
+            upload_error = upload.exception()
+            if upload_error is not None:
+                LOGGER.error(f"Artefact upload failed for run {run['id']}: {upload_error}")
+        raise
+    finally:
+        blob_writer.shutdown(wait=True)
+    # Every run records its own pointer to the extraction, even when the
+    # content-addressed blob was written by an earlier run
+    artefact_specs = [
+        {
+            "document_id": ingested["document_id"],
+            "artefact_type": "extraction",
+            "blob_uri": extraction_url,
+            "metadata": {"run_id": run["id"], "blob_path": extraction_blob},
+        },
+        {
+            "document_id": ingested["document_id"],
+            "artefact_type": "validation",
+            "blob_uri": validation_url,
+            "metadata": {"run_id": run["id"], "blob_path": validation_blob},
+        },
+    ]
+    if llm_upload is not None:
+        artefact_specs.append({
+            "document_id": ingested["document_id"],
+            "artefact_type": "llm_notes",
+            "blob_uri": llm_url,
+            "metadata": {"run_id": run["id"], "blob_path": llm_blob},
+        })
+    # One transaction for all of this run's artefact rows
+    created_arts = iter(db.create_artefact_records(artefact_specs))
+    extraction_art = next(created_arts)
+    validation_art = next(created_arts)
+    llm_art = next(created_arts, None)
+
     # Get total LLM calls for this run
     llm_calls_per_run = aoai_client.get_call_count()
     
@@ -213,7 +369,8 @@ def single_pdf(pdf_path: str, application_ref: Optional[str] = None) -> Dict[str
     db.update_run(run["id"], metadata={"llm_calls_per_run": llm_calls_per_run})
     
     # Log headline metric
-    print(f"📊 LLM Calls Per Run: {llm_calls_per_run} (headline metric)")
+    LOGGER.info(f"📊 LLM Calls Per Run: {llm_calls_per_run} (headline metric)")
+    _log_event("llm_usage", {"run_id": run["id"], **aoai_client.get_usage_report()})
 
     run_metrics = {
         "timings_ms": {
@@ -246,6 +403,43 @@ def single_pdf(pdf_path: str, application_ref: Optional[str] = None) -> Dict[str
     }
 
 
+# (command, help, [(flags, add_argument kwargs), ...]) for the CLI subcommands
+CLI_COMMANDS: List[Tuple[str, str, List[Tuple[Tuple[str, ...], Dict[str, Any]]]]] = [
+    # Single PDF end-to-end command
+    ("single-pdf", "Run ingest → extract → validate → (optional) llm on one local PDF", [
+        (("--pdf",), {"required": True, "help": "Path to local PDF"}),
+        (("--application-ref",), {"help": "Application reference (default: auto-generated)"}),
+        (("--out",), {"default": "", "help": "Optional: write run summary JSON to a local file"}),
+    ]),
+    # Batch process folder command
+    ("batch-pdf", "Process all PDFs in a folder for one application", [
+        (("--folder",), {"required": True, "help": "Path to folder containing PDFs"}),
+        (("--application-ref",), {"required": True, "help": "Application reference for all PDFs"}),
+        (("--applicant-name",), {"help": "Applicant name (optional)"}),
+        (("--workers", "--threads"), {"dest": "workers", "type": int, "default": 4, "help": "Parallel worker count (default: 4)"}),
+        (("--page-parallelism",), {"type": int, "default": 1, "help": "DocIntel page parallelism per PDF"}),
+        (("--pages-per-batch",), {"type": int, "default": 5, "help": "Pages per DocIntel batch"}),
+        (("--out",), {"default": "", "help": "Optional: write results JSON to a local file"}),
+    ]),
+    # Legacy commands
+    ("ingest", "Ingest a PDF file", [
+        (("pdf_path",), {"help": "Path to PDF file"}),
+        (("application_ref",), {"help": "Application reference"}),
+        (("applicant_name",), {"nargs": "?", "help": "Applicant name (optional)"}),
+    ]),
+    ("extract", "Extract document", [
+        (("document_id",), {"type": int, "help": "Document ID"}),
+    ]),
+    ("validate", "Validate document", [
+        (("document_id",), {"type": int, "help": "Document ID"}),
+    ]),
+    ("resolve", "Resolve with LLM", [
+        (("document_id",), {"type": int, "help": "Document ID"}),
+        (("field_name",), {"nargs": "?", "help": "Field name (optional)"}),
+    ]),
+]
+
+
 def main():
     """
     Main CLI entry point.
@@ -263,57 +457,32 @@ def main():
     ap = argparse.ArgumentParser(description="PlanProof - Planning Validation System MVP")
     sub = ap.add_subparsers(dest="cmd", required=True)
 
-    # Single PDF end-to-end command
-    sp = sub.add_parser("single-pdf", help="Run ingest → extract → validate → (optional) llm on one local PDF")
-    sp.add_argument("--pdf", required=True, help="Path to local PDF")
-    sp.add_argument("--application-ref", help="Application reference (default: auto-generated)")
-    sp.add_argument("--out", default="", help="Optional: write run summary JSON to a local file")
-
-    # Batch process folder command
-    batch_parser = sub.add_parser("batch-pdf", help="Process all PDFs in a folder for one application")
-    batch_parser.add_argument("--folder", required=True, help="Path to folder containing PDFs")
-    batch_parser.add_argument("--application-ref", required=True, help="Application reference for all PDFs")
-    batch_parser.add_argument("--applicant-name", help="Applicant name (optional)")
-    batch_parser.add_argument("--workers", type=int, default=4, help="Parallel worker count (default: 4)")
-    batch_parser.add_argument("--page-parallelism", type=int, default=1, help="DocIntel page parallelism per PDF")
-    batch_parser.add_argument("--pages-per-batch", type=int, default=5, help="Pages per DocIntel batch")
-    batch_parser.add_argument("--out", default="", help="Optional: write results JSON to a local file")
-
-    # Legacy commands
-    ingest_parser = sub.add_parser("ingest", help="Ingest a PDF file")
-    ingest_parser.add_argument("pdf_path", help="Path to PDF file")
-    ingest_parser.add_argument("application_ref", help="Application reference")
-    ingest_parser.add_argument("applicant_name", nargs="?", help="Applicant name (optional)")
-
-    extract_parser = sub.add_parser("extract", help="Extract document")
-    extract_parser.add_argument("document_id", type=int, help="Document ID")
-
-    validate_parser = sub.add_parser("validate", help="Validate document")
-    validate_parser.add_argument("document_id", type=int, help="Document ID")
-
-    resolve_parser = sub.add_parser("resolve", help="Resolve with LLM")
-    resolve_parser.add_argument("document_id", type=int, help="Document ID")
-    resolve_parser.add_argument("field_name", nargs="?", help="Field name (optional)")
+    for name, help_text, arguments in CLI_COMMANDS:
+        command_parser = sub.add_parser(name, help=help_text)
+        for flags, options in arguments:
+            command_parser.add_argument(*flags, **options)
 
     args = ap.parse_args()
 
     try:
         if args.cmd == "single-pdf":
             result = single_pdf(args.pdf, application_ref=getattr(args, 'application_ref', None))
-            print(jsonlib.dumps(result, indent=2))
-            if args.out:
-                Path(args.out).write_text(jsonlib.dumps(result, indent=2), encoding="utf-8")
+            _emit_json(result, args.out)
 
         elif args.cmd == "batch-pdf":
+            from planproof.aoai import AzureOpenAIClient
             from planproof.pipeline.ingest import ingest_folder
+            from planproof.pipeline.extract import extract_document
+            from planproof.pipeline.validate import validate_extraction
+            from planproof.pipeline.llm_gate import should_trigger_llm, resolve_with_llm_new
             
             folder_path = args.folder
             application_ref = args.application_ref
             settings = get_settings()
             
             # Initialize clients
-            db = Database()
-            storage_client = StorageClient()
+            db = _db()
+            storage_client = _storage()
             
             # CREATE RUN FIRST (before any processing)
             run = db.create_run(
@@ -324,10 +493,10 @@ def main():
                     "started_at": datetime.now(timezone.utc).isoformat()
                 }
             )
-            print(f"Created run {run['id']} for batch processing")
+            LOGGER.info(f"Created run {run['id']} for batch processing")
             
             # Ingest all PDFs in folder
-            print(f"Ingesting PDFs from {folder_path}...")
+            LOGGER.info(f"Ingesting PDFs from {folder_path}...")
             ingest_start = time.perf_counter()
             ingested_results = ingest_folder(
                 folder_path, 
@@ -343,42 +512,45 @@ def main():
                 {"run_id": run["id"], "document_count": len(ingested_results), "duration_ms": ingest_ms},
             )
             
-            print(f"OK: Ingested {len(ingested_results)} PDF(s)")
+            LOGGER.info(f"OK: Ingested {len(ingested_results)} PDF(s)")
             
-            all_results = []
+            all_results: List[DocResult] = []
             successes = 0
             failures = 0
-            errors = []
+            errors: List[DocResult] = []
             run_metadata = run.get("metadata", {}) or {}
             resolved_fields = db.get_resolved_fields_for_application(application_ref)
             resolved_fields.update(run_metadata.get("resolved_fields", {}))
 
             from concurrent.futures import ThreadPoolExecutor, as_completed
+            from itertools import chain
             import threading
             lock = threading.Lock()
+            llm_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
             
             try:
-                rules = load_rule_catalog("artefacts/rule_catalog.json")
+                rules = _load_rules()
             except (FileNotFoundError, ValueError) as e:
                 error_msg = f"Rule catalog error: {e}"
-                print(f"ERROR: {error_msg}")
+                LOGGER.error(f"ERROR: {error_msg}")
                 db.update_run(run["id"], status="failed", error_message=error_msg)
                 sys.exit(1)
             
-            def _process_document(ingested: dict) -> dict:
+            def _process_document(ingested: dict) -> DocResult:
                 if "error" in ingested:
-                    return {
-                        "document_id": ingested.get("document_id"),
-                        "filename": ingested.get("filename", "unknown"),
-                        "error": ingested["error"]
-                    }
+                    return DocResult(
+                        document_id=ingested.get("document_id"),
+                        filename=ingested.get("filename", "unknown"),
+                        error=ingested["error"],
+                    )
 
                 doc_id = ingested["document_id"]
-                print(f"Processing document {doc_id} ({ingested['filename']})...")
+                LOGGER.info(f"Processing document {doc_id} ({ingested['filename']})...")
 
                 try:
-                    local_docintel = DocumentIntelligence()
-                    local_storage = StorageClient()
+                    local_docintel = _docintel()
+                    local_storage = storage_client
+                    # Per-document AOAI client: its call counter is the per-document metric
                     local_aoai = AzureOpenAIClient()
 
                     extract_start = time.perf_counter()
@@ -400,10 +572,9 @@ def main():
                     field_evidence = mapped["evidence_index"]
 
                     evidence_index = {}
-                    for i, block in enumerate(extraction_raw.get("text_blocks", [])):
+                    text_blocks = extraction_raw.get("text_blocks", [])
+                    for i, block in enumerate(text_blocks):
                         block["index"] = i
-
-                    for i, block in enumerate(extraction_raw.get("text_blocks", [])):
                         content = block.get("content", "")
                         page_num = block.get("page_number")
                         snippet = content[:100] + "..." if len(content) > 100 else content
@@ -414,31 +585,28 @@ def main():
                             "page_number": page_num
                         }
 
-                    for i, table in enumerate(extraction_raw.get("tables", [])):
-                        page_num = table.get("page_number")
-                        cells = table.get("cells", [])
-                        cell_snippets = []
-                        for cell in cells[:5]:
-                            if cell.get("content"):
-                                cell_snippets.append(cell["content"][:50])
-                        snippet = " | ".join(cell_snippets) if cell_snippets else ""
-                        evidence_index[f"table_{i}"] = {
+                    tables = extraction_raw.get("tables", [])
+                    join_cells = " | ".join
+                    evidence_index.update({
+                        f"table_{i}": {
                             "type": "table",
                             "row_count": table.get("row_count"),
                             "column_count": table.get("column_count"),
-                            "page_number": page_num,
-                            "snippet": snippet
+                            "page_number": table.get("page_number"),
+                            "snippet": join_cells(
+                                cell["content"][:50] for cell in table.get("cells", [])[:5] if cell.get("content")
+                            ),
                         }
-
-                    for field_name, ev_list in field_evidence.items():
-                        evidence_index[field_name] = ev_list
+                        for i, table in enumerate(tables)
+                    })
+                    evidence_index.update(field_evidence)
 
                     extraction_structured = {
                         "fields": fields,
                         "evidence_index": evidence_index,
                         "metadata": extraction_raw.get("metadata", {}),
-                        "text_blocks": extraction_raw.get("text_blocks", []),
-                        "tables": extraction_raw.get("tables", []),
+                        "text_blocks": text_blocks,
+                        "tables": tables,
                         "page_anchors": extraction_raw.get("page_anchors", {})
                     }
 
@@ -464,20 +632,32 @@ def main():
                         application_ref=application_ref,
                         db=db
                     ):
-                        print(f"  LLM gate triggered for document {doc_id}")
-                        llm_notes = resolve_with_llm_new(extraction_structured, validation, aoai_client=local_aoai)
+                        LOGGER.info(f"  LLM gate triggered for document {doc_id}")
+                        cache_key = _llm_cache_key(extraction_structured, validation)
+                        with lock:
+                            cached_notes = llm_cache.get(cache_key)
+                            if cached_notes is not None:
+                                llm_cache.move_to_end(cache_key)
+                        if cached_notes is not None:
+                            LOGGER.info("    Reusing LLM result for an identical prompt")
+                            llm_notes = {**cached_notes, "llm_call_count": 0, "llm_calls": [], "cache_hit": True}
+                        else:
+                            llm_notes = resolve_with_llm_new(extraction_structured, validation, aoai_client=local_aoai)
+                            if llm_notes.get("status") == "success":
+                                with lock:
+                                    llm_cache[cache_key] = llm_notes
+                                    if len(llm_cache) > LLM_CACHE_MAX:
+                                        llm_cache.popitem(last=False)
                         if llm_notes.get("gate_reason"):
                             reason = llm_notes["gate_reason"]
-                            print(f"    Missing fields: {reason.get('missing_fields', [])}")
-                            print(f"    Affected rules: {reason.get('affected_rule_ids', [])}")
+                            LOGGER.info(f"    Missing fields: {reason.get('missing_fields', [])}")
+                            LOGGER.info(f"    Affected rules: {reason.get('affected_rule_ids', [])}")
 
                         if llm_notes.get("response", {}).get("filled_fields"):
                             filled = llm_notes["response"]["filled_fields"]
+                            # Persisted once with the final run update below
                             with lock:
                                 resolved_fields.update(filled)
-                                run_metadata["resolved_fields"] = resolved_fields
-                                db.update_run(run["id"], metadata=run_metadata)
-                                run["metadata"] = run_metadata
 
                     llm_ms = int((time.perf_counter() - llm_start) * 1000) if settings.enable_llm_gate else None
                     _log_event(
@@ -493,48 +673,46 @@ def main():
                         },
                     )
 
-                    return {
-                        "document_id": doc_id,
-                        "filename": ingested["filename"],
-                        "validation_summary": validation.get("summary", {}),
-                        "llm_triggered": llm_notes is not None,
-                        "llm_call_count": local_aoai.get_call_count(),
-                        "timings_ms": {
+                    return DocResult(
+                        document_id=doc_id,
+                        filename=ingested["filename"],
+                        validation_summary=validation.get("summary", {}),
+                        llm_triggered=llm_notes is not None,
+                        llm_call_count=local_aoai.get_call_count(),
+                        timings_ms={
                             "extract": extract_ms,
                             "validate": validate_ms,
                             "llm_gate": llm_ms,
                         },
-                    }
+                    )
                 except Exception as e:
                     import traceback
                     error_details = traceback.format_exc()
-                    print(f"  ERROR: Error processing document {doc_id}: {e}")
-                    print(f"  Traceback: {error_details.split(chr(10))[-3] if error_details else 'N/A'}")
-                    return {
-                        "document_id": doc_id,
-                        "filename": ingested.get("filename", "unknown"),
-                        "error": str(e)
-                    }
+                    LOGGER.error(f"  ERROR: Error processing document {doc_id}: {e}")
+                    LOGGER.error(f"  Traceback: {error_details.split(chr(10))[-3] if error_details else 'N/A'}")
+                    return DocResult(
+                        document_id=doc_id,
+                        filename=ingested.get("filename", "unknown"),
+                        error=str(e),
+                    )
 
-            worker_count = max(1, min(args.workers, len(ingested_results)))
+            # Failed ingests are reported straight away; only real documents occupy a worker
+            pending = [ingested for ingested in ingested_results if "error" not in ingested]
+            failed_ingests = [_process_document(ingested) for ingested in ingested_results if "error" in ingested]
+            worker_count = max(1, min(args.workers, len(pending)))
             with ThreadPoolExecutor(max_workers=worker_count) as executor:
-                futures = [executor.submit(_process_document, ingested) for ingested in ingested_results]
-                for future in as_completed(futures):
-                    result = future.result()
-                    all_results.append(result)
-                    if "error" in result:
+                futures = [executor.submit(_process_document, ingested) for ingested in pending]
+                for doc_result in chain(failed_ingests, (future.result() for future in as_completed(futures))):
+                    all_results.append(doc_result)
+                    if doc_result.error is not None:
                         failures += 1
-                        errors.append({
-                            "document_id": result.get("document_id"),
-                            "filename": result.get("filename", "unknown"),
-                            "error": result["error"]
-                        })
+                        errors.append(doc_result)
                     else:
                         successes += 1
-                        print(f"  OK: Completed document {result.get('document_id')}")
+                        LOGGER.info(f"  OK: Completed document {doc_result.document_id}")
             
             # Get total LLM calls for this run
-            llm_calls_per_run = sum(r.get("llm_call_count", 0) for r in all_results)
+            llm_calls_per_run = sum(r.llm_call_count for r in all_results)
             
             # Update submission metadata with LLM call count (if we have a submission)
             # For batch processing, all documents should be in the same submission (V0)
@@ -553,7 +731,8 @@ def main():
                         "successes": successes,
                         "failures": failures
                     },
-                    "errors": errors,
+                    "errors": [e.to_dict() for e in errors],
+                    "resolved_fields": resolved_fields,
                     "llm_calls_per_run": llm_calls_per_run,
                     "timings_ms": {
                         "ingest": ingest_ms,
@@ -562,7 +741,7 @@ def main():
             )
             
             # Count documents that triggered LLM
-            llm_triggered_count = sum(1 for r in all_results if r.get("llm_triggered", False))
+            llm_triggered_count = sum(1 for r in all_results if r.llm_triggered)
             
             summary = {
                 "run_id": run["id"],
@@ -572,17 +751,16 @@ def main():
                 "failures": failures,
                 "llm_triggered_documents": llm_triggered_count,
                 "llm_calls_per_run": llm_calls_per_run,
-                "results": all_results
+                "results": [r.to_dict() for r in all_results]
             }
             
             # Log headline metric
-            print(f"\n📊 LLM Calls Per Run: {llm_calls_per_run} (headline metric)")
+            LOGGER.info(f"📊 LLM Calls Per Run: {llm_calls_per_run} (headline metric)")
             
-            print(jsonlib.dumps(summary, indent=2))
-            if args.out:
-                Path(args.out).write_text(jsonlib.dumps(summary, indent=2), encoding="utf-8")
+            _emit_json(summary, args.out)
 
         elif args.cmd == "ingest":
+            from planproof.pipeline.ingest import ingest_pdf
             result = ingest_pdf(args.pdf_path, args.application_ref, applicant_name=args.applicant_name)
             print(f"✓ Ingested: {result['filename']}")
             print(f"  Application ID: {result['application_id']}")
@@ -590,6 +768,7 @@ def main():
             print(f"  Blob URI: {result['blob_uri']}")
 
         elif args.cmd == "extract":
+            from planproof.pipeline.extract import extract_document
             result = extract_document(args.document_id)
             print(f"✓ Extracted document {args.document_id}")
             print(f"  Artefact ID: {result['artefact_id']}")
@@ -597,6 +776,7 @@ def main():
             print(f"  Page count: {result['extraction_result']['metadata']['page_count']}")
 
         elif args.cmd == "validate":
+            from planproof.pipeline.validate import validate_document
             results = validate_document(args.document_id)
             print(f"✓ Validated document {args.document_id}")
             for r in results:
@@ -604,6 +784,7 @@ def main():
                 print(f"  {status_icon} {r['field_name']}: {r['status']} (confidence: {r.get('confidence', 'N/A')})")
 
         elif args.cmd == "resolve":
+            from planproof.pipeline.llm_gate import resolve_with_llm
             results = resolve_with_llm(args.document_id, field_name=args.field_name)
             print(f"✓ Resolved with LLM for document {args.document_id}")
             for r in results:
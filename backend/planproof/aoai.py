@@ -1,25 +1,190 @@
 """
 Azure OpenAI wrapper for LLM-based resolution and validation.
+
+The OpenAI SDK (and httpx) are imported on first use so CLI paths that never
+call the LLM don't pay for loading them.
 """
 
-from typing import List, Dict, Any, Optional
+from __future__ import annotations
+
+from collections import deque
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Any, Generator, Mapping, NoReturn, Optional, Tuple, Union, TYPE_CHECKING
+import asyncio
+import hashlib
 import logging
+import random
 import time
 from datetime import datetime, timezone
 
-import openai
-from openai import APIError, APITimeoutError, RateLimitError, APIConnectionError
-
-AzureOpenAI = openai.AzureOpenAI
-from openai.types.chat import ChatCompletion
+import ijson
+import orjson
 
+from planproof.aoai_cache import CacheBackend, DiskCache, InMemoryLRU
 from planproof.config import get_settings
 
+if TYPE_CHECKING:
+    import openai
+    from openai import Stream
+    from openai.types.chat import ChatCompletion, ChatCompletionChunk
+
 LOGGER = logging.getLogger(__name__)
 
+_MAX_RETRY_DELAY_S = 30.0
+
+# Responses sampled above this temperature are meant to vary, so never cache them.
+_CACHE_MAX_TEMPERATURE = 0.3
+
+# System prompts hold every static instruction and the user messages carry only
+# per-call data, so the request prefix is identical across calls and eligible
+# for Azure OpenAI's automatic prompt caching.
+_RESOLVE_SYSTEM_PROMPT = """Planning validator. Resolve a conflicting or missing extracted field from document context.
+Input lines: field name; extracted value (NOT FOUND if missing); validation issue; document context after ---.
+Return JSON: {"resolved_value": str|null, "confidence": 0..1, "reasoning": str}. Only use facts clearly present in the document."""
+
+_RESOLVE_BATCH_SYSTEM_PROMPT = """Planning validator. Resolve conflicting or missing extracted fields from document context.
+Input JSON: {"tasks": [{"field_name", "extracted_value" (NOT FOUND if missing), "validation_issue", "context"}, ...]}.
+Return JSON: {"results": [{"resolved_value": str|null, "confidence": 0..1, "reasoning": str}, ...]} with one result per task, in task order. Only use facts clearly present in each task's context."""
+
+_VALIDATE_SYSTEM_PROMPT = """Planning validator. Check an extracted field against planning requirements.
+Input lines: field name; extracted value; validation rules after ---; document context after a second ---.
+Return JSON: {"is_valid": bool, "confidence": 0..1, "reasoning": str, "suggested_value": str|null (correction, if one is possible)}."""
+
+_CHAT_JSON_SYSTEM_PROMPT = """Planning validator. Complete the task in the JSON input and return valid JSON following its schema.
+Only use facts clearly present in the evidence provided."""
+
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Shared by every JSON-mode helper: low temperature for repeatable answers.
+# Read-only so no caller can alter the template for the others.
+_JSON_CALL_KWARGS: Mapping[str, Any] = MappingProxyType({"temperature": 0.2, "response_format": _JSON_RESPONSE_FORMAT})
+
+# Completion budgets: a safety net against runaway generation, sized well above
+# the JSON each task normally returns so real answers are never truncated.
+_RESOLVE_MAX_TOKENS = 200
+_VALIDATE_MAX_TOKENS = 300
+_CHAT_JSON_MAX_TOKENS = 2048
+
+# Document context sent per field is clipped to ~3k tokens (~4 chars per token).
+_CONTEXT_MAX_CHARS = 12_000
+_CONTEXT_HEAD_SHARE = 0.6
+
+# Batched resolution packs at most this many fields, or roughly this much input
+# (~4 chars per token, ~6k tokens), into one request.
+_RESOLVE_BATCH_MAX_ITEMS = 10
+_RESOLVE_BATCH_MAX_CHARS = 24_000
+
+# USD per 1K tokens by model family, checked longest prefix first so dated
+# versions (gpt-4o-2024-08-06) and minis resolve to the right entry. Cached
+# input is prompt tokens served from Azure's prompt cache at a discount.
+# https://azure.microsoft.com/en-us/pricing/details/cognitive-services/openai-service/
+_MODEL_PRICING_PER_1K = {
+    "gpt-4o-mini": {"input": 0.00015, "cached_input": 0.000075, "output": 0.0006},
+    "gpt-4o": {"input": 0.0025, "cached_input": 0.00125, "output": 0.01},
+    "gpt-4-turbo": {"input": 0.01, "cached_input": 0.01, "output": 0.03},
+    "gpt-4-32k": {"input": 0.06, "cached_input": 0.06, "output": 0.12},
+    "gpt-4": {"input": 0.03, "cached_input": 0.03, "output": 0.06},
+    "gpt-35-turbo": {"input": 0.0005, "cached_input": 0.0005, "output": 0.0015},
+    "gpt-3.5-turbo": {"input": 0.0005, "cached_input": 0.0005, "output": 0.0015},
+}
+_PRICING_PREFIXES = sorted(_MODEL_PRICING_PER_1K, key=len, reverse=True)
+
+# Batch API jobs are billed at half the synchronous rate.
+_BATCH_PRICE_FACTOR = 0.5
+
+# ijson events that carry a complete value (as opposed to container start/end).
+_SCALAR_EVENTS = frozenset(("string", "number", "boolean", "null"))
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards-compatible ``planproof.aoai.AzureOpenAI`` alias, resolved lazily.
+    if name == "AzureOpenAI":
+        import openai
+
+        return openai.AzureOpenAI
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@lru_cache(maxsize=1)
+def _retryable_errors() -> tuple:
+    """SDK errors worth retrying: throttling, transient network failures and 5xx.
+
+    Other API errors (bad request, auth, content filter) are not retried.
+    """
+    from openai import APIConnectionError, APITimeoutError, InternalServerError, RateLimitError
+
+    return (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
+
+
+def _retry_after_s(exc: Exception) -> Optional[float]:
+    """Server-requested retry delay in seconds from a throttled response, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        # Retry-After may also be an HTTP date; fall back to exponential backoff.
+        return None
+    return None
+
+
+@lru_cache(maxsize=32)
+def _model_pricing(model: str) -> Optional[Dict[str, float]]:
+    """Per-1K-token prices for a model name, or None if the model is unknown."""
+    name = model.lower()
+    for prefix in _PRICING_PREFIXES:
+        if name.startswith(prefix):
+            return _MODEL_PRICING_PER_1K[prefix]
+    return None
+
+
+def _clip_context(text: Optional[str]) -> str:
+    """Clip document context to _CONTEXT_MAX_CHARS, keeping its start and end.
+
+    The middle is dropped (head 60%, tail 40%) so values near the end of a
+    long extract, such as signatures and dates, still reach the model.
+    """
+    text = text or ""
+    if len(text) <= _CONTEXT_MAX_CHARS:
+        return text
+    head = int(_CONTEXT_MAX_CHARS * _CONTEXT_HEAD_SHARE)
+    tail = _CONTEXT_MAX_CHARS - head
+    LOGGER.info("aoai_context_truncated", extra={"original_chars": len(text), "kept_chars": _CONTEXT_MAX_CHARS})
+    return f"{text[:head]}\n[...]\n{text[-tail:]}"
+
+
+def _as_confidence(value: Any, default: float) -> float:
+    """Model-reported confidence as a float in [0, 1], or ``default`` if unusable."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return default
+    try:
+        confidence = float(value)
+    except ValueError:
+        return default
+    if confidence != confidence:  # NaN
+        return default
+    return min(1.0, max(0.0, confidence))
+
+
+def _as_bool(value: Any) -> bool:
+    """Model-reported boolean; JSON strings such as "false" are not truthy."""
+    if isinstance(value, str):
+        return value.strip().lower() == "true"
+    return value is True
+
 
 class AzureOpenAIClient:
-    """Wrapper around Azure OpenAI for LLM operations."""
+    """Wrapper around Azure OpenAI for LLM operations.
+
+    Prefer get_aoai_client() for long-lived callers so the connection pool is
+    shared; construct directly when call/cost counters must be isolated.
+    """
 
     def __init__(
         self,
@@ -44,24 +209,60 @@ class AzureOpenAIClient:
         api_version = api_version or settings.azure_openai_api_version
         deployment = deployment or settings.azure_openai_chat_deployment
 
+        self._client_kwargs: Dict[str, Any] = {
+            "azure_endpoint": endpoint,
+            "api_key": api_key,
+            "api_version": api_version,
+            "timeout": timeout or 60.0,  # Default 60 second timeout
+            # Retries are handled by _with_retry so they are counted and share
+            # the AZURE_RETRY_* policy with the storage and DocIntel clients.
+            "max_retries": 0,
+        }
+        # Explicit keep-alive pool so repeated calls reuse TLS connections.
+        import httpx
+        import openai
+
         self.client = openai.AzureOpenAI(
-            azure_endpoint=endpoint,
-            api_key=api_key,
-            api_version=api_version,
-            timeout=timeout or 60.0  # Default 60 second timeout
+            **self._client_kwargs,
+            http_client=httpx.Client(
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            ),
         )
+        self._async_client: Optional[openai.AsyncAzureOpenAI] = None
+        self.max_concurrency = max(1, settings.azure_openai_max_concurrency)
+        self._max_attempts = max(1, settings.azure_retry_max_attempts)
+        self._base_delay = max(0.1, settings.azure_retry_base_delay_s)
+        self._retry_count = 0
+
+        # Exact-match response cache: identical prompts are answered without
+        # another round-trip. LLM_RESPONSE_CACHE_DIR persists it across runs.
+        self._response_cache_max = max(0, settings.llm_response_cache_size)
+        self._response_cache: CacheBackend
+        if settings.llm_response_cache_dir and self._response_cache_max:
+            self._response_cache = DiskCache(settings.llm_response_cache_dir, maxsize=self._response_cache_max)
+        else:
+            self._response_cache = InMemoryLRU(maxsize=self._response_cache_max)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_tokens_saved = 0
         self.deployment = deployment
         self.timeout = timeout or 60.0
         self._call_count = 0  # Track LLM calls for metrics
         self._last_call_metadata: Optional[Dict[str, Any]] = None
-        self._call_history: List[Dict[str, Any]] = []
+        # Bounded so long-lived API workers don't accumulate metadata forever.
+        self._call_history: "deque[Dict[str, Any]]" = deque(maxlen=max(1, settings.llm_call_history_max))
 
         # Cost tracking
         self.total_tokens = 0
+        self._prompt_tokens = 0
+        self._completion_tokens = 0
+        self._cached_tokens = 0
+        self._latency_s = 0.0
         self.total_cost = 0.0
-        # GPT-4 pricing (adjust based on actual model)
-        # https://azure.microsoft.com/en-us/pricing/details/cognitive-services/openai-service/
+        # Fallback flat rate for models missing from _MODEL_PRICING_PER_1K
         self.cost_per_1k_tokens = 0.03  # $0.03 per 1K tokens (GPT-4 average)
+        self.budget_usd = settings.llm_budget_usd
+        self._budget_warned = False
 
     def chat_completion(
         self,
@@ -85,91 +286,353 @@ class AzureOpenAIClient:
         Raises:
             RuntimeError: If API call fails after retries or times out
         """
+        cache_key = self._response_cache_key(messages, temperature, max_tokens, kwargs)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+
         self._call_count += 1
         call_started_at = time.monotonic()
         call_timestamp = datetime.now(timezone.utc).isoformat()
 
         try:
-            response = self.client.chat.completions.create(
+            response: ChatCompletion
+            response, retries = self._with_retry(
+                self.client.chat.completions.create,
                 model=self.deployment,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
                 **kwargs
             )
+            self._record_response(response, call_started_at, call_timestamp, retries)
+            self._store_response(cache_key, response)
+            return response
+        except Exception as e:
+            self._raise_call_error(e)
 
-            # Track tokens and cost
-            response_time_ms = int((time.monotonic() - call_started_at) * 1000)
-            tokens_used = 0
-            if hasattr(response, 'usage') and response.usage:
-                tokens_used = response.usage.total_tokens or 0
-                cost = (tokens_used / 1000) * self.cost_per_1k_tokens
+    def _new_async_client(self) -> openai.AsyncAzureOpenAI:
+        """Build an async SDK client with its own keep-alive pool."""
+        import httpx
+        import openai
 
-                self.total_tokens += tokens_used
-                self.total_cost += cost
+        # Pool capped at the fan-out width so concurrent batches share
+        # back-pressure instead of opening sockets.
+        limits = httpx.Limits(
+            max_connections=self.max_concurrency,
+            max_keepalive_connections=self.max_concurrency,
+        )
+        return openai.AsyncAzureOpenAI(
+            **self._client_kwargs,
+            http_client=httpx.AsyncClient(limits=limits),
+        )
 
-                LOGGER.info(
-                    f"LLM call #{self._call_count}: {tokens_used} tokens, "
-                    f"${cost:.4f} (total: ${self.total_cost:.4f})"
-                )
+    def open_async_pool(self) -> None:
+        """Create the shared async client now, binding its pool to the running loop."""
+        if self._async_client is None:
+            self._async_client = self._new_async_client()
 
-                # Budget alert threshold: $5.00
-                if self.total_cost > 5.0:
-                    LOGGER.warning(
-                        f"⚠️  LLM cost exceeded ${self.total_cost:.2f}! "
-                        f"Consider reducing calls or checking for runaway usage."
-                    )
-
-            call_metadata = {
-                "timestamp": call_timestamp,
-                "tokens_used": tokens_used,
-                "model": getattr(response, "model", None) or self.deployment,
-                "response_time_ms": response_time_ms,
-            }
-            self._last_call_metadata = call_metadata
-            self._call_history.append(call_metadata)
+    @property
+    def async_client(self) -> openai.AsyncAzureOpenAI:
+        """Async SDK client, created on first use so sync-only callers never build it."""
+        if self._async_client is None:
+            self._async_client = self._new_async_client()
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client's connection pool; call from the loop that used it."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _retry_delay(self, attempt: int, exc: Exception) -> float:
+        """Backoff before retrying the given (1-based) attempt.
+
+        Honours the Retry-After hint Azure sends with 429s; otherwise uses
+        exponential backoff. Jitter keeps concurrent callers from retrying
+        in lockstep.
+        """
+        delay = _retry_after_s(exc)
+        if delay is None:
+            delay = self._base_delay * (2 ** (attempt - 1))
+        delay = min(_MAX_RETRY_DELAY_S, delay) + random.uniform(0, self._base_delay)
+        self._retry_count += 1
+        LOGGER.warning(
+            "aoai_retry",
+            extra={
+                "attempt": attempt,
+                "max_attempts": self._max_attempts,
+                "delay_s": round(delay, 2),
+                "error": str(exc),
+            },
+        )
+        return delay
+
+    def _with_retry(self, func, **kwargs):
+        """Call ``func`` and retry throttling / transient failures with backoff.
+
+        Returns:
+            Tuple of (result, number of retries it took)
+        """
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                return func(**kwargs), attempt - 1
+            except _retryable_errors() as exc:
+                if attempt == self._max_attempts:
+                    raise
+                time.sleep(self._retry_delay(attempt, exc))
+
+    async def _a_with_retry(self, func, **kwargs):
+        """Async variant of _with_retry; backs off without blocking the event loop."""
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                return await func(**kwargs), attempt - 1
+            except _retryable_errors() as exc:
+                if attempt == self._max_attempts:
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, exc))
+
+    async def a_chat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        *,
+        client: Optional[openai.AsyncAzureOpenAI] = None,
+        **kwargs
+    ) -> ChatCompletion:
+        """
+        Async variant of chat_completion; awaits the round-trip instead of blocking.
+
+        Tracking and error handling match chat_completion, so many calls can be
+        fanned out with asyncio.gather without losing call/cost metrics. Pass
+        ``client`` to use an async client other than the shared one.
+        """
+        cache_key = self._response_cache_key(messages, temperature, max_tokens, kwargs)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
 
+        self._call_count += 1
+        call_started_at = time.monotonic()
+        call_timestamp = datetime.now(timezone.utc).isoformat()
+
+        try:
+            response: ChatCompletion
+            response, retries = await self._a_with_retry(
+                (client or self.async_client).chat.completions.create,
+                model=self.deployment,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs
+            )
+            self._record_response(response, call_started_at, call_timestamp, retries)
+            self._store_response(cache_key, response)
             return response
+        except Exception as e:
+            self._raise_call_error(e)
+
+    def _response_cache_key(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any]
+    ) -> Optional[str]:
+        """Digest of everything that shapes the completion, or None if uncacheable.
+
+        Message text is keyed with whitespace runs collapsed, so the same field
+        re-extracted with different OCR line breaks or spacing still hits.
+        """
+        if not self._response_cache_max or temperature > _CACHE_MAX_TEMPERATURE or kwargs.get("stream"):
+            return None
+        normalized = [
+            (message.get("role"), " ".join(str(message.get("content") or "").split()))
+            for message in messages
+        ]
+        material = orjson.dumps(
+            [self.deployment, normalized, temperature, max_tokens, kwargs],
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        )
+        return hashlib.blake2b(material, digest_size=16).hexdigest()
+
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[ChatCompletion]:
+        if cache_key is None:
+            return None
+        response: Optional[ChatCompletion] = self._response_cache.get(cache_key)
+        if response is None:
+            self._cache_misses += 1
+            return None
+        self._cache_hits += 1
+        # Only ChatCompletion objects are cached (never streams), so usage and
+        # model are always present as attributes.
+        usage = response.usage
+        if usage:
+            self._cache_tokens_saved += usage.total_tokens or 0
+        self._last_call_metadata = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "tokens_used": 0,
+            "cached_tokens": 0,
+            "model": response.model or self.deployment,
+            "response_time_ms": 0,
+            "cached": True,
+        }
+        return response
+
+    def _store_response(self, cache_key: Optional[str], response: ChatCompletion) -> None:
+        if cache_key is None:
+            return
+        self._response_cache.set(cache_key, response)
+
+    def get_cache_stats(self) -> Dict[str, int]:
+        """Get response cache hit/miss counters for this client instance."""
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "calls_saved": self._cache_hits,
+            "tokens_saved": self._cache_tokens_saved,
+            "size": len(self._response_cache),
+        }
 
-        except APITimeoutError as e:
+    def _record_response(
+        self,
+        response: Union[ChatCompletion, Stream[ChatCompletionChunk]],
+        call_started_at: float,
+        call_timestamp: str,
+        retries: int = 0
+    ) -> Dict[str, Any]:
+        """Track tokens, cost and call metadata for a completed call; returns the metadata."""
+        elapsed_s = time.monotonic() - call_started_at
+        response_time_ms = int(elapsed_s * 1000)
+        self._latency_s += elapsed_s
+        # ChatCompletion always has usage/model (possibly None); streams have neither.
+        model_name = getattr(response, "model", None) or self.deployment
+        usage = getattr(response, "usage", None)
+        tokens_used = 0
+        prompt_tokens = 0
+        completion_tokens = 0
+        cached_tokens = 0
+        cost = 0.0
+        if usage:
+            tokens_used = usage.total_tokens or 0
+            prompt_tokens = usage.prompt_tokens or 0
+            completion_tokens = usage.completion_tokens or 0
+
+            # Prompt tokens served from Azure's prefix cache (newer API versions only)
+            details = getattr(usage, "prompt_tokens_details", None)
+            if details:
+                cached_tokens = getattr(details, "cached_tokens", 0) or 0
+
+            cost = self._call_cost(model_name, tokens_used, prompt_tokens, completion_tokens, cached_tokens)
+
+            self.total_tokens += tokens_used
+            self.total_cost += cost
+            self._prompt_tokens += prompt_tokens
+            self._completion_tokens += completion_tokens
+            self._cached_tokens += cached_tokens
+
+            LOGGER.info(
+                f"LLM call #{self._call_count}: {tokens_used} tokens, "
+                f"${cost:.4f} (total: ${self.total_cost:.4f})"
+            )
+
+            # Budget alert (LLM_BUDGET_USD), logged once until reset_call_count()
+            if self.total_cost > self.budget_usd and not self._budget_warned:
+                self._budget_warned = True
+                LOGGER.warning(
+                    f"⚠️  LLM cost exceeded ${self.total_cost:.2f}! "
+                    f"Consider reducing calls or checking for runaway usage."
+                )
+
+        # A completion cut off by max_tokens is usually invalid JSON; make it visible.
+        choices = getattr(response, "choices", None)
+        if choices and getattr(choices[0], "finish_reason", None) == "length":
+            LOGGER.warning(
+                "aoai_completion_truncated",
+                extra={"call": self._call_count, "completion_tokens": completion_tokens},
+            )
+
+        call_metadata = {
+            "timestamp": call_timestamp,
+            "tokens_used": tokens_used,
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "cached_tokens": cached_tokens,
+            "fresh_prompt_tokens": prompt_tokens - cached_tokens,
+            "cost_usd": round(cost, 6),
+            "model": model_name,
+            "response_time_ms": response_time_ms,
+            "retries": retries,
+        }
+        self._last_call_metadata = call_metadata
+        self._call_history.append(call_metadata)
+        return call_metadata
+
+    def _call_cost(
+        self, model: Any, tokens_used: int, prompt_tokens: int, completion_tokens: int, cached_tokens: int
+    ) -> float:
+        """USD cost of one call, priced by model; flat cost_per_1k_tokens if the model is unknown."""
+        pricing = _model_pricing(model) if isinstance(model, str) else None
+        if pricing is None:
+            return (tokens_used / 1000) * self.cost_per_1k_tokens
+        return (
+            (prompt_tokens - cached_tokens) * pricing["input"]
+            + cached_tokens * pricing["cached_input"]
+            + completion_tokens * pricing["output"]
+        ) / 1000
+
+    def _raise_call_error(self, e: Exception) -> NoReturn:
+        """Log an SDK failure and re-raise it as RuntimeError."""
+        from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
+
+        if isinstance(e, APITimeoutError):
             error_msg = f"Azure OpenAI API timeout after {self.timeout}s: {str(e)}"
-            LOGGER.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except RateLimitError as e:
+        elif isinstance(e, RateLimitError):
             error_msg = f"Azure OpenAI rate limit exceeded: {str(e)}"
-            LOGGER.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except APIConnectionError as e:
+        elif isinstance(e, APIConnectionError):
             error_msg = f"Azure OpenAI connection error: {str(e)}"
-            LOGGER.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except APIError as e:
+        elif isinstance(e, APIError):
             error_msg = f"Azure OpenAI API error: {str(e)}"
-            LOGGER.error(error_msg)
-            raise RuntimeError(error_msg) from e
-        except Exception as e:
+        else:
             error_msg = f"Unexpected error calling Azure OpenAI: {str(e)}"
             LOGGER.error(error_msg, exc_info=True)
             raise RuntimeError(error_msg) from e
-    
+        LOGGER.error(error_msg)
+        raise RuntimeError(error_msg) from e
+
     def get_call_count(self) -> int:
         """Get the current LLM call count for this client instance."""
         return self._call_count
     
+    def get_retry_count(self) -> int:
+        """Get the number of retried LLM requests for this client instance."""
+        return self._retry_count
+
     def reset_call_count(self):
         """Reset the LLM call counter and cost tracking (useful for per-run tracking)."""
         self._call_count = 0
+        self._retry_count = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_tokens_saved = 0
         self.total_tokens = 0
+        self._prompt_tokens = 0
+        self._completion_tokens = 0
+        self._cached_tokens = 0
+        self._latency_s = 0.0
         self.total_cost = 0.0
+        self._budget_warned = False
         self._last_call_metadata = None
-        self._call_history = []
+        self._call_history.clear()
 
     def get_last_call_metadata(self) -> Optional[Dict[str, Any]]:
         """Get metadata for the most recent LLM call."""
         return self._last_call_metadata
 
     def get_call_history(self) -> List[Dict[str, Any]]:
-        """Get metadata for all LLM calls on this client."""
+        """Get metadata for recent LLM calls on this client (oldest first, up to LLM_CALL_HISTORY_MAX)."""
         return list(self._call_history)
 
     def get_cost_summary(self) -> Dict[str, Any]:
@@ -179,7 +642,9 @@ class AzureOpenAIClient:
         Returns:
             Dictionary with cost metrics including:
             - total_calls: Number of LLM calls made
+            - total_retries: Number of retried requests
             - total_tokens: Total tokens used
+            - cached_prompt_tokens: Prompt tokens served from Azure's prompt cache
             - total_cost_usd: Total cost in USD
             - avg_tokens_per_call: Average tokens per call
             - cost_per_call: Average cost per call
@@ -189,13 +654,38 @@ class AzureOpenAIClient:
 
         return {
             "total_calls": self._call_count,
+            "total_retries": self._retry_count,
             "total_tokens": self.total_tokens,
+            "cached_prompt_tokens": self._cached_tokens,
             "total_cost_usd": round(self.total_cost, 4),
             "avg_tokens_per_call": round(avg_tokens, 2),
             "cost_per_call_usd": round(avg_cost, 4),
-            "budget_threshold_usd": 5.00,
-            "budget_remaining_usd": round(5.00 - self.total_cost, 2),
-            "over_budget": self.total_cost > 5.00
+            "budget_threshold_usd": self.budget_usd,
+            "budget_remaining_usd": round(self.budget_usd - self.total_cost, 2),
+            "over_budget": self.total_cost > self.budget_usd
+        }
+
+    def get_usage_report(self) -> Dict[str, Any]:
+        """
+        Get token and latency telemetry for this client instance.
+
+        Returns:
+            Dictionary with call, retry and response-cache counts, prompt /
+            completion / cached token totals, summed and average call latency,
+            and ``cache_hit_rate`` (share of prompt tokens served from Azure's
+            prompt cache).
+        """
+        return {
+            "calls": self._call_count,
+            "retries": self._retry_count,
+            "response_cache_hits": self._cache_hits,
+            "prompt_tokens": self._prompt_tokens,
+            "completion_tokens": self._completion_tokens,
+            "cached_tokens": self._cached_tokens,
+            "total_tokens": self.total_tokens,
+            "latency_s": round(self._latency_s, 3),
+            "avg_latency_ms": round(self._latency_s * 1000 / max(self._call_count, 1), 1),
+            "cache_hit_rate": round(self._cached_tokens / self._prompt_tokens, 4) if self._prompt_tokens else 0.0,
         }
 
     def resolve_field_conflict(
@@ -220,50 +710,170 @@ class AzureOpenAIClient:
             - confidence: Confidence score (0.0 to 1.0)
             - reasoning: Explanation of why this value was chosen
         """
-        system_prompt = """You are a planning validation assistant. Your task is to resolve field extraction conflicts or missing values by analyzing document context.
+        response = self.chat_completion(
+            messages=self._resolve_messages(field_name, extracted_value, context, validation_issue),
+            max_tokens=_RESOLVE_MAX_TOKENS,
+            **_JSON_CALL_KWARGS
+        )
+        return self._parse_resolution(self._response_content(response))
+
+    async def a_resolve_field_conflict(
+        self,
+        field_name: str,
+        extracted_value: str,
+        context: str,
+        validation_issue: str
+    ) -> Dict[str, Any]:
+        """Async variant of resolve_field_conflict."""
+        response = await self.a_chat_completion(
+            messages=self._resolve_messages(field_name, extracted_value, context, validation_issue),
+            max_tokens=_RESOLVE_MAX_TOKENS,
+            **_JSON_CALL_KWARGS
+        )
+        return self._parse_resolution(self._response_content(response))
+
+    async def a_batch_resolve_field_conflicts(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Run resolve_field_conflict for many items concurrently, preserving input order.
+
+        Unlike resolve_field_conflicts_batch, each item is its own request, so
+        a malformed answer for one field cannot affect the others. At most
+        ``max_concurrency`` requests are in flight at once.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(item: Dict[str, Any]) -> Dict[str, Any]:
+            messages = self._resolve_messages(
+                item["field_name"], item.get("extracted_value"), item["context"], item["validation_issue"]
+            )
+            async with semaphore:
+                response = await self.a_chat_completion(
+                    messages=messages,
+                    max_tokens=_RESOLVE_MAX_TOKENS,
+                    **_JSON_CALL_KWARGS
+                )
+            return self._parse_resolution(self._response_content(response))
+
+        return list(await asyncio.gather(*(run(item) for item in items)))
+
+    @staticmethod
+    def _resolve_messages(
+        field_name: str,
+        extracted_value: Optional[str],
+        context: str,
+        validation_issue: str
+    ) -> List[Dict[str, str]]:
+        user_prompt = (
+            f"{field_name}\n{extracted_value or 'NOT FOUND'}\n{validation_issue}\n---\n{_clip_context(context)}"
+        )
 
-Provide a JSON response with:
-- resolved_value: The best value for the field (or null if truly not found)
-- confidence: A confidence score between 0.0 and 1.0
-- reasoning: A brief explanation of your decision
+        return [
+            {"role": "system", "content": _RESOLVE_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
 
-Be precise and only extract information that is clearly present in the document."""
+    def resolve_field_conflicts_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Resolve several fields with one chat completion instead of one call per field.
 
-        user_prompt = f"""Field: {field_name}
-Extracted value: {extracted_value or "NOT FOUND"}
-Validation issue: {validation_issue}
+        Args:
+            items: Dictionaries with the resolve_field_conflict arguments
+                (field_name, extracted_value, context, validation_issue)
+
+        Returns:
+            One resolve_field_conflict-style result per item, in input order.
+            Large inputs are split into several requests of at most 10 items
+            (or ~6k prompt tokens). If the model returns the wrong number of
+            results for a request, its items are resolved individually instead.
+        """
+        results: List[Dict[str, Any]] = []
+        for chunk in self._resolve_batches(items):
+            results.extend(self._resolve_batch(chunk))
+        return results
 
-Document context:
-{context}
+    @staticmethod
+    def _resolve_batches(items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Split items into request-sized groups, preserving order."""
+        batches: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        size = 0
+        for item in items:
+            item_size = min(len(item["context"] or ""), _CONTEXT_MAX_CHARS) + len(item["validation_issue"] or "")
+            if current and (len(current) >= _RESOLVE_BATCH_MAX_ITEMS or size + item_size > _RESOLVE_BATCH_MAX_CHARS):
+                batches.append(current)
+                current, size = [], 0
+            current.append(item)
+            size += item_size
+        if current:
+            batches.append(current)
+        return batches
 
-Please resolve this field and provide your reasoning."""
+    def _resolve_batch(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        if len(items) <= 1:
+            return [self.resolve_field_conflict(**item) for item in items]
 
+        tasks = [
+            {
+                "field_name": item["field_name"],
+                "extracted_value": item.get("extracted_value") or "NOT FOUND",
+                "validation_issue": item["validation_issue"],
+                "context": _clip_context(item["context"]),
+            }
+            for item in items
+        ]
         response = self.chat_completion(
             messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
+                {"role": "system", "content": _RESOLVE_BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": orjson.dumps({"tasks": tasks}).decode("utf-8")}
             ],
-            temperature=0.2,  # Lower temperature for more deterministic results
-            response_format={"type": "json_object"}  # Request JSON response
+            max_tokens=_RESOLVE_MAX_TOKENS * len(items),
+            **_JSON_CALL_KWARGS
         )
 
-        # Parse the response
-        content = response.choices[0].message.content
-        import json as jsonlib
-        try:
-            result = jsonlib.loads(content)
-            return {
-                "resolved_value": result.get("resolved_value"),
-                "confidence": float(result.get("confidence", 0.5)),
-                "reasoning": result.get("reasoning", "")
-            }
-        except jsonlib.JSONDecodeError:
-            # Fallback if JSON parsing fails
-            return {
-                "resolved_value": content.strip() if content else None,
-                "confidence": 0.5,
-                "reasoning": "LLM response could not be parsed as JSON"
-            }
+        content = self._response_content(response)
+        results = None
+        if content:
+            try:
+                results = orjson.loads(content).get("results")
+            except (orjson.JSONDecodeError, AttributeError):
+                pass
+        if not isinstance(results, list) or len(results) != len(items):
+            LOGGER.warning(
+                "aoai_batch_resolve_fallback",
+                extra={"expected": len(items), "received": len(results) if isinstance(results, list) else None},
+            )
+            return [self.resolve_field_conflict(**item) for item in items]
+        return [self._resolution_from_dict(result if isinstance(result, dict) else {}) for result in results]
+
+    @staticmethod
+    def _resolution_from_dict(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "resolved_value": result.get("resolved_value"),
+            "confidence": _as_confidence(result.get("confidence"), 0.5),
+            "reasoning": result.get("reasoning") or ""
+        }
+
+    @staticmethod
+    def _response_content(response: ChatCompletion) -> Optional[str]:
+        """Text of the first choice, or None when the completion has no choices."""
+        choices = response.choices
+        return choices[0].message.content if choices else None
+
+    @classmethod
+    def _parse_resolution(cls, content: Optional[str]) -> Dict[str, Any]:
+        if content:
+            try:
+                result = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                result = None
+            if isinstance(result, dict):
+                return cls._resolution_from_dict(result)
+        # Fallback if the response is empty or not a JSON object
+        return {
+            "resolved_value": content.strip() if content else None,
+            "confidence": 0.5,
+            "reasoning": "LLM response could not be parsed as JSON"
+        }
 
     def validate_with_llm(
         self,
@@ -288,87 +898,287 @@ Please resolve this field and provide your reasoning."""
             - reasoning: Explanation
             - suggested_value: Optional corrected value
         """
-        system_prompt = """You are a planning validation assistant. Validate extracted fields against planning requirements.
+        response = self.chat_completion(
+            messages=self._validate_messages(field_name, extracted_value, validation_rules, document_context),
+            max_tokens=_VALIDATE_MAX_TOKENS,
+            **_JSON_CALL_KWARGS
+        )
+        return self._parse_validation(self._response_content(response))
 
-Provide a JSON response with:
-- is_valid: Boolean indicating if the field passes validation
-- confidence: Confidence score between 0.0 and 1.0
-- reasoning: Explanation of the validation result
-- suggested_value: Optional corrected value if validation fails but a correction is possible"""
+    async def a_validate_with_llm(
+        self,
+        field_name: str,
+        extracted_value: Any,
+        validation_rules: str,
+        document_context: str
+    ) -> Dict[str, Any]:
+        """Async variant of validate_with_llm."""
+        response = await self.a_chat_completion(
+            messages=self._validate_messages(field_name, extracted_value, validation_rules, document_context),
+            max_tokens=_VALIDATE_MAX_TOKENS,
+            **_JSON_CALL_KWARGS
+        )
+        return self._parse_validation(self._response_content(response))
 
-        user_prompt = f"""Field: {field_name}
-Extracted value: {extracted_value}
+    @staticmethod
+    def _validate_messages(
+        field_name: str,
+        extracted_value: Any,
+        validation_rules: str,
+        document_context: str
+    ) -> List[Dict[str, str]]:
+        user_prompt = (
+            f"{field_name}\n{extracted_value}\n---\n{validation_rules}\n---\n{_clip_context(document_context)}"
+        )
 
-Validation rules:
-{validation_rules}
+        return [
+            {"role": "system", "content": _VALIDATE_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
 
-Document context:
-{document_context}
+    @staticmethod
+    def _parse_validation(content: Optional[str]) -> Dict[str, Any]:
+        if content:
+            try:
+                result = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                result = None
+            if isinstance(result, dict):
+                return {
+                    "is_valid": _as_bool(result.get("is_valid", False)),
+                    "confidence": _as_confidence(result.get("confidence"), 0.5),
+                    "reasoning": result.get("reasoning") or "",
+                    "suggested_value": result.get("suggested_value")
+                }
+        return {
+            "is_valid": False,
+            "confidence": 0.3,
+            "reasoning": "LLM response could not be parsed",
+            "suggested_value": None
+        }
 
-Please validate this field and provide your assessment."""
+    def chat_json(self, payload: dict, max_tokens: int = _CHAT_JSON_MAX_TOKENS) -> dict:
+        """
+        Call AOAI with a JSON-structured prompt and return parsed JSON response.
 
+        Args:
+            payload: Dictionary containing the task/request to send to LLM
+            max_tokens: Completion token cap
+
+        Returns:
+            Parsed JSON dictionary from LLM response
+        """
         response = self.chat_completion(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"}
+            messages=self._chat_json_messages(payload),
+            max_tokens=max_tokens,
+            **_JSON_CALL_KWARGS
         )
+        return self._parse_chat_json(self._response_content(response))
+
+    def _open_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: Optional[int],
+        **kwargs
+    ) -> Tuple[Stream[ChatCompletionChunk], Dict[str, Any]]:
+        """Start a streamed completion; returns the stream and its call metadata.
+
+        Streams bypass the response cache and carry no usage, so only the
+        call count, retries and timing are recorded.
+        """
+        self._call_count += 1
+        call_started_at = time.monotonic()
+        call_timestamp = datetime.now(timezone.utc).isoformat()
 
-        content = response.choices[0].message.content
-        import json as jsonlib
         try:
-            result = jsonlib.loads(content)
-            return {
-                "is_valid": result.get("is_valid", False),
-                "confidence": float(result.get("confidence", 0.5)),
-                "reasoning": result.get("reasoning", ""),
-                "suggested_value": result.get("suggested_value")
-            }
-        except jsonlib.JSONDecodeError:
-            return {
-                "is_valid": False,
-                "confidence": 0.3,
-                "reasoning": "LLM response could not be parsed",
-                "suggested_value": None
-            }
+            stream: Stream[ChatCompletionChunk]
+            stream, retries = self._with_retry(
+                self.client.chat.completions.create,
+                model=self.deployment,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                **kwargs
+            )
+        except Exception as e:
+            self._raise_call_error(e)
+        return stream, self._record_response(stream, call_started_at, call_timestamp, retries)
+
+    def chat_completion_stream(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> Generator[str, None, None]:
+        """
+        Stream a chat completion, yielding content deltas as they arrive.
 
-    def chat_json(self, payload: dict) -> dict:
+        The call's metadata gains ``ttft_ms`` (time to first token) and its
+        ``response_time_ms`` becomes the time to the last token. Closing the
+        generator early closes the underlying HTTP stream.
+
+        Raises:
+            RuntimeError: If the API call fails after retries or times out
         """
-        Call AOAI with a JSON-structured prompt and return parsed JSON response.
+        started_at = time.monotonic()
+        stream, metadata = self._open_stream(messages, temperature, max_tokens, **kwargs)
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                if "ttft_ms" not in metadata:
+                    metadata["ttft_ms"] = int((time.monotonic() - started_at) * 1000)
+                yield delta
+        finally:
+            metadata["response_time_ms"] = int((time.monotonic() - started_at) * 1000)
+            stream.close()
+
+    def chat_json_streaming(
+        self,
+        payload: dict,
+        early_exit_key: Optional[str] = None,
+        max_tokens: int = _CHAT_JSON_MAX_TOKENS
+    ) -> dict:
+        """
+        Streaming variant of chat_json that parses the response as tokens arrive.
 
         Args:
             payload: Dictionary containing the task/request to send to LLM
+            early_exit_key: Optional top-level key with a scalar value. As soon as
+                its value has been streamed, the stream is closed and only
+                ``{early_exit_key: value}`` is returned.
+            max_tokens: Completion token cap
 
         Returns:
-            Parsed JSON dictionary from LLM response
+            Parsed JSON dictionary from LLM response (or the early-exit subset)
         """
-        system_prompt = """You are a planning validation assistant. Analyze the provided task and return a valid JSON response following the specified schema.
+        deltas = self.chat_completion_stream(
+            messages=self._chat_json_messages(payload),
+            max_tokens=max_tokens,
+            **_JSON_CALL_KWARGS
+        )
 
-Be precise and only extract information that is clearly present in the evidence provided."""
+        buffer = bytearray()
+        events = ijson.sendable_list()
+        parser = ijson.parse_coro(events, use_float=True)
+        try:
+            for delta in deltas:
+                data = delta.encode("utf-8")
+                buffer += data
+                if early_exit_key is None:
+                    continue
+                try:
+                    parser.send(data)
+                except ijson.JSONError:
+                    # Not valid JSON so far; finish the stream and use the fallback parse.
+                    early_exit_key = None
+                    continue
+                for prefix, event, value in events:
+                    if prefix == early_exit_key and event in _SCALAR_EVENTS:
+                        return {early_exit_key: value}
+                del events[:]
+        finally:
+            deltas.close()
 
-        import json as jsonlib
-        user_prompt = jsonlib.dumps(payload, indent=2)
+        return self._parse_chat_json(buffer.decode("utf-8") or None)
 
-        response = self.chat_completion(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"}
+    async def a_chat_json(self, payload: dict, max_tokens: int = _CHAT_JSON_MAX_TOKENS) -> dict:
+        """Async variant of chat_json."""
+        response = await self.a_chat_completion(
+            messages=self._chat_json_messages(payload),
+            max_tokens=max_tokens,
+            **_JSON_CALL_KWARGS
         )
+        return self._parse_chat_json(self._response_content(response))
+
+    async def a_batch_chat_json(
+        self,
+        payloads: List[dict],
+        client: Optional[openai.AsyncAzureOpenAI] = None
+    ) -> List[dict]:
+        """
+        Run chat_json for many payloads concurrently, preserving input order.
+
+        At most ``max_concurrency`` requests (AZURE_OPENAI_MAX_CONCURRENCY) are in
+        flight at once so the fan-out stays inside the deployment's rate limit.
+        ``client`` overrides the shared async client (see batch_chat_json).
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(payload: dict) -> dict:
+            # Only the round-trip holds a concurrency slot: the prompt is encoded
+            # before acquiring it and the reply parsed after releasing it, so the
+            # next queued request starts as soon as a response lands.
+            messages = self._chat_json_messages(payload)
+            async with semaphore:
+                response = await self.a_chat_completion(
+                    messages=messages,
+                    max_tokens=_CHAT_JSON_MAX_TOKENS,
+                    client=client,
+                    **_JSON_CALL_KWARGS
+                )
+            return self._parse_chat_json(self._response_content(response))
+
+        return list(await asyncio.gather(*(run(payload) for payload in payloads)))
+
+    def batch_chat_json(self, payloads: List[dict]) -> List[dict]:
+        """
+        Synchronous entry point for a_batch_chat_json.
+
+        Args:
+            payloads: Task dictionaries, one per LLM request
+
+        Returns:
+            Parsed JSON responses in the same order as ``payloads``
 
-        content = response.choices[0].message.content
-        import json as jsonlib
+        Raises:
+            RuntimeError: If called from a running event loop (await
+                a_batch_chat_json there instead) or if any call fails
+        """
         try:
-            return jsonlib.loads(content)
-        except jsonlib.JSONDecodeError:
-            return {
-                "error": "LLM response could not be parsed as JSON",
-                "raw_response": content
-            }
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError("batch_chat_json cannot run inside an event loop; await a_batch_chat_json instead")
+
+        async def run_batch() -> List[dict]:
+            # The shared async client's pool belongs to the serving loop (see
+            # api/main.py), so this throwaway loop gets a client of its own
+            client = self._new_async_client()
+            try:
+                return await self.a_batch_chat_json(payloads, client=client)
+            finally:
+                await client.close()
+
+        return asyncio.run(run_batch())
+
+    @staticmethod
+    def _chat_json_messages(payload: dict) -> List[Dict[str, str]]:
+        # Compact output: indentation only adds prompt tokens.
+        user_prompt = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+        return [
+            {"role": "system", "content": _CHAT_JSON_SYSTEM_PROMPT},
+            {"role": "user", "content": user_prompt}
+        ]
+
+    @staticmethod
+    def _parse_chat_json(content: Optional[str]) -> dict:
+        if content:
+            try:
+                parsed: dict = orjson.loads(content)
+                return parsed
+            except orjson.JSONDecodeError:
+                pass
+        return {
+            "error": "LLM response could not be parsed as JSON",
+            "raw_response": content
+        }
 
     def chat_json_with_metadata(self, payload: dict) -> Dict[str, Any]:
         """
@@ -380,32 +1190,159 @@ Be precise and only extract information that is clearly present in the evidence
         Returns:
             Dictionary with parsed response data and call metadata.
         """
-        system_prompt = """You are a planning validation assistant. Analyze the provided task and return a valid JSON response following the specified schema.
+        return {
+            "data": self.chat_json(payload),
+            "metadata": self.get_last_call_metadata()
+        }
+
+    def submit_batch(self, payloads: List[dict], max_tokens: int = _CHAT_JSON_MAX_TOKENS) -> str:
+        """
+        Submit chat_json payloads to the Azure OpenAI Batch API.
 
-Be precise and only extract information that is clearly present in the evidence provided."""
+        Batch jobs are billed at half price and complete within 24 hours
+        without using the deployment's synchronous rate limit, which suits
+        non-interactive backfills. Needs a Global Batch deployment and
+        AZURE_OPENAI_API_VERSION 2024-07-01-preview or later.
 
-        import json as jsonlib
-        user_prompt = jsonlib.dumps(payload, indent=2)
+        Args:
+            payloads: Task dictionaries, one per LLM request
+            max_tokens: Completion token cap per request
 
-        response = self.chat_completion(
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_prompt}
-            ],
-            temperature=0.2,
-            response_format={"type": "json_object"}
-        )
+        Returns:
+            Batch ID for poll_batch / fetch_batch_results
 
-        content = response.choices[0].message.content
+        Raises:
+            RuntimeError: If the upload or batch creation fails
+        """
+        lines = [
+            orjson.dumps({
+                "custom_id": str(index),
+                "method": "POST",
+                "url": "/chat/completions",
+                "body": {
+                    "model": self.deployment,
+                    "messages": self._chat_json_messages(payload),
+                    "max_tokens": max_tokens,
+                    **_JSON_CALL_KWARGS,
+                },
+            })
+            for index, payload in enumerate(payloads)
+        ]
         try:
-            parsed = jsonlib.loads(content)
-        except jsonlib.JSONDecodeError:
-            parsed = {
-                "error": "LLM response could not be parsed as JSON",
-                "raw_response": content
-            }
+            input_file, _ = self._with_retry(
+                self.client.files.create,
+                file=("planproof_batch.jsonl", b"\n".join(lines)),
+                purpose="batch",
+            )
+            batch, _ = self._with_retry(
+                self.client.post,
+                path="/batches",
+                body={"input_file_id": input_file.id, "endpoint": "/chat/completions", "completion_window": "24h"},
+                cast_to=object,
+            )
+        except Exception as e:
+            self._raise_call_error(e)
+        batch_id: str = batch["id"]
+        LOGGER.info("aoai_batch_submitted", extra={"batch_id": batch_id, "requests": len(payloads)})
+        return batch_id
 
+    def poll_batch(self, batch_id: str) -> Dict[str, Any]:
+        """
+        Get the status of a submitted batch.
+
+        Returns:
+            Dictionary with id, status (validating, in_progress, finalizing,
+            completed, failed, expired, cancelled...), request_counts,
+            output_file_id and error_file_id
+        """
+        try:
+            batch, _ = self._with_retry(self.client.get, path=f"/batches/{batch_id}", cast_to=object)
+        except Exception as e:
+            self._raise_call_error(e)
         return {
-            "data": parsed,
-            "metadata": self.get_last_call_metadata()
+            "id": batch.get("id", batch_id),
+            "status": batch.get("status"),
+            "request_counts": batch.get("request_counts") or {},
+            "output_file_id": batch.get("output_file_id"),
+            "error_file_id": batch.get("error_file_id"),
         }
+
+    def fetch_batch_results(self, batch_id: str) -> List[dict]:
+        """
+        Download and parse the results of a completed batch.
+
+        Returns:
+            One chat_json-style result per submitted payload, in submission
+            order. Requests that failed in the batch come back as
+            ``{"error": ..., "raw_response": None}``. Token usage is added to
+            this client's counters and billed at the 50% batch rate.
+
+        Raises:
+            RuntimeError: If the batch has not completed or the download fails
+        """
+        status = self.poll_batch(batch_id)
+        if status["status"] != "completed":
+            raise RuntimeError(f"Azure OpenAI batch {batch_id} is not complete (status: {status['status']})")
+
+        by_index: Dict[int, dict] = {}
+        if status["output_file_id"]:
+            try:
+                output, _ = self._with_retry(self.client.files.content, file_id=status["output_file_id"])
+            except Exception as e:
+                self._raise_call_error(e)
+            for line in output.content.splitlines():
+                if line.strip():
+                    record = orjson.loads(line)
+                    by_index[int(record["custom_id"])] = self._batch_result(record)
+
+        total = max(status["request_counts"].get("total") or 0, max(by_index, default=-1) + 1)
+        failed = {"error": "Batch request failed", "raw_response": None}
+        return [by_index.get(index, dict(failed)) for index in range(total)]
+
+    def _batch_result(self, record: Dict[str, Any]) -> dict:
+        """Parse one line of a batch output file into a chat_json-style result."""
+        response = record.get("response") or {}
+        body = response.get("body") or {}
+        if response.get("status_code") != 200 or record.get("error"):
+            return {"error": "Batch request failed", "raw_response": orjson.dumps(body).decode("utf-8")}
+        self._record_batch_usage(body)
+        choices = body.get("choices") or []
+        content = (choices[0].get("message") or {}).get("content") if choices else None
+        return self._parse_chat_json(content)
+
+    def _record_batch_usage(self, body: Dict[str, Any]) -> None:
+        """Add one batch response's tokens and (discounted) cost to the counters."""
+        usage = body.get("usage") or {}
+        prompt_tokens = usage.get("prompt_tokens") or 0
+        completion_tokens = usage.get("completion_tokens") or 0
+        tokens_used = usage.get("total_tokens") or prompt_tokens + completion_tokens
+        cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        cost = _BATCH_PRICE_FACTOR * self._call_cost(
+            body.get("model") or self.deployment, tokens_used, prompt_tokens, completion_tokens, cached_tokens
+        )
+        self.total_tokens += tokens_used
+        self._prompt_tokens += prompt_tokens
+        self._completion_tokens += completion_tokens
+        self._cached_tokens += cached_tokens
+        self.total_cost += cost
+
+
+@lru_cache(maxsize=8)
+def get_aoai_client(
+    endpoint: Optional[str] = None,
+    api_key: Optional[str] = None,
+    api_version: Optional[str] = None,
+    deployment: Optional[str] = None
+) -> AzureOpenAIClient:
+    """Get a shared AzureOpenAIClient for the given configuration.
+
+    Clients are cached per argument set, so repeated callers reuse one
+    connection pool instead of paying a new TCP/TLS handshake. Call counters
+    and the response cache are shared by everyone using the returned client.
+    """
+    return AzureOpenAIClient(
+        endpoint=endpoint,
+        api_key=api_key,
+        api_version=api_version,
+        deployment=deployment
+    )
@@ -0,0 +1,105 @@
+"""
+Response cache backends for AzureOpenAIClient.
+
+InMemoryLRU keeps responses for the lifetime of one client. DiskCache persists
+them in a SQLite file so repeated validation runs over the same documents are
+answered without another Azure OpenAI round-trip.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Protocol
+
+import orjson
+
+
+class CacheBackend(Protocol):
+    """Key/value store used by AzureOpenAIClient for exact-match responses."""
+
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    def set(self, key: str, value: Any) -> None:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+
+class InMemoryLRU:
+    """Bounded in-process cache; evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """SQLite-backed cache of ChatCompletion responses shared across processes.
+
+    Responses are stored as JSON (``model_dump``) and rebuilt with
+    ``ChatCompletion.model_validate`` on read. Once ``maxsize`` entries are
+    stored, the oldest writes are evicted first.
+    """
+
+    def __init__(self, directory: str, maxsize: int) -> None:
+        path = Path(directory).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path / "responses.sqlite3"), check_same_thread=False)
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value BLOB NOT NULL)")
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        from openai.types.chat import ChatCompletion
+
+        return ChatCompletion.model_validate(orjson.loads(row[0]))
+
+    def set(self, key: str, value: Any) -> None:
+        data = orjson.dumps(value.model_dump(mode="json"))
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", (key, data))
+            self._conn.execute(
+                "DELETE FROM responses WHERE rowid NOT IN "
+                "(SELECT rowid FROM responses ORDER BY rowid DESC LIMIT ?)",
+                (self._maxsize,),
+            )
+
+    def delete(self, key: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        return count
@@ -5,6 +5,7 @@ Authentication is now enabled via JWT tokens or API keys.
 Configure via environment variables: JWT_SECRET_KEY, API_KEYS
 """
 
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime, timedelta, timezone
 from fastapi import Header, HTTPException, Depends, status
@@ -15,28 +16,44 @@ import jwt
 from planproof.db import Database
 from planproof.storage import StorageClient
 from planproof.docintel import DocumentIntelligence
-from planproof.aoai import AzureOpenAIClient
+from planproof.aoai import AzureOpenAIClient, get_aoai_client as get_shared_aoai_client
 from planproof.config import get_settings
 
 
+# Clients are process-wide singletons: building one per request would create a
+# fresh SQLAlchemy engine / HTTP connection pool (and TLS handshakes) each time.
+@lru_cache(maxsize=1)
 def get_db() -> Database:
-    """Get database instance."""
+    """Get the shared database instance."""
     return Database()
 
 
+@lru_cache(maxsize=1)
 def get_storage_client() -> StorageClient:
-    """Get storage client instance."""
+    """Get the shared storage client instance."""
     return StorageClient()
 
 
+@lru_cache(maxsize=1)
 def get_docintel_client() -> DocumentIntelligence:
-    """Get Document Intelligence client instance."""
+    """Get the shared Document Intelligence client instance."""
     return DocumentIntelligence()
 
 
 def get_aoai_client() -> AzureOpenAIClient:
-    """Get Azure OpenAI client instance."""
-    return AzureOpenAIClient()
+    """Get the shared Azure OpenAI client instance."""
+    return get_shared_aoai_client()
+
+
+async def get_async_aoai_client() -> AzureOpenAIClient:
+    """Get the shared Azure OpenAI client for async routes.
+
+    Resolved on the event loop rather than the threadpool. Use the client's
+    ``a_*`` methods (a_resolve_field_conflict, a_chat_json, ...) so LLM calls
+    are awaited instead of blocking the loop. Its async connection pool is
+    created at startup and closed at shutdown (see api/main.py).
+    """
+    return get_shared_aoai_client()
 
 
 # ============================================================================
@@ -46,6 +63,17 @@ def get_aoai_client() -> AzureOpenAIClient:
 security = HTTPBearer(auto_error=False)
 
 
+@lru_cache(maxsize=4096)
+def _decode_jwt(token: str, secret_key: str, algorithm: str) -> dict:
+    """Verify a token's signature once; clients resend the same token per request.
+
+    Only successful decodes are cached. Expiry is re-checked by the caller on
+    every request.
+    """
+    payload: dict = jwt.decode(token, secret_key, algorithms=[algorithm])
+    return payload
+
+
 async def verify_api_key(
     x_api_key: Optional[str] = Header(None, description="API Key for authentication")
 ) -> Optional[str]:
@@ -103,11 +131,7 @@ async def verify_jwt_token(
     token = credentials.credentials
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm]
-        )
+        payload = _decode_jwt(token, settings.jwt_secret_key, settings.jwt_algorithm)
 
         # Check expiration
         exp = payload.get("exp")
@@ -9,13 +9,17 @@ Authentication: All endpoints require authentication via JWT token or API key.
 - If neither is configured, authentication is bypassed (MVP mode only)
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+from planproof.aoai import get_aoai_client
 from planproof.config import get_settings
 from .routes import applications, documents, validation, health, runs, review, auth
 from .dependencies import get_current_user
@@ -25,8 +29,21 @@ settings = get_settings()
 # Initialize rate limiter
 limiter = Limiter(key_func=get_remote_address, default_limits=["100/minute"])
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Create the shared LLM client's async pool on the serving event loop and
+    # close it there on shutdown.
+    aoai = get_aoai_client()
+    aoai.open_async_pool()
+    yield
+    await aoai.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     title="PlanProof API",
     description="AI-powered planning application validation system",
     version="1.0.0",
@@ -39,6 +56,9 @@ app = FastAPI(
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
+# Compress larger JSON payloads (application lists, run history)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # CORS middleware - restrict to configured origins
 # Configure allowed origins via API_CORS_ORIGINS environment variable
 # Format: comma-separated list, e.g., "http://localhost:3000,https://app.example.com"
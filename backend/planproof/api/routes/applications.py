@@ -2,16 +2,94 @@
 Application Management Endpoints
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+import threading
+import time
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple, cast
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import func
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import selectinload
 
 from planproof.api.dependencies import get_db, get_current_user
 from planproof.db import Database, Application, Submission, Run, Document, ValidationCheck, ExtractedField
 
 router = APIRouter()
 
+# List pages are polled by dashboards and tolerate a few seconds of staleness,
+# so each (skip, limit, user) page is served from memory for a short TTL.
+# Creating an application clears the cache.
+_LIST_CACHE_TTL_S = 15.0
+_list_cache: Dict[Tuple[int, int, Optional[str]], Tuple[float, list]] = {}
+_list_cache_lock = threading.Lock()
+
+
+def _cached_list_page(key: Tuple[int, int, Optional[str]]) -> Optional[list]:
+    with _list_cache_lock:
+        entry = _list_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del _list_cache[key]
+            return None
+        return entry[1]
+
+
+def _store_list_page(key: Tuple[int, int, Optional[str]], results: list) -> None:
+    now = time.monotonic()
+    with _list_cache_lock:
+        for stale_key in [k for k, (expires, _) in _list_cache.items() if expires <= now]:
+            del _list_cache[stale_key]
+        _list_cache[key] = (now + _LIST_CACHE_TTL_S, results)
+
+
+def clear_list_cache() -> None:
+    """Drop all cached application list pages."""
+    with _list_cache_lock:
+        _list_cache.clear()
+
+
+def _backfill_from_extraction(
+    db: Database,
+    application_id: int,
+    submission_id: Optional[int],
+    site_address: Optional[str],
+    proposal_description: Optional[str],
+    applicant_name: Optional[str],
+    application_type: Optional[str]
+) -> None:
+    """Fill empty Application / Submission fields from the latest extraction.
+
+    Runs after the details response is sent. Each table gets one conditional
+    UPDATE that only touches columns that are still empty, so concurrent
+    edits made since the read are not overwritten.
+    """
+    session = db.get_session()
+    try:
+        values: Dict[Any, Any] = {}
+        for column, extracted in (
+            (Application.site_address, site_address),
+            (Application.proposal_description, proposal_description),
+            (Application.applicant_name, applicant_name),
+        ):
+            if extracted:
+                values[column] = func.coalesce(func.nullif(column, ''), extracted)
+        if values:
+            session.query(Application).filter(
+                Application.id == application_id
+            ).update(values, synchronize_session=False)
+
+        if application_type and submission_id is not None:
+            session.query(Submission).filter(
+                Submission.id == submission_id,
+                or_(Submission.application_type.is_(None),
+                    Submission.application_type.in_(['', 'unknown']))
+            ).update({Submission.application_type: application_type}, synchronize_session=False)
+
+        session.commit()
+    finally:
+        session.close()
+
 
 class ApplicationResponse(BaseModel):
     """Application response model."""
@@ -33,7 +111,7 @@ class ApplicationCreateRequest(BaseModel):
 
 
 @router.get("/applications")
-async def list_applications(
+def list_applications(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: Database = Depends(get_db),
@@ -46,60 +124,85 @@ async def list_applications(
     - skip: Number of records to skip (pagination)
     - limit: Maximum number of records to return
     """
+    cache_key = (skip, limit, user.get("user_id"))
+    cached = _cached_list_page(cache_key)
+    if cached is not None:
+        return cached
+
     session = db.get_session()
     try:
-        # Fix N+1 query: Use a single query with join and group_by
-        apps_with_counts = session.query(
-            Application,
+        # One round-trip for the whole page: submission counts, run counts and
+        # each application's latest run come from pre-aggregated subqueries.
+        submission_counts = session.query(
+            Submission.planning_case_id.label('application_id'),
             func.count(Submission.id).label('submission_count')
+        ).group_by(Submission.planning_case_id).subquery()
+
+        run_counts = session.query(
+            Run.application_id,
+            func.count(Run.id).label('run_count')
+        ).group_by(Run.application_id).subquery()
+
+        ranked_runs = session.query(
+            Run.application_id,
+            Run.id,
+            Run.status,
+            func.row_number().over(
+                partition_by=Run.application_id,
+                order_by=(Run.started_at.desc(), Run.id.desc())
+            ).label('rn')
+        ).subquery()
+
+        rows = session.query(
+            Application,
+            func.coalesce(submission_counts.c.submission_count, 0),
+            ranked_runs.c.id,
+            ranked_runs.c.status,
+            func.coalesce(run_counts.c.run_count, 0)
         ).outerjoin(
-            Submission,
-            Submission.planning_case_id == Application.id
-        ).group_by(
-            Application.id
-        ).offset(skip).limit(limit).all()
+            submission_counts,
+            submission_counts.c.application_id == Application.id
+        ).outerjoin(
+            ranked_runs,
+            and_(ranked_runs.c.application_id == Application.id, ranked_runs.c.rn == 1)
+        ).outerjoin(
+            run_counts,
+            run_counts.c.application_id == Application.id
+        ).order_by(Application.id).offset(skip).limit(limit).all()
 
         results = []
-        for app, submission_count in apps_with_counts:
-            # Get latest run for this application
-            latest_run = session.query(Run).filter(
-                Run.application_id == app.id
-            ).order_by(Run.started_at.desc()).first()
-            
-            # Count total runs for this application
-            run_count = session.query(func.count(Run.id)).filter(
-                Run.application_id == app.id
-            ).scalar() or 0
-            
+        for app, submission_count, latest_run_id, latest_run_status, run_count in rows:
             # Determine status from latest run
             status = "unknown"
-            if latest_run:
-                if latest_run.status == "completed":
+            if latest_run_id is not None:
+                if latest_run_status == "completed":
                     status = "completed"
-                elif latest_run.status == "failed":
+                elif latest_run_status == "failed":
                     status = "issues"
-                elif latest_run.status in ["pending", "running"]:
+                elif latest_run_status in ["pending", "running"]:
                     status = "processing"
             
-            results.append(ApplicationResponse(
+            # Values come straight from typed columns; skip per-row validation
+            results.append(ApplicationResponse.model_construct(
                 id=app.id,
                 application_ref=app.application_ref,
                 applicant_name=app.applicant_name,
                 created_at=app.created_at.isoformat() if app.created_at else None,
                 updated_at=app.updated_at.isoformat() if app.updated_at else None,
                 submission_count=submission_count,
-                latest_run_id=latest_run.id if latest_run else None,
+                latest_run_id=latest_run_id,
                 run_count=run_count,
                 status=status
             ))
 
+        _store_list_page(cache_key, results)
         return results
     finally:
         session.close()
 
 
 @router.get("/applications/{application_ref}")
-async def get_application(
+def get_application(
     application_ref: str,
     db: Database = Depends(get_db),
     user: dict = Depends(get_current_user)
@@ -112,34 +215,31 @@ async def get_application(
     """
     session = db.get_session()
     try:
-        app = session.query(Application).filter(
+        app = session.query(Application).options(
+            selectinload(Application.submissions)
+        ).filter(
             Application.application_ref == application_ref
         ).first()
         
         if not app:
             raise HTTPException(status_code=404, detail="Application not found")
         
-        # Get submissions
-        submissions = session.query(Submission).filter(
-            Submission.planning_case_id == app.id
-        ).all()
-        
         return {
             "id": app.id,
             "application_ref": app.application_ref,
             "applicant_name": app.applicant_name,
-            "application_date": app.application_date.isoformat() if app.application_date else None,
-            "created_at": app.created_at.isoformat() if app.created_at else None,
-            "updated_at": app.updated_at.isoformat() if app.updated_at else None,
+            "application_date": app.application_date,
+            "created_at": app.created_at,
+            "updated_at": app.updated_at,
             "submissions": [
                 {
                     "id": sub.id,
                     "version": sub.submission_version,
                     "status": sub.status,
                     "application_type": sub.application_type,
-                    "created_at": sub.created_at.isoformat() if sub.created_at else None
+                    "created_at": sub.created_at
                 }
-                for sub in submissions
+                for sub in app.submissions
             ]
         }
     finally:
@@ -147,8 +247,9 @@ async def get_application(
 
 
 @router.get("/applications/id/{application_id}")
-async def get_application_details(
+def get_application_details(
     application_id: int,
+    background_tasks: BackgroundTasks,
     db: Database = Depends(get_db),
     user: dict = Depends(get_current_user)
 ):
@@ -169,51 +270,58 @@ async def get_application_details(
         if not app:
             raise HTTPException(status_code=404, detail="Application not found")
         
-        # Get all runs for this application (most recent first)
-        runs = session.query(Run).filter(
+        # Get all runs for this application (most recent first), with their
+        # documents loaded in one extra query rather than one per run
+        runs = session.query(Run).options(
+            selectinload(Run.documents)
+        ).filter(
             Run.application_id == application_id
         ).order_by(Run.started_at.desc()).all()
         
-        run_history = []
+        run_document_ids = {}
         for run in runs:
             document_ids = [doc.id for doc in run.documents] if run.documents else []
             if not document_ids and run.document_id:
                 document_ids = [run.document_id]
+            run_document_ids[run.id] = document_ids
+
+        # Count validation checks by document and status for every run at once
+        all_document_ids = {doc_id for ids in run_document_ids.values() for doc_id in ids}
+        check_counts: DefaultDict[int, DefaultDict[str, int]] = defaultdict(lambda: defaultdict(int))
+        if all_document_ids:
+            status_counts = session.query(
+                ValidationCheck.document_id,
+                ValidationCheck.status,
+                func.count(ValidationCheck.id)
+            ).filter(
+                ValidationCheck.document_id.in_(all_document_ids)
+            ).group_by(
+                ValidationCheck.document_id,
+                ValidationCheck.status
+            ).all()
+            for document_id, check_status, count in status_counts:
+                check_counts[document_id][check_status] += count
+
+        run_history = []
+        for run in runs:
+            document_ids = run_document_ids[run.id]
+            summary = {"pass": 0, "fail": 0, "warning": 0, "needs_review": 0}
+            for document_id in set(document_ids):
+                for check_status, count in check_counts.get(document_id, {}).items():
+                    if check_status in summary:
+                        summary[check_status] += count
 
-            # Count validation checks by status
-            checks_pass = session.query(func.count(ValidationCheck.id)).filter(
-                ValidationCheck.document_id.in_(document_ids),
-                ValidationCheck.status == 'pass'
-            ).scalar() if document_ids else 0
-            
-            checks_fail = session.query(func.count(ValidationCheck.id)).filter(
-                ValidationCheck.document_id.in_(document_ids),
-                ValidationCheck.status == 'fail'
-            ).scalar() if document_ids else 0
-            
-            checks_warning = session.query(func.count(ValidationCheck.id)).filter(
-                ValidationCheck.document_id.in_(document_ids),
-                ValidationCheck.status == 'warning'
-            ).scalar() if document_ids else 0
-            
-            checks_needs_review = session.query(func.count(ValidationCheck.id)).filter(
-                ValidationCheck.document_id.in_(document_ids),
-                ValidationCheck.status == 'needs_review'
-            ).scalar() if document_ids else 0
-            
             run_history.append({
                 "id": run.id,
-                "created_at": run.started_at.isoformat() if run.started_at else None,
+                "created_at": run.started_at,
                 "status": run.status,
                 "has_documents": len(document_ids) > 0,  # Needed for compare runs feature
-                "validation_summary": {
-                    "pass": checks_pass,
-                    "fail": checks_fail,
-                    "warning": checks_warning,
-                    "needs_review": checks_needs_review
-                }
+                "validation_summary": summary
             })
         
+        # Determine overall status from latest run
+        latest_status = runs[0].status if runs else "unknown"
+
         latest_submission = session.query(Submission).filter(
             Submission.planning_case_id == application_id
         ).order_by(Submission.created_at.desc()).first()
@@ -236,37 +344,39 @@ async def get_application_details(
         extracted_applicant = _get_latest_field_value(["applicant_name"])
         extracted_application_type = _get_latest_field_value(["application_type"])
 
-        # Update Application record if we have better data from extraction
-        if extracted_address and not app.site_address:
-            app.site_address = extracted_address
-        if extracted_proposal and not app.proposal_description:
-            app.proposal_description = extracted_proposal
-        if extracted_applicant and not app.applicant_name:
-            app.applicant_name = extracted_applicant
-        if extracted_application_type and latest_submission and (
-            not latest_submission.application_type or latest_submission.application_type == "unknown"
+        application_type = cast(
+            Optional[str], latest_submission.application_type if latest_submission else None
+        )
+        missing_type = application_type in (None, "", "unknown")
+        if extracted_application_type and missing_type:
+            application_type = extracted_application_type
+
+        # Persist better data from extraction after responding, keeping this GET read-only
+        if (
+            (extracted_address and not app.site_address)
+            or (extracted_proposal and not app.proposal_description)
+            or (extracted_applicant and not app.applicant_name)
+            or (extracted_application_type and latest_submission and missing_type)
         ):
-            latest_submission.application_type = extracted_application_type
-            session.commit()
-        
-        if extracted_address or extracted_proposal or extracted_applicant:
-            session.commit()
+            background_tasks.add_task(
+                _backfill_from_extraction,
+                db,
+                application_id,
+                cast(Optional[int], latest_submission.id) if latest_submission else None,
+                extracted_address,
+                extracted_proposal,
+                extracted_applicant,
+                extracted_application_type
+            )
 
-        # Determine overall status from latest run
-        latest_status = runs[0].status if runs else "unknown"
-        
         return {
             "id": app.id,
             "reference_number": app.application_ref,
             "address": app.site_address or extracted_address or "Not available",
             "proposal": app.proposal_description or extracted_proposal or "Not available",
             "applicant_name": app.applicant_name or extracted_applicant or "Unknown",
-            "application_type": (
-                latest_submission.application_type
-                if latest_submission and latest_submission.application_type
-                else extracted_application_type or "unknown"
-            ),
-            "created_at": app.created_at.isoformat() if app.created_at else None,
+            "application_type": application_type or "unknown",
+            "created_at": app.created_at,
             "status": latest_status,
             "run_history": run_history
         }
@@ -275,7 +385,7 @@ async def get_application_details(
 
 
 @router.post("/applications")
-async def create_application(
+def create_application(
     request: ApplicationCreateRequest,
     db: Database = Depends(get_db),
     user: dict = Depends(get_current_user)
@@ -308,7 +418,7 @@ async def create_application(
                 "id": existing.id,
                 "application_ref": existing.application_ref,
                 "applicant_name": existing.applicant_name,
-                "created_at": existing.created_at.isoformat() if existing.created_at else None,
+                "created_at": existing.created_at,
                 "message": "Using existing application",
                 "existed": True
             }
@@ -318,12 +428,13 @@ async def create_application(
             application_ref=request.application_ref,
             applicant_name=request.applicant_name
         )
+        clear_list_cache()
         
         return {
             "id": app.id,
             "application_ref": app.application_ref,
             "applicant_name": app.applicant_name,
-            "created_at": app.created_at.isoformat() if app.created_at else None,
+            "created_at": app.created_at,
             "message": "Application created successfully",
             "existed": False
         }
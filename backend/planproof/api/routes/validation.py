@@ -130,14 +130,28 @@ def _build_findings_map(
 def _load_extraction_fields(
     session,
     storage: StorageClient,
-    documents: List[Document]
+    documents: List[Document],
+    run_id: Optional[int] = None
 ) -> Dict[str, Dict[str, Any]]:
+    """Extracted fields per document, preferring each document's extraction from ``run_id``.
+
+    Runs that re-extract identical content share one blob but each record
+    their own artefact row, so a document's latest row may belong to a
+    later run; documents without a row for ``run_id`` fall back to it.
+    """
     fields_map: Dict[str, Dict[str, Any]] = {}
     for doc in documents:
-        extraction_artefact = session.query(Artefact).filter(
+        extraction_artefacts = session.query(Artefact).filter(
             Artefact.document_id == doc.id,
             Artefact.artefact_type == "extraction"
-        ).order_by(Artefact.created_at.desc()).first()
+        ).order_by(Artefact.created_at.desc()).all()
+        extraction_artefact = next(
+            (
+                artefact for artefact in extraction_artefacts
+                if run_id is not None and (artefact.artefact_metadata or {}).get("run_id") == run_id
+            ),
+            extraction_artefacts[0] if extraction_artefacts else None,
+        )
         if not extraction_artefact or not extraction_artefact.blob_uri:
             continue
         parsed = _parse_blob_uri(extraction_artefact.blob_uri)
@@ -709,8 +723,8 @@ async def compare_runs(
                     "to_status": status_b,
                 })
 
-        fields_a = _load_extraction_fields(session, storage, documents_a)
-        fields_b = _load_extraction_fields(session, storage, documents_b)
+        fields_a = _load_extraction_fields(session, storage, documents_a, run_id_a)
+        fields_b = _load_extraction_fields(session, storage, documents_b, run_id_b)
 
         documents_a_by_signature: Dict[Tuple[str, str, str], List[Document]] = defaultdict(list)
         documents_b_by_signature: Dict[Tuple[str, str, str], List[Document]] = defaultdict(list)
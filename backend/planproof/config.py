@@ -49,6 +49,7 @@ class Settings(BaseSettings):
     azure_openai_api_key: str = Field(..., alias="AZURE_OPENAI_API_KEY")
     azure_openai_api_version: str = Field(default="2024-02-15-preview", alias="AZURE_OPENAI_API_VERSION")
     azure_openai_chat_deployment: str = Field(..., alias="AZURE_OPENAI_CHAT_DEPLOYMENT")
+    azure_openai_max_concurrency: int = Field(default=8, alias="AZURE_OPENAI_MAX_CONCURRENCY")
 
     # Optional: Logging
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
@@ -69,6 +70,10 @@ class Settings(BaseSettings):
     llm_context_max_blocks: int = Field(default=80, alias="LLM_CONTEXT_MAX_BLOCKS")
     llm_field_context_max_chars: int = Field(default=4000, alias="LLM_FIELD_CONTEXT_MAX_CHARS")
     llm_field_context_max_blocks: int = Field(default=30, alias="LLM_FIELD_CONTEXT_MAX_BLOCKS")
+    llm_response_cache_size: int = Field(default=1024, alias="LLM_RESPONSE_CACHE_SIZE")
+    llm_response_cache_dir: Optional[str] = Field(default=None, alias="LLM_RESPONSE_CACHE_DIR")
+    llm_call_history_max: int = Field(default=1000, alias="LLM_CALL_HISTORY_MAX")
+    llm_budget_usd: float = Field(default=5.0, alias="LLM_BUDGET_USD")
 
     # Retry policy
     azure_retry_max_attempts: int = Field(default=3, alias="AZURE_RETRY_MAX_ATTEMPTS")
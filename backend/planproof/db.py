@@ -9,7 +9,7 @@ import json
 
 import psycopg
 from psycopg.rows import dict_row
-from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON, Float, ForeignKey, Boolean, Enum as SQLEnum, func
+from sqlalchemy import create_engine, Column, Integer, String, Text, DateTime, JSON, Float, ForeignKey, Boolean, Enum as SQLEnum, Index, func
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session, relationship
 from geoalchemy2 import Geometry
@@ -281,6 +281,15 @@ class ValidationCheck(Base):
     evidence_feedback = relationship("EvidenceFeedback", back_populates="validation_check", cascade="all, delete-orphan")
 
 
+# Per-run status counts group checks by document and status
+Index(
+    "ix_validation_checks_document_status",
+    ValidationCheck.document_id,
+    ValidationCheck.status,
+    postgresql_include=["id"],
+)
+
+
 class Artefact(Base):
     """Extracted JSON artefacts from document processing."""
     __tablename__ = "artefacts"
@@ -288,7 +297,8 @@ class Artefact(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
     document_id = Column(Integer, ForeignKey("documents.id"), nullable=False, index=True)
     artefact_type = Column(String(50), nullable=False)  # e.g., "extracted_layout", "structured_data"
-    blob_uri = Column(String(500), nullable=False, unique=True, index=True)
+    # Not unique: every run that reuses a content-addressed extraction blob gets its own row
+    blob_uri = Column(String(500), nullable=False, index=True)
     created_at = Column(DateTime(timezone=True), default=utcnow, nullable=False)
     artefact_metadata = Column(JSON, nullable=True)  # Additional metadata about the artefact (renamed from metadata to avoid SQLAlchemy conflict)
 
@@ -376,6 +386,10 @@ class Run(Base):
     documents = relationship("Document", secondary="run_documents", viewonly=True)
 
 
+# Run history and "latest run" lookups filter by application, newest first
+Index("ix_runs_application_started", Run.application_id, Run.started_at.desc())
+
+
 class RunDocument(Base):
     """Join table linking runs to multiple documents."""
     __tablename__ = "run_documents"
@@ -1092,6 +1106,55 @@ class Database:
         finally:
             session.close()
 
+    def create_artefact_records(
+        self,
+        records: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Create several artefact records in a single transaction.
+
+        Args:
+            records: Dicts with the create_artefact_record arguments
+                (document_id, artefact_type, blob_uri, optional metadata)
+
+        Returns:
+            List of artefact detail dictionaries, in input order
+
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        session = self.get_session()
+        try:
+            artefacts = [
+                Artefact(
+                    document_id=record["document_id"],
+                    artefact_type=record["artefact_type"],
+                    blob_uri=record["blob_uri"],
+                    artefact_metadata=record.get("metadata") or {}
+                )
+                for record in records
+            ]
+            session.add_all(artefacts)
+            # Flush assigns ids and created_at; no per-row refresh needed after commit
+            session.flush()
+            created = [
+                {
+                    "id": artefact.id,
+                    "document_id": artefact.document_id,
+                    "artefact_type": artefact.artefact_type,
+                    "blob_uri": artefact.blob_uri,
+                    "created_at": artefact.created_at.isoformat() if artefact.created_at else None
+                }
+                for artefact in artefacts
+            ]
+            session.commit()
+            return created
+        except Exception as e:
+            session.rollback()
+            error_msg = f"Failed to create artefact records: {str(e)}"
+            raise RuntimeError(error_msg) from e
+        finally:
+            session.close()
+
     def link_document_to_run(self, run_id: int, document_id: int):
         """Link a document to a run by creating a RunDocument entry.
 
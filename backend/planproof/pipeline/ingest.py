@@ -77,11 +77,8 @@ def ingest_pdf(
 
     # Compute content hash for deduplication (streaming for large files)
     try:
-        hasher = hashlib.sha256()
         with open(pdf_path_obj, "rb") as handle:
-            for chunk in iter(lambda: handle.read(4 * 1024 * 1024), b""):
-                hasher.update(chunk)
-        content_hash = hasher.hexdigest()
+            content_hash = hashlib.file_digest(handle, "sha256").hexdigest()
         LOGGER.debug(f"Computed content hash for {pdf_path_obj.name}: {content_hash[:16]}...")
     except (IOError, OSError) as e:
         error_msg = f"Failed to read PDF file {pdf_path} for hashing: {str(e)}"
@@ -85,8 +85,9 @@ def resolve_with_llm(
         # Build document context
         context = _build_document_context(extraction_result, docintel)
 
-        resolution_results = []
-
+        # Select fields needing resolution; missing/failed values are resolved
+        # together in one batched LLM call, low-confidence values are validated.
+        pending = []
         for vr in validation_results:
             # Determine if LLM resolution is needed
             needs_resolution = (
@@ -100,16 +101,32 @@ def resolve_with_llm(
 
             # Get relevant context for this field
             field_context = _get_field_context(vr.field_name, extraction_result, context)
+            pending.append((vr, field_context))
+
+        to_resolve = [
+            i for i, (vr, _) in enumerate(pending)
+            if vr.extracted_value is None or vr.status == ValidationStatus.FAIL
+        ]
+        items = [
+            {
+                "field_name": pending[i][0].field_name,
+                "extracted_value": pending[i][0].extracted_value or "",
+                "context": pending[i][1],
+                "validation_issue": pending[i][0].error_message or "Field validation failed",
+            }
+            for i in to_resolve
+        ]
+        resolutions = dict(zip(
+            to_resolve, aoai_client.resolve_field_conflicts_batch(items), strict=True
+        ))
 
+        resolution_results = []
+
+        for i, (vr, field_context) in enumerate(pending):
             # Resolve with LLM
-            if vr.extracted_value is None or vr.status == ValidationStatus.FAIL:
-                # Missing or failed - try to resolve
-                resolution = aoai_client.resolve_field_conflict(
-                    field_name=vr.field_name,
-                    extracted_value=vr.extracted_value or "",
-                    context=field_context,
-                    validation_issue=vr.error_message or "Field validation failed"
-                )
+            resolution = resolutions.get(i)
+            if resolution is not None:
+                # Missing or failed - resolved in the batch above
 
                 # Update validation result
                 vr.extracted_value = resolution.get("resolved_value") or vr.extracted_value
@@ -300,6 +317,10 @@ def should_trigger_llm(
         submission_id: Submission ID for submission-level cache lookup (optional, preferred)
         db: Database instance for cache lookup (optional)
     """
+    # Cheapest check first: nothing to resolve means no cache lookups either
+    if not validation.get("summary", {}).get("needs_llm"):
+        return False
+
     resolved_fields = resolved_fields or {}
     
     # If submission_id is provided, check submission-level cache (preferred)
@@ -312,10 +333,6 @@ def should_trigger_llm(
         app_resolved = db.get_resolved_fields_for_application(application_ref)
         resolved_fields = {**app_resolved, **resolved_fields}  # Merge, current submission takes precedence
     
-    # Check if needs_llm flag is set
-    if not validation.get("summary", {}).get("needs_llm"):
-        return False
-    
     # Get document type
     doc_type = extraction.get("fields", {}).get("document_type", "unknown")
     
@@ -5,16 +5,111 @@ This service processes user actions (document uploads, selections, explanations)
 triggers revalidation, and tracks resolution progress.
 """
 
-import json
+import hashlib
+import os
 import shutil
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple
-from datetime import datetime
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
+from datetime import datetime, timezone
 import logging
+import threading
+import time
+from collections import Counter
+
+import orjson
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Chunk size used when streaming uploaded files to disk
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Maximum concurrent file writes in process_bulk_document_upload
+BULK_UPLOAD_WORKERS = 8
+
+
+@dataclass(slots=True)
+class ResolutionAction:
+    """One recorded resolution action; slotted to keep long histories compact."""
+    action_type: str
+    issue_id: Optional[str] = None
+    ts_ns: Optional[int] = None
+    timestamp: Optional[str] = None  # Legacy records carry an ISO string instead of ts_ns
+    document_type: Optional[str] = None
+    filename: Optional[str] = None
+    original_name: Optional[str] = None
+    file_path: Optional[str] = None
+    selected_option: Optional[str] = None
+    option_label: Optional[str] = None
+    explanation: Optional[str] = None
+    officer_id: Optional[str] = None
+    reason: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ResolutionAction":
+        """Build an action from a persisted record, ignoring unknown keys."""
+        return cls(**{key: value for key, value in data.items() if key in _ACTION_FIELDS})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to a plain record, omitting unset fields."""
+        return {
+            name: value
+            for name in _ACTION_FIELDS
+            if (value := getattr(self, name)) is not None
+        }
+
+
+_ACTION_FIELDS = tuple(f.name for f in fields(ResolutionAction))
+
+
+def _with_iso_timestamp(action: Union[ResolutionAction, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the action as a record with its ``ts_ns`` rendered as ``timestamp``."""
+    record = action.to_dict() if isinstance(action, ResolutionAction) else action
+    if "timestamp" in record or "ts_ns" not in record:
+        return record
+    rendered = dict(record)
+    rendered["timestamp"] = datetime.fromtimestamp(
+        record["ts_ns"] / 1e9, tz=timezone.utc
+    ).isoformat()
+    return rendered
+
+
+def _fadvise(fd: int, advice_name: str) -> None:
+    """Apply a posix_fadvise hint where the platform supports it."""
+    advice = getattr(os, advice_name, None)
+    if advice is None or not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+
+def _link_or_copy(source: Path, dest: Path) -> None:
+    """Hard-link ``dest`` to ``source``, copying where links are unsupported."""
+    if dest.exists():
+        dest.unlink()
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copyfile(source, dest)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a rename by fsyncing its directory (not supported on Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
 
 class ResolutionService:
     """Service for managing issue resolution lifecycle."""
@@ -30,39 +125,212 @@ class ResolutionService:
         self.run_dir = Path(f"./runs/{run_id}")
         self.inputs_dir = self.run_dir / "inputs"
         self.outputs_dir = self.run_dir / "outputs"
-        self.resolution_file = self.outputs_dir / "resolutions.json"
+        self.content_dir = self.run_dir / "content"  # Uploads stored by SHA-256
+        self.resolution_file = self.outputs_dir / "resolutions.json"  # Legacy full snapshot
+        self.actions_file = self.outputs_dir / "actions.ndjson"
+        self.issues_file = self.outputs_dir / "issues.json"
         
         # Ensure directories exist
         self.inputs_dir.mkdir(parents=True, exist_ok=True)
         self.outputs_dir.mkdir(parents=True, exist_ok=True)
+        self.content_dir.mkdir(parents=True, exist_ok=True)
         
         # Load existing resolutions
         self.resolutions = self._load_resolutions()
+        self._dirty = False
     
     def _load_resolutions(self) -> Dict[str, Any]:
-        """Load resolution history from file."""
+        """
+        Load resolution history from disk.
+
+        Actions are replayed from the append-only ``actions.ndjson`` log and
+        issue state from the ``issues.json`` snapshot. A legacy
+        ``resolutions.json`` is still honoured as the starting point.
+
+        The snapshot holds per-issue state only; an issue's actions are read
+        from the log (see ``get_issue_status``).
+        """
+        resolutions: Dict[str, Any] = {"actions": [], "issues": {}}
+        
         if self.resolution_file.exists():
             try:
-                with open(self.resolution_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                legacy = orjson.loads(self.resolution_file.read_bytes())
+                resolutions["actions"] = [
+                    ResolutionAction.from_dict(action) for action in legacy.get("actions", [])
+                ]
+                resolutions["issues"] = legacy.get("issues", {})
             except Exception as e:
                 logger.warning(f"Could not load resolutions: {e}")
-                return {"actions": [], "issues": {}}
-        return {"actions": [], "issues": {}}
+        
+        if self.issues_file.exists():
+            try:
+                resolutions["issues"] = orjson.loads(self.issues_file.read_bytes())
+            except Exception as e:
+                logger.warning(f"Could not load issue snapshot: {e}")
+        
+        # Older snapshots embedded each issue's full action history
+        for issue in resolutions["issues"].values():
+            actions_taken = issue.pop("actions_taken", None)
+            if actions_taken is not None:
+                issue.setdefault("action_count", len(actions_taken))
+        
+        resolutions["actions"].extend(self._iter_logged_actions())
+
+        # Snapshots written before action counts were kept get them from the log
+        if any("action_count" not in issue for issue in resolutions["issues"].values()):
+            counts = Counter(action.issue_id for action in resolutions["actions"])
+            for issue_id, issue in resolutions["issues"].items():
+                issue.setdefault("action_count", counts[issue_id])
+        return resolutions
+    
+    def _iter_logged_actions(self) -> Iterator[ResolutionAction]:
+        """Stream action records from the append-only log."""
+        if not self.actions_file.exists():
+            return
+        try:
+            with open(self.actions_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield ResolutionAction.from_dict(orjson.loads(line))
+        except Exception as e:
+            logger.warning(f"Could not read action log: {e}")
+    
+    def _append_action(self, action_record: ResolutionAction) -> None:
+        """Record an action in memory and append it to the action log."""
+        self.resolutions["actions"].append(action_record)
+        try:
+            with open(self.actions_file, 'ab') as f:
+                f.write(orjson.dumps(action_record.to_dict()) + b"\n")
+        except Exception as e:
+            logger.error(f"Could not append action: {e}")
+    
+    def _count_issue_action(self, issue_id: str) -> None:
+        """Bump the issue's action count; the actions themselves live in the log."""
+        issue = self.resolutions["issues"][issue_id]
+        issue["action_count"] = issue.get("action_count", 0) + 1
     
     def _save_resolutions(self) -> None:
-        """Save resolution history to file."""
+        """Mark issue state as changed and write the snapshot immediately."""
+        self._dirty = True
+        self.flush()
+    
+    def flush(self) -> None:
+        """
+        Write the issue snapshot if it changed since the last flush.
+
+        Actions are persisted by ``_append_action``; bulk operations defer
+        the snapshot so it is written and fsynced once per batch.
+        """
+        if not self._dirty:
+            return
         try:
-            with open(self.resolution_file, 'w', encoding='utf-8') as f:
-                json.dump(self.resolutions, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and rename over the snapshot so a crash
+            # never leaves a torn issues.json behind
+            tmp_file = self.issues_file.with_name(self.issues_file.name + ".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(self.resolutions["issues"], option=orjson.OPT_INDENT_2))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.issues_file)
+            _fsync_dir(self.outputs_dir)
+            self._dirty = False
         except Exception as e:
             logger.error(f"Could not save resolutions: {e}")
     
+    def _save_upload(self, uploaded_file: Any) -> Tuple[str, Path]:
+        """
+        Write an uploaded file into the run's inputs directory.
+        
+        Returns:
+            (stored filename, path written)
+        """
+        # Generate filename
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        original_name = uploaded_file.name
+        safe_name = "".join(c if c.isalnum() or c in "._- " else "_" for c in original_name)
+        filename = f"{timestamp}_{safe_name}"
+        
+        # Save file to inputs directory
+        file_path = self.inputs_dir / filename
+        
+        # Stream in chunks (hashing as we go) rather than materialising the upload
+        if hasattr(uploaded_file, "seek"):
+            uploaded_file.seek(0)
+        digest = hashlib.sha256()
+        fd, tmp_name = tempfile.mkstemp(dir=self.content_dir, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                _fadvise(f.fileno(), "POSIX_FADV_SEQUENTIAL")
+                while chunk := uploaded_file.read(UPLOAD_CHUNK_SIZE):
+                    digest.update(chunk)
+                    f.write(chunk)
+                f.flush()
+                # Written once and not re-read here; don't let it crowd the page cache
+                _fadvise(f.fileno(), "POSIX_FADV_DONTNEED")
+            
+            # Identical uploads share one stored copy
+            content_path = self.content_dir / f"{digest.hexdigest()}{Path(safe_name).suffix}"
+            if content_path.exists():
+                os.unlink(tmp_name)
+            else:
+                os.replace(tmp_name, content_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        
+        _link_or_copy(content_path, file_path)
+        
+        logger.info(f"Saved uploaded file: {file_path}")
+        return filename, file_path
+    
+    def _record_upload(
+        self,
+        original_name: str,
+        document_type: str,
+        issue_id: str,
+        filename: str,
+        file_path: Path
+    ) -> Dict[str, Any]:
+        """Record a saved upload against its issue and return the result."""
+        action_record = ResolutionAction(
+            action_type="document_upload",
+            ts_ns=time.time_ns(),
+            issue_id=issue_id,
+            document_type=document_type,
+            filename=filename,
+            original_name=original_name,
+            file_path=str(file_path)
+        )
+        
+        self._append_action(action_record)
+        
+        # Update issue status
+        if issue_id not in self.resolutions["issues"]:
+            self.resolutions["issues"][issue_id] = {
+                "status": "in_progress",
+                "action_count": 0,
+                "recheck_pending": True
+            }
+        
+        self._count_issue_action(issue_id)
+        self.resolutions["issues"][issue_id]["recheck_pending"] = True
+        self.resolutions["issues"][issue_id]["last_action"] = datetime.now().isoformat()
+        self._dirty = True
+        
+        return {
+            "success": True,
+            "filename": filename,
+            "file_path": str(file_path),
+            "message": f"Successfully uploaded {original_name}"
+        }
+    
     def process_document_upload(
         self,
         uploaded_file: Any,
         document_type: str,
-        issue_id: str
+        issue_id: str,
+        autosave: bool = True
     ) -> Dict[str, Any]:
         """
         Process a document upload action.
@@ -71,58 +339,22 @@ class ResolutionService:
             uploaded_file: Streamlit UploadedFile object
             document_type: Type of document being uploaded
             issue_id: Issue this resolves
+            autosave: Write the issue snapshot now; pass False when the caller
+                flushes once after a batch
             
         Returns:
             Result dictionary with status and new document info
         """
         try:
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            original_name = uploaded_file.name
-            safe_name = "".join(c if c.isalnum() or c in "._- " else "_" for c in original_name)
-            filename = f"{timestamp}_{safe_name}"
-            
-            # Save file to inputs directory
-            file_path = self.inputs_dir / filename
-            
-            with open(file_path, "wb") as f:
-                f.write(uploaded_file.getbuffer())
-            
-            logger.info(f"Saved uploaded file: {file_path}")
-            
-            # Record action
-            action_record = {
-                "timestamp": datetime.now().isoformat(),
-                "action_type": "document_upload",
-                "issue_id": issue_id,
-                "document_type": document_type,
-                "filename": filename,
-                "original_name": original_name,
-                "file_path": str(file_path)
-            }
-            
-            self.resolutions["actions"].append(action_record)
-            
-            # Update issue status
-            if issue_id not in self.resolutions["issues"]:
-                self.resolutions["issues"][issue_id] = {
-                    "status": "in_progress",
-                    "actions_taken": [],
-                    "recheck_pending": True
-                }
-            
-            self.resolutions["issues"][issue_id]["actions_taken"].append(action_record)
-            self.resolutions["issues"][issue_id]["recheck_pending"] = True
-            self.resolutions["issues"][issue_id]["last_action"] = datetime.now().isoformat()
+            filename, file_path = self._save_upload(uploaded_file)
+            result = self._record_upload(
+                uploaded_file.name, document_type, issue_id, filename, file_path
+            )
             
-            self._save_resolutions()
+            if autosave:
+                self.flush()
             
-            return {
-                "success": True,
-                "filename": filename,
-                "file_path": str(file_path),
-                "message": f"Successfully uploaded {original_name}"
-            }
+            return result
         
         except Exception as e:
             logger.error(f"Error processing upload: {e}")
@@ -139,6 +371,9 @@ class ResolutionService:
         """
         Process multiple document uploads at once.
         
+        Files are written concurrently; actions are then recorded in upload
+        order and the issue snapshot is flushed once.
+        
         Args:
             uploads: List of (uploaded_file, document_type) tuples
             issue_ids: List of issue IDs this resolves
@@ -146,16 +381,38 @@ class ResolutionService:
         Returns:
             Result dictionary with batch processing results
         """
+        from concurrent.futures import ThreadPoolExecutor
+        
         results = []
         success_count = 0
         
-        for uploaded_file, document_type in uploads:
-            # Process each upload
-            result = self.process_document_upload(
-                uploaded_file,
-                document_type,
-                issue_id=f"bulk_{document_type}"
-            )
+        # The same file object may appear more than once; serialise its reads
+        file_locks = {id(uploaded_file): threading.Lock() for uploaded_file, _ in uploads}
+        
+        def save(uploaded_file: Any) -> Tuple[str, Path]:
+            with file_locks[id(uploaded_file)]:
+                return self._save_upload(uploaded_file)
+        
+        worker_count = max(1, min(BULK_UPLOAD_WORKERS, len(uploads)))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            futures = [executor.submit(save, uploaded_file) for uploaded_file, _ in uploads]
+        
+        for (uploaded_file, document_type), future in zip(uploads, futures, strict=True):
+            try:
+                filename, file_path = future.result()
+                result = self._record_upload(
+                    uploaded_file.name,
+                    document_type,
+                    f"bulk_{document_type}",
+                    filename,
+                    file_path
+                )
+            except Exception as e:
+                logger.error(f"Error processing upload: {e}")
+                result = {
+                    "success": False,
+                    "error": str(e)
+                }
             
             results.append({
                 "filename": uploaded_file.name,
@@ -171,7 +428,7 @@ class ResolutionService:
             if issue_id not in self.resolutions["issues"]:
                 self.resolutions["issues"][issue_id] = {
                     "status": "in_progress",
-                    "actions_taken": [],
+                    "action_count": 0,
                     "recheck_pending": True
                 }
             self.resolutions["issues"][issue_id]["recheck_pending"] = True
@@ -204,24 +461,24 @@ class ResolutionService:
             Result dictionary
         """
         try:
-            action_record = {
-                "timestamp": datetime.now().isoformat(),
-                "action_type": "option_selection",
-                "issue_id": issue_id,
-                "selected_option": selected_option,
-                "option_label": option_label
-            }
+            action_record = ResolutionAction(
+                action_type="option_selection",
+                ts_ns=time.time_ns(),
+                issue_id=issue_id,
+                selected_option=selected_option,
+                option_label=option_label
+            )
             
-            self.resolutions["actions"].append(action_record)
+            self._append_action(action_record)
             
             # Update issue status
             if issue_id not in self.resolutions["issues"]:
                 self.resolutions["issues"][issue_id] = {
                     "status": "awaiting_verification",
-                    "actions_taken": []
+                    "action_count": 0
                 }
             
-            self.resolutions["issues"][issue_id]["actions_taken"].append(action_record)
+            self._count_issue_action(issue_id)
             self.resolutions["issues"][issue_id]["selected_value"] = selected_option
             self.resolutions["issues"][issue_id]["status"] = "awaiting_verification"
             self.resolutions["issues"][issue_id]["last_action"] = datetime.now().isoformat()
@@ -256,23 +513,23 @@ class ResolutionService:
             Result dictionary
         """
         try:
-            action_record = {
-                "timestamp": datetime.now().isoformat(),
-                "action_type": "explanation_provided",
-                "issue_id": issue_id,
-                "explanation": explanation_text
-            }
+            action_record = ResolutionAction(
+                action_type="explanation_provided",
+                ts_ns=time.time_ns(),
+                issue_id=issue_id,
+                explanation=explanation_text
+            )
             
-            self.resolutions["actions"].append(action_record)
+            self._append_action(action_record)
             
             # Update issue status
             if issue_id not in self.resolutions["issues"]:
                 self.resolutions["issues"][issue_id] = {
                     "status": "awaiting_verification",
-                    "actions_taken": []
+                    "action_count": 0
                 }
             
-            self.resolutions["issues"][issue_id]["actions_taken"].append(action_record)
+            self._count_issue_action(issue_id)
             self.resolutions["issues"][issue_id]["explanation"] = explanation_text
             self.resolutions["issues"][issue_id]["status"] = "awaiting_verification"
             self.resolutions["issues"][issue_id]["last_action"] = datetime.now().isoformat()
@@ -298,17 +555,18 @@ class ResolutionService:
         Returns:
             List of issue IDs with recheck_pending=True
         """
-        pending = []
-        for issue_id, data in self.resolutions["issues"].items():
-            if data.get("recheck_pending", False):
-                pending.append(issue_id)
-        return pending
+        return [
+            issue_id
+            for issue_id, data in self.resolutions["issues"].items()
+            if data.get("recheck_pending", False)
+        ]
     
     def mark_issue_rechecked(
         self,
         issue_id: str,
         new_status: str,
-        recheck_result: Optional[Dict[str, Any]] = None
+        recheck_result: Optional[Dict[str, Any]] = None,
+        autosave: bool = True
     ) -> None:
         """
         Mark an issue as rechecked and update its status.
@@ -317,6 +575,8 @@ class ResolutionService:
             issue_id: Issue that was rechecked
             new_status: New status (resolved, still_open, etc.)
             recheck_result: Optional result data from recheck
+            autosave: Write the issue snapshot now; pass False when the caller
+                flushes once after a batch
         """
         if issue_id in self.resolutions["issues"]:
             self.resolutions["issues"][issue_id]["recheck_pending"] = False
@@ -326,7 +586,23 @@ class ResolutionService:
             if recheck_result:
                 self.resolutions["issues"][issue_id]["recheck_result"] = recheck_result
             
-            self._save_resolutions()
+            self._dirty = True
+            if autosave:
+                self.flush()
+    
+    def get_issue_snapshot(self, issue_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an issue's stored state without reading its action history.
+        
+        Args:
+            issue_id: Issue to check
+            
+        Returns:
+            Copy of the issue's state (``status``, ``action_count``, recheck
+            flags) or None
+        """
+        issue = self.resolutions["issues"].get(issue_id)
+        return dict(issue) if issue is not None else None
     
     def get_issue_status(self, issue_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -336,13 +612,23 @@ class ResolutionService:
             issue_id: Issue to check
             
         Returns:
-            Issue status dictionary or None
+            Issue status dictionary (with ``actions_taken`` read from the
+            action log, rendered like ``get_all_actions``) or None
         """
-        return self.resolutions["issues"].get(issue_id)
+        issue = self.resolutions["issues"].get(issue_id)
+        if issue is None:
+            return None
+        return {
+            **issue,
+            "actions_taken": [
+                _with_iso_timestamp(action) for action in self.resolutions["actions"]
+                if action.issue_id == issue_id
+            ],
+        }
     
     def get_all_actions(self) -> List[Dict[str, Any]]:
-        """Get all actions taken in this run."""
-        return self.resolutions.get("actions", [])
+        """Get all actions taken in this run, with ISO timestamps rendered."""
+        return [_with_iso_timestamp(action) for action in self.resolutions.get("actions", [])]
     
     def dismiss_issue(
         self,
@@ -362,24 +648,24 @@ class ResolutionService:
             Result dictionary
         """
         try:
-            action_record = {
-                "timestamp": datetime.now().isoformat(),
-                "action_type": "dismissed",
-                "issue_id": issue_id,
-                "officer_id": officer_id,
-                "reason": reason
-            }
+            action_record = ResolutionAction(
+                action_type="dismissed",
+                ts_ns=time.time_ns(),
+                issue_id=issue_id,
+                officer_id=officer_id,
+                reason=reason
+            )
             
-            self.resolutions["actions"].append(action_record)
+            self._append_action(action_record)
             
             # Update issue status
             if issue_id not in self.resolutions["issues"]:
                 self.resolutions["issues"][issue_id] = {
                     "status": "dismissed",
-                    "actions_taken": []
+                    "action_count": 0
                 }
             
-            self.resolutions["issues"][issue_id]["actions_taken"].append(action_record)
+            self._count_issue_action(issue_id)
             self.resolutions["issues"][issue_id]["status"] = "dismissed"
             self.resolutions["issues"][issue_id]["dismissed_by"] = officer_id
             self.resolutions["issues"][issue_id]["dismissal_reason"] = reason
@@ -439,15 +725,16 @@ class AutoRecheckEngine:
         results = []
         
         for issue_id in pending_issues:
-            issue_status = self.resolution_service.get_issue_status(issue_id)
+            issue = self.resolution_service.get_issue_snapshot(issue_id)
             
             # Check if action was taken
-            if issue_status and issue_status.get("actions_taken"):
+            if issue and issue.get("action_count"):
                 # Simulate successful resolution
                 self.resolution_service.mark_issue_rechecked(
                     issue_id,
                     "resolved",
-                    {"simulated": True, "note": "Revalidation would run here"}
+                    {"simulated": True, "note": "Revalidation would run here"},
+                    autosave=False
                 )
                 
                 results.append({
@@ -462,6 +749,8 @@ class AutoRecheckEngine:
                     "message": "No action taken yet"
                 })
         
+        self.resolution_service.flush()
+        
         return {
             "success": True,
             "issues_checked": len(pending_issues),
@@ -572,7 +861,7 @@ class DependencyResolver:
             all_resolved = True
             
             for blocker in blocking:
-                status = resolution_service.get_issue_status(blocker)
+                status = resolution_service.get_issue_snapshot(blocker)
                 if not status or status.get("status") != "resolved":
                     all_resolved = False
                     break
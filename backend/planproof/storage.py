@@ -4,14 +4,22 @@ Azure Blob Storage helpers for PDF uploads and JSON artefact storage.
 
 import os
 import time
+import hashlib
 import logging
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from pathlib import Path
 from datetime import datetime
 
+import orjson
+
 from planproof.config import get_settings
 
 
+def _json_bytes(obj: dict) -> bytes:
+    """Serialize an artefact to indented UTF-8 JSON (int keys become strings, as with json)."""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+
 class StorageClient:
     """Client for Azure Blob Storage operations."""
 
@@ -122,7 +130,6 @@ class StorageClient:
         Returns:
             Blob URI
         """
-        import json as json_module
         from azure.storage.blob import ContentSettings
         from azure.core.exceptions import ResourceExistsError
 
@@ -138,7 +145,7 @@ class StorageClient:
                 f"Blob already exists: {blob_name}. Use overwrite=True to replace."
             )
 
-        json_bytes = json_module.dumps(artefact_data, indent=2, ensure_ascii=False).encode("utf-8")
+        json_bytes = _json_bytes(artefact_data)
         content_settings = ContentSettings(content_type="application/json")
         self._with_retry(
             "write_artefact",
@@ -275,7 +282,6 @@ class StorageClient:
         Returns:
             Blob URI
         """
-        import json as json_module
         from azure.storage.blob import ContentSettings
         from azure.core.exceptions import ResourceExistsError
         
@@ -288,7 +294,7 @@ class StorageClient:
                 f"Blob already exists: {blob_path}. Use overwrite=True to replace."
             )
         
-        json_bytes = json_module.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+        json_bytes = _json_bytes(obj)
         content_settings = ContentSettings(content_type="application/json")
         self._with_retry(
             "write_json_blob",
@@ -300,6 +306,74 @@ class StorageClient:
         
         return self.get_blob_uri(container, blob_path)
 
+    def put_if_absent(self, container: str, blob_path: str, data: bytes, content_type: str = "application/json") -> bool:
+        """
+        Upload bytes only if the blob does not exist yet.
+
+        A HEAD is tried first so a hit never sends the payload; the PUT itself is
+        conditional (If-None-Match: *) so concurrent writers cannot clobber each other.
+
+        Args:
+            container: Container name
+            blob_path: Blob path/name
+            data: Bytes to upload
+            content_type: Content type to store with the blob
+
+        Returns:
+            True if this call created the blob, False if it already existed
+        """
+        from azure.storage.blob import ContentSettings
+        from azure.core.exceptions import ResourceExistsError
+
+        blob_path = blob_path.lstrip("/")
+        if self.blob_exists(container, blob_path):
+            return False
+
+        blob_client = self.client.get_blob_client(container=container, blob=blob_path)
+        content_settings = ContentSettings(content_type=content_type)
+
+        def _upload() -> bool:
+            try:
+                blob_client.upload_blob(data, overwrite=False, content_settings=content_settings)
+            except ResourceExistsError:
+                return False
+            return True
+
+        created: bool = self._with_retry("put_if_absent", _upload)
+        return created
+
+    def write_json_content_blob(
+        self,
+        container: str,
+        prefix: str,
+        obj: dict,
+        digest_exclude: Tuple[str, ...] = (),
+    ) -> Tuple[str, str, bool]:
+        """
+        Write a JSON object under a content-addressed name (``<prefix>/<blake2b>.json``).
+
+        Identical payloads map to the same blob, so rewriting one is a HEAD, not a PUT.
+
+        Args:
+            container: Container name (e.g., "artefacts")
+            prefix: Blob path prefix (e.g., "content")
+            obj: Dictionary to serialize as JSON
+            digest_exclude: Top-level keys (e.g. timestamps) left out of the content hash;
+                the first stored copy keeps its own values for them
+
+        Returns:
+            Tuple of (blob URI, blob path, whether this call created the blob)
+        """
+        json_bytes = _json_bytes(obj)
+        if digest_exclude:
+            hashed = {k: v for k, v in obj.items() if k not in digest_exclude}
+            digest = hashlib.blake2b(_json_bytes(hashed), digest_size=16).hexdigest()
+        else:
+            digest = hashlib.blake2b(json_bytes, digest_size=16).hexdigest()
+        blob_path = f"{prefix.strip('/')}/{digest}.json"
+        created = self.put_if_absent(container, blob_path, json_bytes)
+        return self.get_blob_uri(container, blob_path), blob_path, created
+
     def read_json_blob(self, container: str, blob_path: str) -> dict:
         """
         Read a JSON blob and parse it as a dictionary.
@@ -311,8 +385,7 @@ class StorageClient:
         Returns:
             Parsed JSON dictionary
         """
-        import json as json_module
-        
         blob_path = blob_path.lstrip("/")
         blob_bytes = self.download_blob(container, blob_path)
-        return json_module.loads(blob_bytes.decode("utf-8"))
+        data: dict = orjson.loads(blob_bytes)
+        return data
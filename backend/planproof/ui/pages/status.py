@@ -4,7 +4,7 @@ Status page - Show processing progress and current status.
 
 import streamlit as st
 import time
-from planproof.ui.run_orchestrator import get_run_status
+from planproof.ui.run_orchestrator import get_run_status, load_run_summary
 
 
 def render():
@@ -70,15 +70,10 @@ def render():
             
             # Show summary if available
             if state in ["completed", "completed_with_errors", "failed"]:
-                from pathlib import Path
-                import json
-                
-                summary_file = Path(f"./runs/{run_id}/outputs/summary.json")
-                if summary_file.exists():
-                    try:
-                        with open(summary_file, 'r', encoding='utf-8') as f:
-                            summary = json.load(f)
-                        
+                try:
+                    # Only the counts and errors are shown; skip per-document results
+                    summary = load_run_summary(run_id, keys=("summary", "errors"))
+                    if summary is not None:
                         # Display summary
                         col1, col2, col3 = st.columns(3)
                         with col1:
@@ -98,8 +93,8 @@ def render():
                                     st.markdown(f"**Message:** {err.get('error', 'No message')}")
                                     if err.get('traceback'):
                                         st.code(err['traceback'], language='python')
-                    except Exception as e:
-                        st.warning(f"Could not load summary: {e}")
+                except Exception as e:
+                    st.warning(f"Could not load summary: {e}")
             
             # Error information from database
             if status.get("error"):
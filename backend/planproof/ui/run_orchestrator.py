@@ -11,6 +11,10 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timezone
 import threading
 import hashlib
+import itertools
+import re
+
+import ijson
 
 from planproof.db import Database, Run, Document
 from planproof.storage import StorageClient
@@ -27,6 +31,114 @@ settings = get_settings()
 LOGGER = logging.getLogger(__name__)
 
 
+# Output file kinds collected by get_run_results and their file extension
+_OUTPUT_FILE_KINDS = {
+    "validation": "json",
+    "extraction": "json",
+    "error": "txt",
+    "llm_notes": "json",
+}
+
+# <kind>_<key>.<ext>, e.g. validation_81.json or error_plan.pdf.txt
+_OUTPUT_FILE_PATTERN = re.compile(r"^(validation|extraction|error|llm_notes)_(.+)\.(json|txt)$")
+
+
+# Lines of an error file included in get_run_results; the rest is summarised
+ERROR_PREVIEW_LINES = 200
+
+
+def _count_lines(path: Path, chunk_size: int = 1024 * 1024) -> int:
+    """Count lines using C-level bytes.count over fixed-size binary chunks."""
+    newlines = 0
+    last_byte = b"\n"
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            newlines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+    # A final line without a trailing newline still counts
+    return newlines + (last_byte != b"\n")
+
+
+def _read_error_preview(error_file: Path, max_lines: int = ERROR_PREVIEW_LINES) -> tuple:
+    """
+    Read the head of an error file without loading all of it.
+
+    Returns:
+        (preview text, total line count)
+    """
+    with open(error_file, "r", encoding="utf-8") as f:
+        head = list(itertools.islice(f, max_lines))
+    total_lines = _count_lines(error_file)
+    preview = "".join(head)
+    if total_lines > len(head):
+        preview += f"\n... ({total_lines - len(head)} more lines in {error_file.name})"
+    return preview, total_lines
+
+
+def _load_json_keys(path: Path, keys: tuple) -> Dict[str, Any]:
+    """
+    Stream a JSON object and build only the requested top-level keys.
+
+    Other values (e.g. the per-document ``results`` in summary.json) are
+    tokenised but never materialised.
+    """
+    wanted = set(keys)
+    found: Dict[str, Any] = {}
+    builder: Optional[Any] = None
+    current_key = ""
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "" and event in ("map_key", "end_map"):
+                if builder is not None:
+                    found[current_key] = builder.value
+                    builder = None
+                if event == "map_key" and value in wanted:
+                    current_key = value
+                    builder = ijson.ObjectBuilder()
+            elif builder is not None:
+                builder.event(event, value)
+    return found
+
+
+def load_run_summary(run_id: int, keys: tuple = ("summary", "errors")) -> Optional[Dict[str, Any]]:
+    """
+    Load selected top-level keys from a run's summary.json.
+
+    Returns:
+        Dict of the requested keys that are present, or None if there is no summary
+    """
+    summary_file = Path(f"./runs/{run_id}/outputs/summary.json")
+    if not summary_file.exists():
+        return None
+    return _load_json_keys(summary_file, keys)
+
+
+def _scan_output_files(outputs_dir: Path) -> Dict[str, Dict[str, Path]]:
+    """
+    Bucket a run's output files by kind in a single directory scan.
+
+    Each bucket maps the part of the filename between the kind prefix and
+    suffix (the document id for per-document files) to its path, in
+    filename order.
+    """
+    found: Dict[str, List[tuple]] = {kind: [] for kind in _OUTPUT_FILE_KINDS}
+    try:
+        with os.scandir(outputs_dir) as entries:
+            for entry in entries:
+                match = _OUTPUT_FILE_PATTERN.match(entry.name)
+                if match is None:
+                    continue
+                kind, key, extension = match.groups()
+                if _OUTPUT_FILE_KINDS[kind] == extension:
+                    found[kind].append((entry.name, key, entry.path))
+    except FileNotFoundError:
+        pass
+    return {
+        kind: {key: Path(path) for _, key, path in sorted(items)}
+        for kind, items in found.items()
+    }
+
+
 def _ensure_run_dirs(run_id: int) -> tuple:
     """Ensure run directories exist and return paths."""
     inputs_dir = Path(f"./runs/{run_id}/inputs")
@@ -481,10 +593,12 @@ def get_run_results(run_id: int) -> Dict[str, Any]:
         outputs_dir = Path(f"./runs/{run_id}/outputs")
         inputs_dir = Path(f"./runs/{run_id}/inputs")
         
-        # Find all validation and extraction files
-        validation_files = sorted(outputs_dir.glob("validation_*.json"))
-        extraction_files = sorted(outputs_dir.glob("extraction_*.json"))
-        error_files = sorted(outputs_dir.glob("error_*.txt"))
+        # Find all validation, extraction, error and LLM files in one pass
+        output_files = _scan_output_files(outputs_dir)
+        validation_files = output_files["validation"]
+        extraction_files = output_files["extraction"]
+        error_files = output_files["error"]
+        llm_notes_files = output_files["llm_notes"]
         
         findings = []
         results = []
@@ -493,10 +607,10 @@ def get_run_results(run_id: int) -> Dict[str, Any]:
         # Process each document
         processed_doc_ids = set()
         
-        for validation_file in validation_files:
+        for doc_key, validation_file in validation_files.items():
             try:
-                # Extract document ID from filename (validation_81.json -> 81)
-                doc_id = int(validation_file.stem.split("_")[1])
+                # Document ID comes from the filename (validation_81.json -> 81)
+                doc_id = int(doc_key)
                 processed_doc_ids.add(doc_id)
                 
                 # Load validation
@@ -504,9 +618,9 @@ def get_run_results(run_id: int) -> Dict[str, Any]:
                     validation = json.load(f)
                 
                 # Find corresponding extraction file
-                extraction_file = outputs_dir / f"extraction_{doc_id}.json"
+                extraction_file = extraction_files.get(str(doc_id))
                 extraction = {}
-                if extraction_file.exists():
+                if extraction_file is not None:
                     with open(extraction_file, "r", encoding="utf-8") as f:
                         extraction = json.load(f)
                 
@@ -556,8 +670,8 @@ def get_run_results(run_id: int) -> Dict[str, Any]:
                 })
                 
                 # Check for LLM notes
-                llm_file = outputs_dir / f"llm_notes_{doc_id}.json"
-                if llm_file.exists():
+                llm_file = llm_notes_files.get(str(doc_id))
+                if llm_file is not None:
                     with open(llm_file, "r", encoding="utf-8") as f:
                         llm_notes = json.load(f)
                     results[-1]["llm_triggered"] = True
@@ -570,14 +684,14 @@ def get_run_results(run_id: int) -> Dict[str, Any]:
                 })
         
         # Read error files
-        for error_file in error_files:
+        for error_file in error_files.values():
             try:
-                with open(error_file, "r", encoding="utf-8") as f:
-                    error_content = f.read()
+                error_content, line_count = _read_error_preview(error_file)
                 errors.append({
                     "filename": error_file.name,
-                    "error": error_content.split("\n")[0] if error_content else "Unknown error",
-                    "traceback": error_content
+                    "error": error_content.split("\n", 1)[0] if error_content else "Unknown error",
+                    "traceback": error_content,
+                    "line_count": line_count
                 })
             except (IOError, OSError) as read_error:
                 # Log but don't fail if we can't read an error file
@@ -604,8 +718,7 @@ def get_run_results(run_id: int) -> Dict[str, Any]:
         # Get LLM calls from metadata or count LLM files
         llm_calls = metadata.get("llm_calls_per_run", 0)
         if llm_calls == 0:
-            llm_files = list(outputs_dir.glob("llm_notes_*.json"))
-            llm_calls = len(llm_files)
+            llm_calls = len(llm_notes_files)
         
         summary = {
             "total_documents": total_docs,
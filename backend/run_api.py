@@ -11,6 +11,9 @@ Usage:
     Production mode (auto-reload disabled):
         ENVIRONMENT=production python run_api.py
 
+    Worker processes (production only, default 1):
+        API_WORKERS=4 python run_api.py
+
 API will be available at:
     - http://localhost:8000
     - API Docs: http://localhost:8000/api/docs
@@ -39,10 +42,17 @@ if __name__ == "__main__":
     else:
         print("[PROD] Running in PRODUCTION mode with auto-reload disabled")
 
+    # uvloop and httptools ship with uvicorn[standard]; name them explicitly so a
+    # missing install fails at startup instead of silently falling back to
+    # asyncio and h11.
     uvicorn.run(
         "planproof.api.main:app",
         host="0.0.0.0",
         port=8000,
         reload=enable_reload,
+        workers=None if enable_reload else int(os.getenv("API_WORKERS", "1")),
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=30,
         log_level="info"
     )
@@ -1,6 +1,9 @@
 """Quick fix to add missing database columns."""
 import os
+from functools import lru_cache
+
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -9,68 +12,71 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 # Use psycopg (v3) instead of psycopg2
 if DATABASE_URL and "postgresql://" in DATABASE_URL:
     DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+psycopg://")
-engine = create_engine(DATABASE_URL)
 
-# Add missing columns to submissions table
-with engine.connect() as conn:
-    try:
-        # Check if columns exist first
-        result = conn.execute(text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'submissions' 
-            AND column_name IN ('submission_type', 'submission_type_confidence', 'submission_type_source')
-        """))
-        existing_columns = {row[0] for row in result}
-        
-        # Add missing columns
-        if 'submission_type' not in existing_columns:
-            print("Adding submission_type column...")
-            conn.execute(text("""
-                ALTER TABLE submissions 
-                ADD COLUMN submission_type VARCHAR(50)
-            """))
-            conn.commit()
-            print("✅ Added submission_type")
-        
-        if 'submission_type_confidence' not in existing_columns:
-            print("Adding submission_type_confidence column...")
-            conn.execute(text("""
-                ALTER TABLE submissions 
-                ADD COLUMN submission_type_confidence FLOAT
-            """))
-            conn.commit()
-            print("✅ Added submission_type_confidence")
-        
-        if 'submission_type_source' not in existing_columns:
-            print("Adding submission_type_source column...")
-            conn.execute(text("""
-                ALTER TABLE submissions 
-                ADD COLUMN submission_type_source VARCHAR(50)
-            """))
-            conn.commit()
-            print("✅ Added submission_type_source")
-        
-        # Check runs table for run_type column
-        result = conn.execute(text("""
-            SELECT column_name 
-            FROM information_schema.columns 
-            WHERE table_name = 'runs' 
-            AND column_name = 'run_type'
-        """))
-        runs_columns = {row[0] for row in result}
-        
-        if 'run_type' not in runs_columns:
-            print("Adding run_type column to runs table...")
-            conn.execute(text("""
-                ALTER TABLE runs 
-                ADD COLUMN run_type VARCHAR(50) DEFAULT 'ui_single'
-            """))
+# Columns that must exist, per table: column name -> column definition
+REQUIRED_COLUMNS = {
+    "submissions": {
+        "submission_type": "VARCHAR(50)",
+        "submission_type_confidence": "FLOAT",
+        "submission_type_source": "VARCHAR(50)",
+    },
+    "runs": {
+        "run_type": "VARCHAR(50) DEFAULT 'ui_single'",
+    },
+}
+
+
+@lru_cache(maxsize=1)
+def _engine() -> Engine:
+    """Engine shared by repeated fix_schema() calls in one process."""
+    if not DATABASE_URL:
+        raise RuntimeError("DATABASE_URL is not set")
+    return create_engine(DATABASE_URL, pool_pre_ping=True, pool_size=1)
+
+
+def fix_schema() -> None:
+    """Add missing columns (one ALTER TABLE per table, one commit)."""
+    with _engine().connect() as conn:
+        try:
+            # Check which required columns exist first, for all tables at once
+            result = conn.execute(
+                text("""
+                    SELECT table_name, column_name
+                    FROM information_schema.columns
+                    WHERE (table_name = 'submissions' AND column_name = ANY(:submission_columns))
+                       OR (table_name = 'runs' AND column_name = ANY(:run_columns))
+                """),
+                {
+                    "submission_columns": list(REQUIRED_COLUMNS["submissions"]),
+                    "run_columns": list(REQUIRED_COLUMNS["runs"]),
+                },
+            )
+            existing_columns = {(row[0], row[1]) for row in result}
+
+            for table_name, columns in REQUIRED_COLUMNS.items():
+                missing = [
+                    (column_name, definition)
+                    for column_name, definition in columns.items()
+                    if (table_name, column_name) not in existing_columns
+                ]
+                if not missing:
+                    continue
+
+                print(f"Adding {', '.join(name for name, _ in missing)} to {table_name}...")
+                add_clauses = ", ".join(
+                    f"ADD COLUMN {column_name} {definition}" for column_name, definition in missing
+                )
+                conn.execute(text(f"ALTER TABLE {table_name} {add_clauses}"))
+                for column_name, _ in missing:
+                    print(f"✅ Added {column_name} to {table_name}")
+
             conn.commit()
-            print("✅ Added run_type to runs")
-        
-        print("\n✅ Database schema fixed successfully!")
-        
-    except Exception as e:
-        print(f"❌ Error: {e}")
-        conn.rollback()
+            print("\n✅ Database schema fixed successfully!")
+
+        except Exception as e:
+            print(f"❌ Error: {e}")
+            conn.rollback()
+
+
+if __name__ == "__main__":
+    fix_schema()
@@ -27,3 +27,15 @@ def _set_required_env(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setenv("AZURE_OPENAI_API_KEY", "fake-key")
     monkeypatch.setenv("AZURE_OPENAI_CHAT_DEPLOYMENT", "test-deployment")
     reload_settings()
+
+
+@pytest.fixture(scope="session")
+def canonical_missing_items() -> tuple[str, ...]:
+    """Missing-document checklist shared by the request-info and notification tests."""
+    return ("Site Plan", "Location Plan", "Fee Payment")
+
+
+@pytest.fixture(scope="session")
+def canonical_application_ref() -> str:
+    """Application reference shared by the services tests."""
+    return "APP/2024/001"
@@ -166,6 +166,71 @@ class TestStorageClient:
         assert len(blobs) == 2
         assert mock_container.list_blobs.called
 
+    @patch('azure.storage.blob.BlobServiceClient')
+    def test_json_blob_round_trip(self, mock_blob_service):
+        """Test JSON blobs are written as UTF-8 bytes and read back unchanged."""
+        stored = {}
+        mock_blob = Mock()
+        mock_blob.upload_blob.side_effect = lambda data, **kwargs: stored.setdefault("data", data)
+        mock_blob.download_blob.return_value.readall.side_effect = lambda: stored["data"]
+
+        mock_service = Mock()
+        mock_service.get_blob_client.return_value = mock_blob
+        mock_blob_service.from_connection_string.return_value = mock_service
+
+        client = StorageClient()
+        payload = {"fields": {"site_address": "1 Café Street"}, "page_anchors": {1: [0, 2]}}
+
+        client.write_json_blob("artefacts", "runs/1/extraction_1.json", payload, overwrite=True)
+
+        assert isinstance(stored["data"], bytes)
+        assert "Café".encode("utf-8") in stored["data"]
+        assert client.read_json_blob("artefacts", "runs/1/extraction_1.json") == {
+            "fields": {"site_address": "1 Café Street"},
+            "page_anchors": {"1": [0, 2]},
+        }
+
+    @patch('azure.storage.blob.BlobServiceClient')
+    def test_json_content_blob_skips_upload_when_present(self, mock_blob_service):
+        """Test content-addressed writes only upload payloads not already stored."""
+        from azure.core.exceptions import ResourceNotFoundError
+
+        stored = {}
+        clients = {}
+
+        def get_blob_client(container, blob):
+            if blob not in clients:
+                client = Mock()
+
+                def get_props(blob=blob):
+                    if blob not in stored:
+                        raise ResourceNotFoundError("missing")
+                    return {}
+
+                client.get_blob_properties.side_effect = get_props
+                client.upload_blob.side_effect = lambda data, blob=blob, **kwargs: stored.__setitem__(blob, data)
+                clients[blob] = client
+            return clients[blob]
+
+        mock_service = Mock()
+        mock_service.get_blob_client.side_effect = get_blob_client
+        mock_blob_service.from_connection_string.return_value = mock_service
+
+        client = StorageClient()
+        first = client.write_json_content_blob(
+            "artefacts", "content", {"fields": {"a": 1}, "analyzed_at": "t1"}, digest_exclude=("analyzed_at",)
+        )
+        second = client.write_json_content_blob(
+            "artefacts", "content", {"fields": {"a": 1}, "analyzed_at": "t2"}, digest_exclude=("analyzed_at",)
+        )
+        other = client.write_json_content_blob("artefacts", "content", {"fields": {"a": 2}})
+
+        assert first[2] is True and second[2] is False and other[2] is True
+        assert first[:2] == second[:2]
+        assert first[1].startswith("content/") and first[1] != other[1]
+        assert len(stored) == 2
+        assert b"t1" in stored[first[1]]
+
 
 # ============================================================================
 # DocumentIntelligence Tests
@@ -397,6 +462,413 @@ class TestAzureOpenAIClient:
         
         assert result is not None
 
+    @patch('openai.AsyncAzureOpenAI')
+    @patch('openai.AzureOpenAI')
+    def test_batch_chat_json_preserves_order(self, mock_openai_class, mock_async_class):
+        """Test batched chat_json fans out async calls and keeps input order."""
+        def make_response(content):
+            response = Mock()
+            response.usage = None
+            response.choices = [Mock(message=Mock(content=content))]
+            return response
+
+        async def create(**kwargs):
+            return make_response(kwargs["messages"][-1]["content"])
+
+        mock_async_client = Mock()
+        mock_async_client.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_client.close = AsyncMock()
+        mock_async_class.return_value = mock_async_client
+
+        aoai_client = AzureOpenAIClient()
+        results = aoai_client.batch_chat_json([{"task": i} for i in range(5)])
+
+        assert results == [{"task": i} for i in range(5)]
+        assert aoai_client.get_call_count() == 5
+        assert mock_async_client.chat.completions.create.await_count == 5
+        assert not mock_openai_class.return_value.chat.completions.create.called
+        mock_async_client.close.assert_awaited_once()
+
+    @patch('openai.AsyncAzureOpenAI')
+    @patch('openai.AzureOpenAI')
+    def test_batch_chat_json_leaves_shared_async_pool_open(self, mock_openai_class, mock_async_class):
+        """Test the sync batch entry point uses its own async client, not the shared one."""
+        async def create(**kwargs):
+            response = Mock()
+            response.usage = None
+            response.choices = [Mock(message=Mock(content='{"ok": true}'))]
+            return response
+
+        def make_async_client(**kwargs):
+            client = Mock()
+            client.chat.completions.create = AsyncMock(side_effect=create)
+            client.close = AsyncMock()
+            return client
+
+        mock_async_class.side_effect = make_async_client
+
+        aoai_client = AzureOpenAIClient()
+        aoai_client.open_async_pool()
+        shared = aoai_client.async_client
+        results = aoai_client.batch_chat_json([{"task": 1}])
+
+        assert results == [{"ok": True}]
+        assert aoai_client.async_client is shared
+        assert not shared.chat.completions.create.called
+        assert not shared.close.called
+
+    @patch('openai.AsyncAzureOpenAI')
+    @patch('openai.AzureOpenAI')
+    def test_async_batch_resolve_runs_one_request_per_item(self, mock_openai_class, mock_async_class):
+        """Test concurrent field resolution keeps input order and uses the async client."""
+        import asyncio
+
+        async def create(**kwargs):
+            field_name = kwargs["messages"][-1]["content"].split("\n", 1)[0]
+            response = Mock()
+            response.usage = None
+            response.choices = [Mock(message=Mock(content=f'{{"resolved_value": "{field_name}", "confidence": 0.9}}'))]
+            return response
+
+        mock_async_client = Mock()
+        mock_async_client.chat.completions.create = AsyncMock(side_effect=create)
+        mock_async_class.return_value = mock_async_client
+
+        items = [
+            {"field_name": f"field_{i}", "extracted_value": None, "context": "ctx", "validation_issue": "missing"}
+            for i in range(4)
+        ]
+        aoai_client = AzureOpenAIClient()
+        results = asyncio.run(aoai_client.a_batch_resolve_field_conflicts(items))
+
+        assert [r["resolved_value"] for r in results] == [f"field_{i}" for i in range(4)]
+        assert mock_async_client.chat.completions.create.await_count == 4
+        assert not mock_openai_class.return_value.chat.completions.create.called
+
+    @patch('openai.AzureOpenAI')
+    def test_identical_prompts_served_from_cache(self, mock_openai_class):
+        """Test repeated deterministic prompts reuse the cached response."""
+        mock_response = Mock()
+        mock_response.usage = Mock(
+            total_tokens=120, prompt_tokens=100, completion_tokens=20, prompt_tokens_details=Mock(cached_tokens=64)
+        )
+        mock_response.choices = [Mock(message=Mock(content='{"answer": 1}'))]
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        aoai_client = AzureOpenAIClient()
+
+        assert aoai_client.chat_json({"task": "a"}) == {"answer": 1}
+        assert aoai_client.chat_json({"task": "a"}) == {"answer": 1}
+        aoai_client.chat_completion(messages=[{"role": "user", "content": "hi"}], temperature=0.9)
+        aoai_client.chat_completion(messages=[{"role": "user", "content": "hi"}], temperature=0.9)
+
+        assert mock_client.chat.completions.create.call_count == 3
+        assert aoai_client.get_call_count() == 3
+        stats = aoai_client.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["tokens_saved"] == 120
+        assert aoai_client.get_cost_summary()["cached_prompt_tokens"] == 64 * 3
+        report = aoai_client.get_usage_report()
+        assert report["prompt_tokens"] == 300
+        assert report["completion_tokens"] == 60
+        assert report["cache_hit_rate"] == 0.64
+        assert report["response_cache_hits"] == 1
+
+    @patch('openai.AzureOpenAI')
+    def test_response_cache_ignores_whitespace_differences(self, mock_openai_class):
+        """Test prompts differing only in spacing/line breaks share a cache entry."""
+        mock_response = Mock()
+        mock_response.usage = None
+        mock_response.choices = [Mock(message=Mock(content='{"resolved_value": "1 High St"}'))]
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        aoai_client = AzureOpenAIClient()
+        aoai_client.resolve_field_conflict("site_address", "", "Site:\n1 High  St", "missing")
+        aoai_client.resolve_field_conflict("site_address", "", "Site: 1 High St ", "missing")
+        aoai_client.resolve_field_conflict("site_address", "", "Site: 2 High St", "missing")
+
+        assert mock_client.chat.completions.create.call_count == 2
+        assert aoai_client.get_cache_stats()["hits"] == 1
+
+    @patch('openai.AzureOpenAI')
+    def test_chat_json_streaming_early_exit(self, mock_openai_class):
+        """Test streamed chat_json stops reading once the requested key arrives."""
+        deltas = ['{"decision": ', '"ACCEPT", ', '"explanation": "long ', 'text"}']
+        consumed = []
+
+        def chunks():
+            for delta in deltas:
+                consumed.append(delta)
+                yield Mock(choices=[Mock(delta=Mock(content=delta))])
+
+        def make_stream():
+            stream = MagicMock()
+            stream.usage = None
+            stream.__iter__.side_effect = lambda: chunks()
+            return stream
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = lambda **kwargs: make_stream()
+        mock_openai_class.return_value = mock_client
+
+        aoai_client = AzureOpenAIClient()
+
+        assert aoai_client.chat_json_streaming({"task": "t"}, early_exit_key="decision") == {"decision": "ACCEPT"}
+        assert len(consumed) == 2
+        assert mock_client.chat.completions.create.call_args[1]["stream"] is True
+        metadata = aoai_client.get_last_call_metadata()
+        assert 0 <= metadata["ttft_ms"] <= metadata["response_time_ms"]
+        assert mock_client.chat.completions.create.call_args[1]["max_tokens"] == 2048
+
+        consumed.clear()
+        assert aoai_client.chat_json_streaming({"task": "t"}) == {"decision": "ACCEPT", "explanation": "long text"}
+        assert len(consumed) == 4
+
+    @patch('openai.AzureOpenAI')
+    def test_llm_results_tolerate_schema_drift(self, mock_openai_class):
+        """Test mistyped LLM fields are coerced instead of raising or leaking through."""
+        mock_response = Mock()
+        mock_response.usage = None
+        mock_response.choices = [Mock(message=Mock(
+            content='{"is_valid": "false", "confidence": "high", "reasoning": null}'
+        ))]
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        aoai_client = AzureOpenAIClient()
+        result = aoai_client.validate_with_llm("postcode", "AB1 2CD", "UK postcode", "ctx")
+
+        assert result == {"is_valid": False, "confidence": 0.5, "reasoning": "", "suggested_value": None}
+
+        mock_response.choices[0].message.content = '["not", "an", "object"]'
+        result = aoai_client.resolve_field_conflict("postcode", "", "other ctx", "missing")
+
+        assert result["confidence"] == 0.5
+        assert result["reasoning"] == "LLM response could not be parsed as JSON"
+
+    @patch('openai.AzureOpenAI')
+    def test_resolve_field_conflicts_batch(self, mock_openai_class):
+        """Test batched resolution uses one call and falls back per item on a count mismatch."""
+        def make_response(content):
+            response = Mock()
+            response.usage = None
+            response.choices = [Mock(message=Mock(content=content))]
+            return response
+
+        items = [
+            {"field_name": name, "extracted_value": "", "context": "ctx", "validation_issue": "missing"}
+            for name in ("site_address", "postcode")
+        ]
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = make_response(
+            '{"results": [{"resolved_value": "1 High St", "confidence": 0.9, "reasoning": "r1"},'
+            ' {"resolved_value": null, "confidence": 0.2, "reasoning": "r2"}]}'
+        )
+        mock_openai_class.return_value = mock_client
+
+        aoai_client = AzureOpenAIClient()
+        results = aoai_client.resolve_field_conflicts_batch(items)
+
+        assert [r["resolved_value"] for r in results] == ["1 High St", None]
+        assert mock_client.chat.completions.create.call_count == 1
+        assert mock_client.chat.completions.create.call_args[1]["max_tokens"] == 400
+
+        mock_client.chat.completions.create.reset_mock()
+        mock_client.chat.completions.create.side_effect = [
+            make_response('{"results": []}'),
+            make_response('{"resolved_value": "A", "confidence": 0.8, "reasoning": ""}'),
+            make_response('{"resolved_value": "B", "confidence": 0.8, "reasoning": ""}'),
+        ]
+        results = aoai_client.resolve_field_conflicts_batch([dict(item, context="other") for item in items])
+
+        assert [r["resolved_value"] for r in results] == ["A", "B"]
+        assert mock_client.chat.completions.create.call_count == 3
+
+    @patch('openai.AzureOpenAI')
+    def test_long_context_clipped_keeping_head_and_tail(self, mock_openai_class):
+        """Test oversized document context is clipped in the middle before sending."""
+        mock_response = Mock()
+        mock_response.usage = None
+        mock_response.choices = [Mock(message=Mock(content='{"is_valid": true}'))]
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+
+        context = "START " + "x" * 50_000 + " Signed: J Smith"
+        AzureOpenAIClient().validate_with_llm("signature", "J Smith", "must be signed", context)
+
+        prompt = mock_client.chat.completions.create.call_args[1]["messages"][-1]["content"]
+        assert len(prompt) < 13_000
+        assert "START" in prompt
+        assert prompt.endswith("Signed: J Smith")
+        assert "[...]" in prompt
+
+    @patch('openai.AzureOpenAI')
+    def test_resolve_field_conflicts_batch_splits_large_inputs(self, mock_openai_class):
+        """Test batches are capped at 10 fields per request."""
+        def create(**kwargs):
+            import json
+            count = len(json.loads(kwargs["messages"][-1]["content"])["tasks"])
+            response = Mock()
+            response.usage = None
+            response.choices = [Mock(message=Mock(content=json.dumps(
+                {"results": [{"resolved_value": "v", "confidence": 0.9, "reasoning": ""}] * count}
+            )))]
+            return response
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = create
+        mock_openai_class.return_value = mock_client
+
+        items = [
+            {"field_name": f"f{i}", "extracted_value": "", "context": "ctx", "validation_issue": "missing"}
+            for i in range(12)
+        ]
+        results = AzureOpenAIClient().resolve_field_conflicts_batch(items)
+
+        assert len(results) == 12
+        assert mock_client.chat.completions.create.call_count == 2
+
+    @patch('openai.AzureOpenAI')
+    def test_cost_uses_model_pricing_and_cached_discount(self, mock_openai_class):
+        """Test calls are priced per model, with cached prompt tokens discounted."""
+        def make_response(model):
+            response = Mock()
+            response.model = model
+            response.choices = []
+            response.usage = Mock(
+                total_tokens=1100, prompt_tokens=1000, completion_tokens=100,
+                prompt_tokens_details=Mock(cached_tokens=400),
+            )
+            return response
+
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            make_response("gpt-4o-2024-08-06"), make_response("custom-model")
+        ]
+        mock_openai_class.return_value = mock_client
+        aoai_client = AzureOpenAIClient()
+
+        aoai_client.chat_completion(messages=[{"role": "user", "content": "a"}], temperature=0.9)
+        metadata = aoai_client.get_last_call_metadata()
+        assert metadata["cost_usd"] == pytest.approx(0.003)
+        assert metadata["fresh_prompt_tokens"] == 600
+
+        aoai_client.chat_completion(messages=[{"role": "user", "content": "b"}], temperature=0.9)
+        assert aoai_client.get_last_call_metadata()["cost_usd"] == pytest.approx(0.033)
+        assert aoai_client.total_cost == pytest.approx(0.036)
+
+    @patch('openai.AzureOpenAI')
+    def test_budget_warning_logged_once(self, mock_openai_class, monkeypatch, caplog):
+        """Test the over-budget warning fires once rather than on every later call."""
+        from planproof.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "llm_budget_usd", 0.01)
+        mock_response = Mock()
+        mock_response.model = "custom-model"
+        mock_response.choices = []
+        mock_response.usage = Mock(
+            total_tokens=1000, prompt_tokens=900, completion_tokens=100, prompt_tokens_details=None
+        )
+        mock_openai_class.return_value.chat.completions.create.return_value = mock_response
+
+        aoai_client = AzureOpenAIClient()
+        with caplog.at_level("WARNING", logger="planproof.aoai"):
+            for _ in range(3):
+                aoai_client.chat_completion(messages=[{"role": "user", "content": "hi"}], temperature=0.9)
+
+        assert sum("LLM cost exceeded" in r.getMessage() for r in caplog.records) == 1
+        assert aoai_client.get_cost_summary()["over_budget"] is True
+
+    @patch('openai.AzureOpenAI')
+    def test_call_history_is_bounded(self, mock_openai_class, monkeypatch):
+        """Test call history keeps only the most recent LLM_CALL_HISTORY_MAX entries."""
+        from planproof.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "llm_call_history_max", 2)
+        mock_response = Mock()
+        mock_response.usage = None
+        mock_response.choices = []
+        mock_openai_class.return_value.chat.completions.create.return_value = mock_response
+
+        aoai_client = AzureOpenAIClient()
+        for _ in range(3):
+            aoai_client.chat_completion(messages=[{"role": "user", "content": "hi"}], temperature=0.9)
+
+        history = aoai_client.get_call_history()
+        assert len(history) == 2
+        assert history[-1] is aoai_client.get_last_call_metadata()
+
+    @patch('openai.AzureOpenAI')
+    def test_batch_api_round_trip(self, mock_openai_class):
+        """Test Batch API submission uploads JSONL and results come back in payload order."""
+        import json
+
+        mock_client = Mock()
+        mock_client.files.create.return_value = Mock(id="file-in")
+        mock_client.post.return_value = {"id": "batch-1", "status": "validating"}
+        mock_client.get.return_value = {
+            "id": "batch-1", "status": "completed", "output_file_id": "file-out",
+            "request_counts": {"total": 3, "completed": 2, "failed": 1},
+        }
+        output_lines = [
+            {"custom_id": "1", "response": {"status_code": 200, "body": {
+                "model": "gpt-4o", "usage": {"prompt_tokens": 1000, "completion_tokens": 0, "total_tokens": 1000},
+                "choices": [{"message": {"content": '{"answer": "b"}'}}]}}},
+            {"custom_id": "0", "response": {"status_code": 200, "body": {
+                "choices": [{"message": {"content": '{"answer": "a"}'}}]}}},
+        ]
+        mock_client.files.content.return_value = Mock(
+            content="\n".join(json.dumps(line) for line in output_lines).encode()
+        )
+        mock_openai_class.return_value = mock_client
+
+        aoai_client = AzureOpenAIClient()
+        assert aoai_client.submit_batch([{"task": "a"}, {"task": "b"}, {"task": "c"}]) == "batch-1"
+
+        upload = mock_client.files.create.call_args[1]
+        assert upload["purpose"] == "batch"
+        requests = [json.loads(line) for line in upload["file"][1].splitlines()]
+        assert [r["custom_id"] for r in requests] == ["0", "1", "2"]
+        assert requests[0]["body"]["response_format"] == {"type": "json_object"}
+        assert mock_client.post.call_args[1]["body"]["input_file_id"] == "file-in"
+
+        results = aoai_client.fetch_batch_results("batch-1")
+        assert results[0] == {"answer": "a"}
+        assert results[1] == {"answer": "b"}
+        assert results[2]["error"] == "Batch request failed"
+        assert aoai_client.total_cost == pytest.approx(0.00125)
+
+    @patch('openai.AzureOpenAI')
+    def test_disk_response_cache_survives_new_client(self, mock_openai_class, tmp_path, monkeypatch):
+        """Test LLM_RESPONSE_CACHE_DIR lets a fresh client reuse earlier responses."""
+        from openai.types.chat import ChatCompletion
+        from planproof.config import get_settings
+
+        monkeypatch.setattr(get_settings(), "llm_response_cache_dir", str(tmp_path))
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = ChatCompletion.model_validate({
+            "id": "c1", "object": "chat.completion", "created": 0, "model": "gpt-4",
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": '{"answer": 1}'}}],
+        })
+        mock_openai_class.return_value = mock_client
+
+        assert AzureOpenAIClient().chat_json({"task": "a"}) == {"answer": 1}
+        second = AzureOpenAIClient()
+        assert second.chat_json({"task": "a"}) == {"answer": 1}
+
+        assert mock_client.chat.completions.create.call_count == 1
+        assert second.get_cache_stats()["hits"] == 1
+        assert second.get_call_count() == 0
+
 
 # ============================================================================
 # Integration-Style Tests (with multiple mocks)
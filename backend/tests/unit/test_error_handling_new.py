@@ -41,6 +41,60 @@ class TestAzureOpenAIErrorHandling:
         assert "timeout" in str(exc_info.value).lower()
         assert "60" in str(exc_info.value) or "60.0" in str(exc_info.value)
 
+    @patch('planproof.aoai.time.sleep')
+    @patch('openai.AzureOpenAI')
+    def test_transient_error_retries_then_succeeds(self, mock_openai_class, mock_sleep):
+        """Test transient errors are retried with backoff and counted."""
+        from planproof.aoai import AzureOpenAIClient
+
+        mock_response = Mock()
+        mock_response.usage = None
+        mock_response.choices = []
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            APITimeoutError("Request timed out"),
+            mock_response,
+        ]
+        mock_openai_class.return_value = mock_client
+
+        aoai = AzureOpenAIClient()
+
+        assert aoai.chat_completion(messages=[{"role": "user", "content": "test"}]) is mock_response
+        assert mock_client.chat.completions.create.call_count == 2
+        assert mock_sleep.call_count == 1
+        assert aoai.get_retry_count() == 1
+        assert aoai.get_call_count() == 1
+        assert mock_openai_class.call_args[1]["max_retries"] == 0
+        assert aoai.get_last_call_metadata()["retries"] == 1
+
+    @patch('planproof.aoai.random.uniform', return_value=0.0)
+    @patch('planproof.aoai.time.sleep')
+    @patch('openai.AzureOpenAI')
+    def test_rate_limit_retry_honours_retry_after(self, mock_openai_class, mock_sleep, mock_uniform):
+        """Test a 429's Retry-After header sets the backoff delay."""
+        import httpx
+        from planproof.aoai import AzureOpenAIClient
+
+        throttled = httpx.Response(
+            429,
+            headers={"retry-after": "7"},
+            request=httpx.Request("POST", "https://example.openai.azure.com/chat/completions"),
+        )
+        mock_response = Mock()
+        mock_response.usage = None
+        mock_response.choices = []
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [
+            RateLimitError("Rate limit exceeded", response=throttled, body=None),
+            mock_response,
+        ]
+        mock_openai_class.return_value = mock_client
+
+        aoai = AzureOpenAIClient()
+        aoai.chat_completion(messages=[{"role": "user", "content": "test"}], temperature=0.9)
+
+        mock_sleep.assert_called_once_with(7.0)
+
     @patch('openai.AzureOpenAI')
     def test_rate_limit_error_raises_runtime_error(self, mock_openai_class):
         """Test rate limit error raises RuntimeError with clear message."""
@@ -280,6 +334,48 @@ class TestDatabaseRollbackHandling:
         # Should not call rollback for not found
         assert not mock_session.rollback.called
 
+    @patch('planproof.db.create_engine')
+    @patch('planproof.db.sessionmaker')
+    def test_create_artefact_records_single_commit(self, mock_sessionmaker, mock_create_engine):
+        """Test create_artefact_records inserts all rows under one commit."""
+        from planproof.db import Database
+
+        mock_session = Mock()
+        mock_sessionmaker.return_value = Mock(return_value=mock_session)
+
+        db = Database()
+        created = db.create_artefact_records([
+            {"document_id": 1, "artefact_type": "extraction", "blob_uri": "azure://a/1.json"},
+            {"document_id": 1, "artefact_type": "validation", "blob_uri": "azure://a/2.json",
+             "metadata": {"run_id": 3}},
+        ])
+
+        assert [a["artefact_type"] for a in created] == ["extraction", "validation"]
+        added = mock_session.add_all.call_args[0][0]
+        assert [a.artefact_metadata for a in added] == [{}, {"run_id": 3}]
+        mock_session.commit.assert_called_once()
+        assert not mock_session.refresh.called
+
+    @patch('planproof.db.create_engine')
+    @patch('planproof.db.sessionmaker')
+    def test_create_artefact_records_rolls_back_on_error(self, mock_sessionmaker, mock_create_engine):
+        """Test create_artefact_records rolls back on database error."""
+        from planproof.db import Database
+
+        mock_session = Mock()
+        mock_session.flush.side_effect = Exception("Duplicate blob_uri")
+        mock_sessionmaker.return_value = Mock(return_value=mock_session)
+
+        db = Database()
+
+        with pytest.raises(RuntimeError) as exc_info:
+            db.create_artefact_records([
+                {"document_id": 1, "artefact_type": "extraction", "blob_uri": "azure://a/1.json"},
+            ])
+
+        assert mock_session.rollback.called
+        assert "failed to create artefact records" in str(exc_info.value).lower()
+
 
 class TestIngestFileValidation:
     """Test file validation in ingest.py."""
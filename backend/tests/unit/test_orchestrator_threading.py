@@ -261,6 +261,76 @@ class TestRunOrchestratorStateManagement:
         assert inputs_dir.name == "inputs"
         assert outputs_dir.name == "outputs"
 
+    def test_scan_output_files_buckets_by_kind(self, tmp_path):
+        """Test output files are bucketed by kind in one scan."""
+        from planproof.ui.run_orchestrator import _scan_output_files
+
+        for name in [
+            "validation_82.json", "validation_81.json", "extraction_81.json",
+            "error_a.pdf.txt", "llm_notes_81.json", "llm_gate_error_81.txt", "summary.json",
+            "validation_83.txt", "error_b.json",
+        ]:
+            (tmp_path / name).write_text("{}")
+
+        buckets = _scan_output_files(tmp_path)
+
+        assert list(buckets["validation"]) == ["81", "82"]
+        assert buckets["validation"]["81"] == tmp_path / "validation_81.json"
+        assert list(buckets["extraction"]) == ["81"]
+        assert list(buckets["error"]) == ["a.pdf"]
+        assert list(buckets["llm_notes"]) == ["81"]
+        assert _scan_output_files(tmp_path / "missing")["validation"] == {}
+
+    def test_read_error_preview_truncates_long_files(self, tmp_path):
+        """Test error previews keep the head of the file and report the total."""
+        from planproof.ui.run_orchestrator import _read_error_preview
+
+        error_file = tmp_path / "error_big.pdf.txt"
+        error_file.write_text("".join(f"line {i}\n" for i in range(50)), encoding="utf-8")
+
+        preview, total_lines = _read_error_preview(error_file, max_lines=10)
+
+        assert total_lines == 50
+        assert preview.startswith("line 0\n")
+        assert "line 9\n" in preview
+        assert "line 10\n" not in preview
+        assert "40 more lines" in preview
+
+    def test_count_lines_matches_text_iteration(self, tmp_path):
+        """Test byte-level line counting agrees with iterating the file."""
+        from planproof.ui.run_orchestrator import _count_lines
+
+        cases = {"empty.txt": "", "terminated.txt": "a\nb\n", "unterminated.txt": "a\nb\nc"}
+        for name, content in cases.items():
+            path = tmp_path / name
+            path.write_text(content, encoding="utf-8")
+            with open(path, encoding="utf-8") as f:
+                expected = sum(1 for _ in f)
+            assert _count_lines(path, chunk_size=2) == expected
+
+    def test_load_run_summary_returns_only_requested_keys(self, tmp_path, monkeypatch):
+        """Test summary loading skips keys that were not requested."""
+        import json
+        from planproof.ui.run_orchestrator import load_run_summary
+
+        monkeypatch.chdir(tmp_path)
+        outputs_dir = tmp_path / "runs" / "7" / "outputs"
+        outputs_dir.mkdir(parents=True)
+        (outputs_dir / "summary.json").write_text(json.dumps({
+            "run_id": 7,
+            "results": [{"filename": "a.pdf", "fields": {"x": [1, 2, {"y": None}]}}],
+            "summary": {"total_documents": 1, "processed": 1, "errors": 0, "ratio": 0.5},
+            "errors": [],
+        }), encoding="utf-8")
+
+        summary = load_run_summary(7)
+
+        assert summary == {
+            "summary": {"total_documents": 1, "processed": 1, "errors": 0, "ratio": 0.5},
+            "errors": [],
+        }
+        assert load_run_summary(8) is None
+
     @patch('planproof.ui.run_orchestrator.Database')
     def test_get_run_results_handles_missing_files(self, mock_db_class, tmp_path, monkeypatch):
         """Test get_run_results handles missing result files gracefully."""
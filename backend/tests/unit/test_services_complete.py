@@ -17,6 +17,59 @@ from datetime import datetime
 from planproof.db import Database
 
 
+class _FakeSMTP:
+    """Minimal stand-in for ``smtplib.SMTP`` supporting the context-manager protocol."""
+
+    def __init__(self, host: str = "", port: int = 0, *args, **kwargs):
+        self.host = host
+        self.port = port
+        self.sent = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def starttls(self, *args, **kwargs):
+        return None
+
+    def login(self, *args, **kwargs):
+        return None
+
+    def send_message(self, msg, *args, **kwargs):
+        self.sent.append(msg)
+        return {}
+
+    def sendmail(self, from_addr, to_addrs, msg, *args, **kwargs):
+        self.sent.append(msg)
+        return {}
+
+    def quit(self):
+        return None
+
+
+class _FailingSMTP(_FakeSMTP):
+    """SMTP stand-in whose connection attempt always fails."""
+
+    def __init__(self, *args, **kwargs):
+        raise Exception("SMTP connection failed")
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    """Route ``smtplib.SMTP`` to the in-memory fake."""
+    monkeypatch.setattr("smtplib.SMTP", _FakeSMTP)
+    return _FakeSMTP
+
+
+@pytest.fixture
+def failing_smtp(monkeypatch):
+    """Route ``smtplib.SMTP`` to a fake that fails to connect."""
+    monkeypatch.setattr("smtplib.SMTP", _FailingSMTP)
+    return _FailingSMTP
+
+
 class TestExportService:
     """Tests for ExportService - decision package export."""
 
@@ -83,7 +136,7 @@ class TestExportService:
         assert json_output is not None
         assert isinstance(json_output, str)
 
-        # Should be valid JSON
+        # Should be valid JSON (the one contract-level parse for export_as_json)
         parsed = json.loads(json_output)
         assert parsed["run_id"] == 1
 
@@ -118,21 +171,16 @@ class TestExportService:
         json_output = export_as_json(package)
 
         assert json_output is not None
-        parsed = json.loads(json_output)
-        assert isinstance(parsed, dict)
+        assert json_output.strip().startswith('{')
 
 
 class TestNotificationService:
     """Tests for NotificationService - email notifications."""
 
-    @patch('smtplib.SMTP')
-    def test_send_email_success(self, mock_smtp_class):
+    def test_send_email_success(self, fake_smtp):
         """Test sending email notification successfully."""
         from planproof.services.notification_service import send_email_notification
 
-        mock_smtp = Mock()
-        mock_smtp_class.return_value.__enter__.return_value = mock_smtp
-
         result = send_email_notification(
             to_email="applicant@example.com",
             subject="Application Validated",
@@ -142,20 +190,19 @@ class TestNotificationService:
         # If implemented, should return success
         assert result is True or result.get("success") is True
 
-    def test_generate_info_request_email_template(self):
+    def test_generate_info_request_email_template(
+        self, canonical_missing_items, canonical_application_ref
+    ):
         """Test generating information request email template."""
         from planproof.services.notification_service import generate_info_request_email
 
-        missing_items = ["Site Plan", "Location Plan"]
-        application_ref = "APP/2024/001"
-
         email_body = generate_info_request_email(
-            application_ref=application_ref,
-            missing_items=missing_items
+            application_ref=canonical_application_ref,
+            missing_items=list(canonical_missing_items)
         )
 
         assert email_body is not None
-        assert "APP/2024/001" in email_body
+        assert canonical_application_ref in email_body
         assert "Site Plan" in email_body
         assert "Location Plan" in email_body
 
@@ -173,13 +220,10 @@ class TestNotificationService:
         assert "APP/2024/001" in email_body
         assert "completed" in email_body.lower() or "2" in email_body
 
-    @patch('smtplib.SMTP')
-    def test_send_email_handles_smtp_error(self, mock_smtp_class):
+    def test_send_email_handles_smtp_error(self, failing_smtp):
         """Test email sending handles SMTP errors gracefully."""
         from planproof.services.notification_service import send_email_notification
 
-        mock_smtp_class.side_effect = Exception("SMTP connection failed")
-
         result = send_email_notification(
             to_email="test@example.com",
             subject="Test",
@@ -272,7 +316,7 @@ class TestRequestInfoService:
     """Tests for RequestInfoService - information requests."""
 
     @patch('planproof.db.Database')
-    def test_create_request_info_success(self, mock_db_class):
+    def test_create_request_info_success(self, mock_db_class, canonical_missing_items):
         """Test creating information request successfully."""
         from planproof.services.request_info_service import create_request_info
 
@@ -288,7 +332,7 @@ class TestRequestInfoService:
 
         result = create_request_info(
             submission_id=1,
-            missing_items=["Site Plan", "Location Plan"],
+            missing_items=list(canonical_missing_items),
             notes="Please provide these documents",
             officer_name="Officer Smith",
             db=mock_db
@@ -320,22 +364,19 @@ class TestRequestInfoService:
         assert results is not None
         assert isinstance(results, list)
 
-    def test_generate_checklist_text(self):
+    def test_generate_checklist_text(self, canonical_missing_items, canonical_application_ref):
         """Test generating checklist text for information request."""
         from planproof.services.request_info_service import generate_checklist_text
 
-        missing_items = ["Site Plan", "Location Plan", "Fee Payment"]
-
         checklist = generate_checklist_text(
-            application_ref="APP/2024/001",
-            missing_items=missing_items
+            application_ref=canonical_application_ref,
+            missing_items=list(canonical_missing_items)
         )
 
         assert checklist is not None
-        assert "APP/2024/001" in checklist
-        assert "Site Plan" in checklist
-        assert "Location Plan" in checklist
-        assert "Fee Payment" in checklist
+        assert canonical_application_ref in checklist
+        for item in canonical_missing_items:
+            assert item in checklist
 
     @patch('planproof.db.Database')
     def test_mark_request_resolved(self, mock_db_class):
@@ -3,11 +3,37 @@ Comprehensive tests for service layer modules: Phase 2.
 Tests delta_service, notification_service, officer_override, request_info_service.
 """
 
+import importlib
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
 
 
+def _optional_module(name: str):
+    """Import ``name``, or return None so only the tests that need it are affected."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# Resolve modules once at collection time so missing symbols skip before any
+# @patch / Mock setup runs for the test. A missing module fails its *_exists test.
+delta_service = _optional_module("planproof.services.delta_service")
+notification_service = _optional_module("planproof.services.notification_service")
+officer_override = _optional_module("planproof.services.officer_override")
+request_info_service = _optional_module("planproof.services.request_info_service")
+llm_gate = _optional_module("planproof.pipeline.llm_gate")
+ingest = _optional_module("planproof.pipeline.ingest")
+modification_workflow = _optional_module("planproof.pipeline.modification_workflow")
+
+
+def requires(module, name: str):
+    """Skip marker evaluated at collection when ``module`` or ``module.name`` is missing."""
+    return pytest.mark.skipif(not hasattr(module, name), reason=f"{name} not implemented")
+
+
 # ============================================================================
 # Delta Service Tests
 # ============================================================================
@@ -15,48 +41,37 @@ from typing import Dict, Any
 class TestDeltaService:
     """Tests for delta_service module."""
     
+    @requires(delta_service, "generate_delta_summary")
     @patch('planproof.services.delta_service.Database')
     def test_generate_delta_summary_exists(self, mock_db):
         """Test that generate_delta_summary function exists."""
-        try:
-            from planproof.services.delta_service import generate_delta_summary
-            assert callable(generate_delta_summary)
-        except ImportError:
-            pytest.skip("generate_delta_summary not implemented")
+        assert callable(delta_service.generate_delta_summary)
     
+    @requires(delta_service, "compute_field_changes")
     @patch('planproof.services.delta_service.Database')
     def test_compute_field_changes(self, mock_db):
         """Test computing field changes."""
-        try:
-            from planproof.services.delta_service import compute_field_changes
-            
-            old_fields = {"field1": "value1", "field2": "value2"}
-            new_fields = {"field1": "value1_updated", "field3": "value3"}
-            
-            changes = compute_field_changes(old_fields, new_fields)
-            
-            assert isinstance(changes, (dict, list))
-        except (ImportError, AttributeError):
-            pytest.skip("compute_field_changes not implemented")
+        old_fields = {"field1": "value1", "field2": "value2"}
+        new_fields = {"field1": "value1_updated", "field3": "value3"}
+        
+        changes = delta_service.compute_field_changes(old_fields, new_fields)
+        
+        assert isinstance(changes, (dict, list))
     
+    @requires(delta_service, "track_modification_history")
     @patch('planproof.services.delta_service.Database')
     def test_track_modification_history(self, mock_db):
         """Test tracking modification history."""
-        try:
-            from planproof.services.delta_service import track_modification_history
-            
-            mock_db_instance = Mock()
-            mock_db.return_value = mock_db_instance
-            
-            result = track_modification_history(
-                submission_id=1,
-                changeset_id=1,
-                db=mock_db_instance
-            )
-            
-            assert result is not None or True
-        except (ImportError, AttributeError):
-            pytest.skip("track_modification_history not implemented")
+        mock_db_instance = Mock()
+        mock_db.return_value = mock_db_instance
+        
+        result = delta_service.track_modification_history(
+            submission_id=1,
+            changeset_id=1,
+            db=mock_db_instance
+        )
+        
+        assert result is not None or True
 
 
 # ============================================================================
@@ -68,46 +83,34 @@ class TestNotificationService:
     
     def test_notification_service_exists(self):
         """Test that notification service module exists."""
-        try:
-            import planproof.services.notification_service
-            assert planproof.services.notification_service is not None
-        except ImportError:
+        if notification_service is None:
             pytest.fail("notification_service module not found")
     
     @pytest.mark.skip(reason="Database not exported from notification_service module")
     @patch('planproof.services.notification_service.Database')
     def test_send_notification(self, mock_db):
         """Test sending notification."""
-        try:
-            from planproof.services.notification_service import send_notification
-            
-            notification_data = {
-                "type": "issue_detected",
-                "recipient": "officer@council.gov.uk",
-                "message": "New issues require attention"
-            }
-            
-            result = send_notification(notification_data)
-            
-            assert result is not None or True
-        except (ImportError, AttributeError):
-            pytest.skip("send_notification not implemented")
+        notification_data = {
+            "type": "issue_detected",
+            "recipient": "officer@council.gov.uk",
+            "message": "New issues require attention"
+        }
+        
+        result = notification_service.send_notification(notification_data)
+        
+        assert result is not None or True
     
+    @requires(notification_service, "send_email")
     @patch('smtplib.SMTP')
     def test_email_notification(self, mock_smtp):
         """Test email notification capability."""
-        try:
-            from planproof.services.notification_service import send_email
-            
-            result = send_email(
-                to="test@example.com",
-                subject="Test",
-                body="Test message"
-            )
-            
-            assert result is True or mock_smtp.called or True
-        except (ImportError, AttributeError):
-            pytest.skip("send_email not implemented")
+        result = notification_service.send_email(
+            to="test@example.com",
+            subject="Test",
+            body="Test message"
+        )
+        
+        assert result is True or mock_smtp.called or True
 
 
 # ============================================================================
@@ -119,52 +122,40 @@ class TestOfficerOverride:
     
     def test_officer_override_service_exists(self):
         """Test that officer override service exists."""
-        try:
-            import planproof.services.officer_override
-            assert planproof.services.officer_override is not None
-        except ImportError:
+        if officer_override is None:
             pytest.fail("officer_override module not found")
     
     @pytest.mark.skip(reason="create_override signature mismatch - needs update")
     @patch('planproof.services.officer_override.Database')
     def test_create_override(self, mock_db):
         """Test creating officer override."""
-        try:
-            from planproof.services.officer_override import create_override
-            
-            mock_db_instance = Mock()
-            mock_db.return_value = mock_db_instance
-            
-            override_data = {
-                "issue_id": "TEST-001",
-                "officer_id": "officer123",
-                "decision": "accept",
-                "reason": "Acceptable variation"
-            }
-            
-            result = create_override(override_data, db=mock_db_instance)
-            
-            assert result is not None or True
-        except (ImportError, AttributeError):
-            pytest.skip("create_override not implemented")
+        mock_db_instance = Mock()
+        mock_db.return_value = mock_db_instance
+        
+        override_data = {
+            "issue_id": "TEST-001",
+            "officer_id": "officer123",
+            "decision": "accept",
+            "reason": "Acceptable variation"
+        }
+        
+        result = officer_override.create_override(override_data, db=mock_db_instance)
+        
+        assert result is not None or True
     
+    @requires(officer_override, "list_overrides")
     @patch('planproof.services.officer_override.Database')
     def test_list_overrides(self, mock_db):
         """Test listing officer overrides."""
-        try:
-            from planproof.services.officer_override import list_overrides
-            
-            mock_db_instance = Mock()
-            mock_session = Mock()
-            mock_session.query.return_value.all.return_value = []
-            mock_db_instance.get_session.return_value = mock_session
-            mock_db.return_value = mock_db_instance
-            
-            overrides = list_overrides(submission_id=1, db=mock_db_instance)
-            
-            assert isinstance(overrides, list)
-        except (ImportError, AttributeError):
-            pytest.skip("list_overrides not implemented")
+        mock_db_instance = Mock()
+        mock_session = Mock()
+        mock_session.query.return_value.all.return_value = []
+        mock_db_instance.get_session.return_value = mock_session
+        mock_db.return_value = mock_db_instance
+        
+        overrides = officer_override.list_overrides(submission_id=1, db=mock_db_instance)
+        
+        assert isinstance(overrides, list)
 
 
 # ============================================================================
@@ -176,53 +167,42 @@ class TestRequestInfoService:
     
     def test_request_info_service_exists(self):
         """Test that request info service exists."""
-        try:
-            import planproof.services.request_info_service
-            assert planproof.services.request_info_service is not None
-        except ImportError:
+        if request_info_service is None:
             pytest.fail("request_info_service module not found")
     
     @pytest.mark.skip(reason="Database not exported from request_info_service module")
     @patch('planproof.services.request_info_service.Database')
     def test_create_information_request(self, mock_db):
         """Test creating information request."""
-        try:
-            from planproof.services.request_info_service import create_information_request
-            
-            mock_db_instance = Mock()
-            mock_db.return_value = mock_db_instance
-            
-            request_data = {
-                "issue_id": "DOC-001",
-                "requested_info": "Please provide site plan",
-                "requestor_id": "officer123"
-            }
-            
-            result = create_information_request(request_data, db=mock_db_instance)
-            
-            assert result is not None or True
-        except (ImportError, AttributeError):
-            pytest.skip("create_information_request not implemented")
+        mock_db_instance = Mock()
+        mock_db.return_value = mock_db_instance
+        
+        request_data = {
+            "issue_id": "DOC-001",
+            "requested_info": "Please provide site plan",
+            "requestor_id": "officer123"
+        }
+        
+        result = request_info_service.create_information_request(
+            request_data, db=mock_db_instance
+        )
+        
+        assert result is not None or True
     
     @pytest.mark.skip(reason="Database not exported from request_info_service module")
     @patch('planproof.services.request_info_service.Database')
     def test_update_request_status(self, mock_db):
         """Test updating information request status."""
-        try:
-            from planproof.services.request_info_service import update_request_status
-            
-            mock_db_instance = Mock()
-            mock_db.return_value = mock_db_instance
-            
-            result = update_request_status(
-                request_id=1,
-                new_status="fulfilled",
-                db=mock_db_instance
-            )
-            
-            assert result is True or result is None
-        except (ImportError, AttributeError):
-            pytest.skip("update_request_status not implemented")
+        mock_db_instance = Mock()
+        mock_db.return_value = mock_db_instance
+        
+        result = request_info_service.update_request_status(
+            request_id=1,
+            new_status="fulfilled",
+            db=mock_db_instance
+        )
+        
+        assert result is True or result is None
 
 
 # ============================================================================
@@ -234,37 +214,41 @@ class TestLLMGate:
     
     def test_llm_gate_module_exists(self):
         """Test that llm_gate module exists."""
-        try:
-            import planproof.pipeline.llm_gate
-            assert planproof.pipeline.llm_gate is not None
-        except ImportError:
+        if llm_gate is None:
             pytest.fail("llm_gate module not found")
-    
+
+    @requires(llm_gate, "should_trigger_llm")
+    def test_should_trigger_llm_skips_cache_lookup_when_not_needed(self):
+        """Test the gate returns before querying resolved-field caches."""
+        db = Mock()
+        validation = {"summary": {"needs_llm": False}, "findings": []}
+
+        assert llm_gate.should_trigger_llm(
+            validation, {"fields": {}}, application_ref="APP/2024/001", submission_id=1, db=db
+        ) is False
+        assert not db.get_resolved_fields_for_submission.called
+        assert not db.get_resolved_fields_for_application.called
+
     @pytest.mark.skip(reason="AzureOpenAIClient not exported from llm_gate module")
     @patch('planproof.pipeline.llm_gate.AzureOpenAIClient')
     def test_review_field_with_llm(self, mock_aoai):
         """Test LLM field review."""
-        try:
-            from planproof.pipeline.llm_gate import review_field_with_llm
-            
-            mock_client = Mock()
-            mock_client.get_completion.return_value = {
-                "decision": "ACCEPT",
-                "explanation": "Value is correct"
-            }
-            mock_aoai.return_value = mock_client
-            
-            field_data = {
-                "content": "John Smith",
-                "confidence": 0.65,
-                "field_name": "ApplicantName"
-            }
-            
-            result = review_field_with_llm(field_data)
-            
-            assert result is not None or True
-        except (ImportError, AttributeError):
-            pytest.skip("review_field_with_llm not implemented")
+        mock_client = Mock()
+        mock_client.get_completion.return_value = {
+            "decision": "ACCEPT",
+            "explanation": "Value is correct"
+        }
+        mock_aoai.return_value = mock_client
+        
+        field_data = {
+            "content": "John Smith",
+            "confidence": 0.65,
+            "field_name": "ApplicantName"
+        }
+        
+        result = llm_gate.review_field_with_llm(field_data)
+        
+        assert result is not None or True
 
 
 # ============================================================================
@@ -276,30 +260,23 @@ class TestIngestPipeline:
     
     def test_ingest_module_exists(self):
         """Test that ingest module exists."""
-        try:
-            import planproof.pipeline.ingest
-            assert planproof.pipeline.ingest is not None
-        except ImportError:
+        if ingest is None:
             pytest.fail("ingest module not found")
     
+    @requires(ingest, "ingest_document")
     @patch('planproof.pipeline.ingest.Database')
     def test_ingest_document(self, mock_db):
         """Test document ingestion."""
-        try:
-            from planproof.pipeline.ingest import ingest_document
-            
-            mock_db_instance = Mock()
-            mock_db.return_value = mock_db_instance
-            
-            result = ingest_document(
-                file_path="test.pdf",
-                submission_id=1,
-                db=mock_db_instance
-            )
-            
-            assert result is not None or True
-        except (ImportError, AttributeError):
-            pytest.skip("ingest_document not implemented")
+        mock_db_instance = Mock()
+        mock_db.return_value = mock_db_instance
+        
+        result = ingest.ingest_document(
+            file_path="test.pdf",
+            submission_id=1,
+            db=mock_db_instance
+        )
+        
+        assert result is not None or True
 
 
 # ============================================================================
@@ -311,31 +288,26 @@ class TestModificationWorkflow:
     
     def test_modification_workflow_exists(self):
         """Test that modification workflow module exists."""
-        try:
-            import planproof.pipeline.modification_workflow
-            assert planproof.pipeline.modification_workflow is not None
-        except ImportError:
+        if modification_workflow is None:
             pytest.fail("modification_workflow module not found")
     
+    @requires(modification_workflow, "process_modification")
     @patch('planproof.pipeline.modification_workflow.Database')
     def test_process_modification(self, mock_db):
         """Test processing modification."""
-        try:
-            from planproof.pipeline.modification_workflow import process_modification
-            
-            mock_db_instance = Mock()
-            mock_db.return_value = mock_db_instance
-            
-            modification_data = {
-                "submission_id": 1,
-                "changes": [{"field": "site_address", "new_value": "Updated address"}]
-            }
-            
-            result = process_modification(modification_data, db=mock_db_instance)
-            
-            assert result is not None or True
-        except (ImportError, AttributeError):
-            pytest.skip("process_modification not implemented")
+        mock_db_instance = Mock()
+        mock_db.return_value = mock_db_instance
+        
+        modification_data = {
+            "submission_id": 1,
+            "changes": [{"field": "site_address", "new_value": "Updated address"}]
+        }
+        
+        result = modification_workflow.process_modification(
+            modification_data, db=mock_db_instance
+        )
+        
+        assert result is not None or True
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ Tests cover:
 
 import pytest
 import json
+import shutil
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, mock_open
 from datetime import datetime
@@ -44,12 +45,18 @@ def temp_run_dir(tmp_path):
     return run_dir, inputs_dir, outputs_dir
 
 
+@pytest.fixture
+def resolution_service(tmp_path, monkeypatch):
+    """Fresh ResolutionService for run 1 under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    return ResolutionService(run_id=1)
+
+
 @pytest.fixture
 def mock_uploaded_file():
-    """Mock Streamlit UploadedFile."""
-    mock_file = Mock()
+    """Mock Streamlit UploadedFile (a named, file-like BytesIO)."""
+    mock_file = BytesIO(b"fake pdf content")
     mock_file.name = "test_document.pdf"
-    mock_file.getbuffer.return_value = b"fake pdf content"
     return mock_file
 
 
@@ -89,7 +96,17 @@ class TestResolutionService:
         assert service.run_dir.exists()
         assert service.inputs_dir.exists()
         assert service.outputs_dir.exists()
-    
+        assert service.content_dir.exists()
+
+    def test_init_recreates_removed_run_directory(self, resolution_service, mock_uploaded_file):
+        """Test a run directory deleted after first use is created again."""
+        shutil.rmtree(resolution_service.run_dir)
+
+        service = ResolutionService(run_id=1)
+        result = service.process_document_upload(mock_uploaded_file, "site_plan", "DOC-001")
+
+        assert result["success"] is True
+
     def test_load_resolutions_empty_file(self, tmp_path, monkeypatch):
         """Test loading resolutions when file doesn't exist."""
         monkeypatch.chdir(tmp_path)
@@ -120,11 +137,69 @@ class TestResolutionService:
         assert len(service.resolutions["actions"]) == 1
         assert "DOC-001" in service.resolutions["issues"]
     
-    def test_process_document_upload_saves_file(self, tmp_path, monkeypatch, mock_uploaded_file):
-        """Test document upload saves file correctly."""
-        monkeypatch.chdir(tmp_path)
+    def test_actions_replayed_from_log(self, resolution_service):
+        """Test actions appended to the NDJSON log are reloaded by a new service."""
+        service = resolution_service
+        service.process_explanation(issue_id="C_001", explanation_text="First")
+        service.dismiss_issue(issue_id="CON-001", officer_id="OFC-123", reason="N/A")
         
-        service = ResolutionService(run_id=1)
+        log_lines = service.actions_file.read_text(encoding="utf-8").splitlines()
+        assert len(log_lines) == 2
+        
+        reloaded = ResolutionService(run_id=1)
+        assert [a["action_type"] for a in reloaded.get_all_actions()] == [
+            "explanation_provided",
+            "dismissed",
+        ]
+        assert reloaded.resolutions["issues"]["CON-001"]["status"] == "dismissed"
+
+    def test_issue_snapshot_holds_state_not_history(self, resolution_service):
+        """Test issues.json keeps per-issue counts while actions come from the log."""
+        service = resolution_service
+        service.process_explanation(issue_id="C_001", explanation_text="First")
+        service.process_explanation(issue_id="C_001", explanation_text="Second")
+
+        snapshot = json.loads(service.issues_file.read_text(encoding="utf-8"))
+        assert snapshot["C_001"]["action_count"] == 2
+        assert "actions_taken" not in snapshot["C_001"]
+
+        status = ResolutionService(run_id=1).get_issue_status("C_001")
+        assert [a["explanation"] for a in status["actions_taken"]] == ["First", "Second"]
+        assert status["actions_taken"] == [
+            action for action in service.get_all_actions() if action["issue_id"] == "C_001"
+        ]
+
+    def test_recheck_reads_action_counts_not_history(self, resolution_service, monkeypatch):
+        """Test rechecking decides from the issue snapshot without rebuilding action lists."""
+        from planproof.services.resolution_service import AutoRecheckEngine
+
+        service = resolution_service
+        service.process_explanation(issue_id="C_001", explanation_text="Done")
+        service.resolutions["issues"]["C_001"]["recheck_pending"] = True
+        service.resolutions["issues"]["C_002"] = {"status": "open", "action_count": 0, "recheck_pending": True}
+        service._save_resolutions()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("recheck should not rebuild actions_taken")
+
+        monkeypatch.setattr(ResolutionService, "get_issue_status", fail)
+        result = AutoRecheckEngine(run_id=1).trigger_recheck()
+
+        statuses = {r["issue_id"]: r["status"] for r in result["results"]}
+        assert statuses == {"C_001": "resolved", "C_002": "pending"}
+
+    def test_legacy_snapshot_gets_action_counts_from_log(self, resolution_service):
+        """Test issues saved without action_count are counted from the action log on load."""
+        service = resolution_service
+        service.process_explanation(issue_id="C_001", explanation_text="First")
+        service.process_explanation(issue_id="C_001", explanation_text="Second")
+        service.issues_file.write_text(json.dumps({"C_001": {"status": "awaiting_verification"}}))
+
+        assert ResolutionService(run_id=1).get_issue_snapshot("C_001")["action_count"] == 2
+
+    def test_process_document_upload_saves_file(self, resolution_service, mock_uploaded_file):
+        """Test document upload saves file correctly."""
+        service = resolution_service
         result = service.process_document_upload(
             uploaded_file=mock_uploaded_file,
             document_type="site_plan",
@@ -137,12 +212,11 @@ class TestResolutionService:
         # Check file was saved
         saved_files = list(service.inputs_dir.glob("*.pdf"))
         assert len(saved_files) == 1
+        assert saved_files[0].read_bytes() == b"fake pdf content"
     
-    def test_process_document_upload_records_action(self, tmp_path, monkeypatch, mock_uploaded_file):
+    def test_process_document_upload_records_action(self, resolution_service, mock_uploaded_file):
         """Test document upload records action."""
-        monkeypatch.chdir(tmp_path)
-        
-        service = ResolutionService(run_id=1)
+        service = resolution_service
         service.process_document_upload(
             uploaded_file=mock_uploaded_file,
             document_type="site_plan",
@@ -150,16 +224,14 @@ class TestResolutionService:
         )
         
         assert len(service.resolutions["actions"]) == 1
-        action = service.resolutions["actions"][0]
+        action = service.get_all_actions()[0]
         assert action["action_type"] == "document_upload"
         assert action["issue_id"] == "DOC-001"
         assert action["document_type"] == "site_plan"
     
-    def test_process_bulk_document_upload(self, tmp_path, monkeypatch, mock_uploaded_file):
+    def test_process_bulk_document_upload(self, resolution_service, mock_uploaded_file):
         """Test bulk document upload."""
-        monkeypatch.chdir(tmp_path)
-        
-        service = ResolutionService(run_id=1)
+        service = resolution_service
         
         uploads = [
             (mock_uploaded_file, "site_plan"),
@@ -172,12 +244,58 @@ class TestResolutionService:
         assert result["success"] == True
         assert result["successful"] >= 0
         assert isinstance(service.resolutions["actions"], list)
+        # Files are written concurrently but actions keep upload order
+        assert [a["document_type"] for a in service.get_all_actions()] == [
+            "site_plan",
+            "floor_plan",
+        ]
     
-    def test_process_option_selection(self, tmp_path, monkeypatch):
-        """Test option selection processing."""
-        monkeypatch.chdir(tmp_path)
+    def test_identical_uploads_share_stored_content(self, resolution_service):
+        """Test uploads with identical bytes are stored once and hard-linked."""
+        service = resolution_service
+        first = BytesIO(b"same pdf bytes")
+        first.name = "site_plan.pdf"
+        second = BytesIO(b"same pdf bytes")
+        second.name = "site_plan_copy.pdf"
         
-        service = ResolutionService(run_id=1)
+        result = service.process_bulk_document_upload(
+            [(first, "site_plan"), (second, "site_plan")], ["DOC-001"]
+        )
+        
+        assert result["successful"] == 2
+        saved_files = sorted(service.inputs_dir.glob("*.pdf"))
+        stored = list(service.content_dir.iterdir())
+        assert len(saved_files) == 2
+        assert len(stored) == 1
+        assert all(path.read_bytes() == b"same pdf bytes" for path in saved_files)
+    
+    def test_bulk_upload_flushes_snapshot_once(
+        self, resolution_service, mock_uploaded_file, monkeypatch
+    ):
+        """Test bulk upload defers the issue snapshot to a single flush."""
+        service = resolution_service
+        flushes = []
+        original_flush = service.flush
+        
+        def counting_flush():
+            flushes.append(service._dirty)
+            original_flush()
+        
+        monkeypatch.setattr(service, "flush", counting_flush)
+        
+        uploads = [
+            (mock_uploaded_file, "site_plan"),
+            (mock_uploaded_file, "floor_plan")
+        ]
+        service.process_bulk_document_upload(uploads, ["DOC-001", "DOC-002"])
+        
+        assert flushes == [True]
+        assert service._dirty is False
+        assert "DOC-001" in json.loads(service.issues_file.read_text(encoding="utf-8"))
+    
+    def test_process_option_selection(self, resolution_service):
+        """Test option selection processing."""
+        service = resolution_service
         result = service.process_option_selection(
             issue_id="BNG-001",
             selected_option="not_applicable",
@@ -186,13 +304,11 @@ class TestResolutionService:
         
         assert result["success"] == True
         assert len(service.resolutions["actions"]) == 1
-        assert service.resolutions["actions"][0]["action_type"] == "option_selection"
+        assert service.get_all_actions()[0]["action_type"] == "option_selection"
     
-    def test_process_explanation(self, tmp_path, monkeypatch):
+    def test_process_explanation(self, resolution_service):
         """Test explanation processing."""
-        monkeypatch.chdir(tmp_path)
-        
-        service = ResolutionService(run_id=1)
+        service = resolution_service
         result = service.process_explanation(
             issue_id="C_001",
             explanation_text="This is a clarification of the discrepancy."
@@ -200,13 +316,25 @@ class TestResolutionService:
         
         assert result["success"] == True
         assert len(service.resolutions["actions"]) == 1
-        assert service.resolutions["actions"][0]["action_type"] == "explanation_provided"
+        assert service.get_all_actions()[0]["action_type"] == "explanation_provided"
     
-    def test_get_issues_pending_recheck(self, tmp_path, monkeypatch):
-        """Test getting issues pending recheck."""
-        monkeypatch.chdir(tmp_path)
+    def test_get_all_actions_renders_timestamps(self, resolution_service):
+        """Test actions store ts_ns and render an ISO timestamp on read."""
+        service = resolution_service
+        service.process_explanation(issue_id="C_001", explanation_text="Clarified")
         
-        service = ResolutionService(run_id=1)
+        stored = service.resolutions["actions"][0]
+        assert isinstance(stored.ts_ns, int)
+        assert stored.timestamp is None
+        
+        rendered = service.get_all_actions()[0]
+        assert datetime.fromisoformat(rendered["timestamp"]).timestamp() == pytest.approx(
+            stored.ts_ns / 1e9
+        )
+    
+    def test_get_issues_pending_recheck(self, resolution_service):
+        """Test getting issues pending recheck."""
+        service = resolution_service
         service.resolutions = {
             "actions": [
                 {"action_type": "document_upload", "issue_id": "DOC-001"}
@@ -222,11 +350,9 @@ class TestResolutionService:
         assert "DOC-001" in pending
         assert "DOC-002" not in pending
     
-    def test_mark_issue_rechecked(self, tmp_path, monkeypatch):
+    def test_mark_issue_rechecked(self, resolution_service):
         """Test marking issue as rechecked."""
-        monkeypatch.chdir(tmp_path)
-        
-        service = ResolutionService(run_id=1)
+        service = resolution_service
         service.resolutions["issues"] = {
             "DOC-001": {"status": "in_progress", "recheck_pending": True}
         }
@@ -240,11 +366,9 @@ class TestResolutionService:
         assert service.resolutions["issues"]["DOC-001"]["status"] == "resolved"
         assert service.resolutions["issues"]["DOC-001"]["recheck_pending"] is False
     
-    def test_dismiss_issue(self, tmp_path, monkeypatch):
+    def test_dismiss_issue(self, resolution_service):
         """Test officer dismissal of issue."""
-        monkeypatch.chdir(tmp_path)
-        
-        service = ResolutionService(run_id=1)
+        service = resolution_service
         result = service.dismiss_issue(
             issue_id="CON-001",
             officer_id="OFC-123",
@@ -253,7 +377,7 @@ class TestResolutionService:
         
         assert result["success"] == True
         assert len(service.resolutions["actions"]) == 1
-        assert service.resolutions["actions"][0]["action_type"] == "dismissed"
+        assert service.get_all_actions()[0]["action_type"] == "dismissed"
 
 
 # ============================================================================